@@ -0,0 +1,102 @@
+"""Memori per worker di deployment multi-proses: N proses `streamlit run server.py`
+(masing-masing port sendiri, seperti di balik load balancer) tanpa vs dengan
+DATA_BERSAMA. Setelah /readyz 200 (warm-up selesai) tiap worker melayani satu sesi
+websocket, lalu dibaca /proc/<pid>/smaps_rollup:
+
+    RSS  halaman yang dipetakan proses (halaman bersama ikut dihitung penuh di tiap proses)
+    PSS  halaman bersama dibagi rata ke proses yang memetakannya
+    USS  halaman privat (Private_Clean + Private_Dirty) — yang benar-benar hilang bila worker mati
+
+Di bawahnya rincian tabel referensi di satu proses (bare mode): byte array privat
+vs byte yang di-mmap dari tabel bersama.
+
+    python bench/bench_bersama.py [worker] [--port N]
+"""
+import json, os, shutil, statistics, subprocess, sys, tempfile, time, urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_warmup import _sesi_ws  # noqa: E402
+
+_TABEL = r"""
+import json, mmap, os, runpy, sys
+os.environ["STREAMLIT_LOGGER_LEVEL"] = "error"
+g = runpy.run_path("app.py", run_name="__main__")
+def dipetakan(v):
+    while v is not None and not isinstance(v, mmap.mmap):
+        v = v.obj if isinstance(v, memoryview) else getattr(v, "base", None)
+    return v is not None
+kat, tabel = g["_KATALOG"], g["refresher_data"]().snapshot[0]
+hasil = {}
+for nama, kolom in (("katalog", {k: getattr(kat, k) for k in kat.KOLOM}), ("tabel xlsx", tabel)):
+    hasil[nama] = [sum(v.nbytes for v in kolom.values() if not dipetakan(v)),
+                   sum(v.nbytes for v in kolom.values() if dipetakan(v))]
+print(json.dumps(hasil))
+"""
+
+
+def memori(pid):
+    m = {}
+    with open(f"/proc/{pid}/smaps_rollup") as fp:
+        for baris in fp:
+            k, _, v = baris.partition(":")
+            if v.strip().endswith("kB"): m[k] = int(v.split()[0]) / 1024
+    return {"RSS": m["Rss"], "PSS": m["Pss"], "USS": m["Private_Clean"] + m["Private_Dirty"],
+            "shmem": m.get("Pss_Shmem", 0.0)}
+
+
+def jalankan(n, port, bersama):
+    env = {**os.environ, "STREAMLIT_LOGGER_LEVEL": "error"}
+    if bersama: env["DATA_BERSAMA"] = bersama
+    proc = [subprocess.Popen([sys.executable, "-m", "streamlit", "run", "server.py", "--server.headless", "true",
+                              "--server.port", str(port + i)], env=env,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) for i in range(n)]
+    try:
+        for i in range(n):
+            t = time.perf_counter()
+            while True:
+                try:
+                    if urllib.request.urlopen(f"http://localhost:{port + i}/readyz", timeout=1).status == 200: break
+                except Exception:
+                    time.sleep(0.2)
+                if time.perf_counter() - t > 180: raise RuntimeError(f"worker :{port + i} tidak siap")
+            _sesi_ws(port + i)
+        time.sleep(1)
+        return [memori(p.pid) for p in proc]
+    finally:
+        for p in proc: p.terminate()
+        for p in proc: p.wait()
+
+
+def tabel(bersama):
+    env = {**os.environ, **({"DATA_BERSAMA": bersama} if bersama else {})}
+    out = subprocess.run([sys.executable, "-c", _TABEL], capture_output=True, text=True, check=True, env=env).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv):
+    n = int(argv[0]) if argv and argv[0].isdigit() else 3
+    port = int(argv[argv.index("--port") + 1]) if "--port" in argv else 8771
+    akar = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    bersama = tempfile.mkdtemp(prefix="skoria_", dir=akar)
+    try:
+        print(f"{n} worker · DATA_BERSAMA={bersama}")
+        print(f"{'mode':<16}{'RSS/worker':>12}{'PSS/worker':>12}{'USS/worker':>12}{'Σ PSS':>10}{'shmem':>9}   (MiB, median)")
+        for mode, d in (("per proses", None), ("tabel bersama", bersama)):
+            m = jalankan(n, port, d)
+            med = {k: statistics.median(x[k] for x in m) for k in m[0]}
+            print(f"{mode:<16}{med['RSS']:>12.1f}{med['PSS']:>12.1f}{med['USS']:>12.1f}"
+                  f"{sum(x['PSS'] for x in m):>10.1f}{med['shmem']:>9.2f}")
+        print(f"\ntabel referensi per proses (KiB){'privat':>12}{'mmap bersama':>15}")
+        for mode, d in (("per proses", None), ("tabel bersama", bersama)):
+            for nama, (privat, dibagi) in tabel(d).items():
+                print(f"  {mode + ' · ' + nama:<30}{privat / 1024:>12.1f}{dibagi / 1024:>15.1f}")
+        print(f"file di {bersama}: " + ", ".join(f"{f} {os.path.getsize(os.path.join(bersama, f)) / 1024:.0f} KiB"
+                                               for f in sorted(os.listdir(bersama)) if f.endswith(".tbl")))
+    finally:
+        shutil.rmtree(bersama, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,60 @@
+"""Micro-batching lintas sesi: N thread (≈ sesi Streamlit) masing-masing memanggil
+prediksi 1 baris berulang kali, langsung ke prediktor live vs lewat BrokerInferensi.
+Dicatat throughput, latensi p50/p99 per panggilan dan statistik batch broker.
+
+    python bench/bench_broker.py [panggilan_per_thread] [--window MS] [--batch N]
+"""
+import os, statistics, sys, threading, time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(sys.path[0])
+import model_strategi as ms  # noqa: E402
+
+
+def beban(pred, n_thread, m):
+    rng = np.random.default_rng(0)
+    X = rng.integers(1, 6, size=(n_thread, m, 9)).astype(float)
+    lat = [[] for _ in range(n_thread)]
+    mulai = threading.Barrier(n_thread + 1)
+
+    def sesi(i):
+        mulai.wait()
+        for x in X[i]:
+            t = time.perf_counter(); pred.predict(x[None]); lat[i].append(time.perf_counter() - t)
+
+    th = [threading.Thread(target=sesi, args=(i,)) for i in range(n_thread)]
+    for t in th: t.start()
+    mulai.wait(); t0 = time.perf_counter()
+    for t in th: t.join()
+    dt = time.perf_counter() - t0
+    semua = sorted(v for l in lat for v in l)
+    return n_thread * m / dt, statistics.median(semua) * 1e3, semua[int(len(semua) * .99) - 1] * 1e3
+
+
+def main(argv):
+    m = int(argv[0]) if argv and argv[0].isdigit() else 200
+    opsi = dict(zip(argv[1::2], argv[2::2])) if argv and argv[0].isdigit() else dict(zip(argv[::2], argv[1::2]))
+    jendela, maks = float(opsi.get("--window", ms.BATCH_JENDELA_MS)), int(opsi.get("--batch", ms.BATCH_MAKS))
+    path = next(f for f in ms.MODEL_FILES if os.path.exists(f))
+    backend = [("pohon NumPy", ms.muat_pohon(path))]
+    try:
+        backend.append(("lightgbm", ms._muat_model(path)))
+    except ImportError:
+        pass
+    print(f"{m} panggilan/thread · broker jendela {jendela:g} ms, maks {maks} baris")
+    print(f"{'model':<13}{'thread':>7}{'jalur':>9}{'req/s':>10}{'p50':>10}{'p99':>10}   batch")
+    for nama, model in backend:
+        if model is None: continue
+        live = ms.StrategyPredictor(model)
+        for n in (1, 8, 32):
+            broker = ms.BrokerInferensi(live, jendela, maks)
+            for jalur, pred in (("langsung", live), ("broker", broker)):
+                rps, p50, p99 = beban(pred, n, m)
+                st = broker.stats() if pred is broker else None
+                info = f"   rata {st['baris_per_batch']:.1f}, maks {st['batch_maks']}, antrian maks {st['antrian_maks']}" if st else ""
+                print(f"{nama:<13}{n:>7}{jalur:>9}{rps:>10.0f}{p50:>7.2f} ms{p99:>7.2f} ms{info}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,54 @@
+"""Biaya per chart: bangun figure + serialisasi (jalur lama) vs cache hit
+tampil_fig (spec JSON → Figure tanpa validasi → serialisasi st.plotly_chart),
+plus waktu & ukuran precompute spec ch_bobot untuk semua prodi katalog.
+
+    python bench/bench_figures.py [ulangan]
+"""
+import os, sys, time
+
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(sys.path[0])
+import app  # noqa: E402
+import plotly.io as pio  # noqa: E402
+import plotly.tools as ptools  # noqa: E402
+import streamlit as st  # noqa: E402
+
+
+def serialisasi(fig):
+    # Yang dilakukan st.plotly_chart terhadap figure sebelum dikirim
+    return pio.to_json(ptools.return_figure_from_figure_or_data(fig, validate_figure=True), validate=False)
+
+
+def per_call(fn, n):
+    t = time.perf_counter()
+    for _ in range(n): fn()
+    return (time.perf_counter() - t) / n * 1e3
+
+
+def main(n):
+    skor = {k: 600 + i * 20 for i, k in enumerate(app.SUBTES)}
+    bobot = app.get_bobot("Farmasi"); info = {"mn": 650, "mx": 720}
+    r = {"sw": 640.5, "mn": 650, "mx": 720, "gap": -9.5}
+    charts = [
+        ("radar",  lambda: app.fig_radar(skor, bobot, "Farmasi"),        lambda: app.ch_radar(skor, bobot, "Farmasi", key="k")),
+        ("bar",    lambda: app.fig_bar_subtes(skor, bobot, info),        lambda: app.ch_bar_subtes(skor, bobot, info, key="k")),
+        ("pipe",   lambda: app.fig_pipeline(skor, bobot, info, "Farmasi"), lambda: app.ch_pipeline(skor, bobot, info, "Farmasi", key="k")),
+        ("gauge",  lambda: app.fig_skor_gauge(640.5, 650, 720),          lambda: app.ch_skor_gauge(640.5, 650, 720, key="k")),
+        ("psiko",  lambda: app.fig_psiko(55.0, 70.2, 61.0),              lambda: app.ch_psiko(55.0, 70.2, 61.0, key="k")),
+        ("prog",   lambda: app.fig_progress(r),                          lambda: app.ch_progress(r, key="k")),
+        ("bobot",  lambda: app.fig_bobot("Farmasi"),                     lambda: app.ch_bobot("Farmasi", key="k")),
+    ]
+    t = time.perf_counter(); tabel, _ = app.spec_bobot_semua(); t_pre = time.perf_counter() - t
+    st.plotly_chart = lambda fig, **kw: serialisasi(fig)   # tanpa runtime: cukup ukur serialisasinya
+    print(f"{'chart':<8}{'bangun+serialisasi':>20}{'cache hit':>12}")
+    for nama, bangun, tampil in charts:
+        tampil()  # isi cache
+        print(f"{nama:<8}{per_call(lambda: serialisasi(bangun()), n):>17.2f} ms{per_call(tampil, n):>9.2f} ms")
+    print(f"precompute spec ch_bobot: {len(tabel)} prodi, {t_pre:.2f} s, "
+          f"{sum(map(len, tabel.values())) / 1024:.0f} KB JSON")
+    print("stats figure cache:", app.figure_cache().stats())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
@@ -0,0 +1,114 @@
+"""Cold start app.py: profil `-X importtime` (modul yang di-import app di luar
+streamlit sendiri, diurutkan per waktu kumulatif) dan time-to-first-render halaman
+home & step 1 — tiap sampel proses Python baru, diukur run AppTest pertama (import
+app + cache_resource + render), median dari beberapa sampel. Terakhir, mesin skor
+tanpa UI: `import mesin_skor` dan compute() pertama di proses baru (job batch / API).
+
+    python bench/bench_import.py [sampel] [--top N] [--ref REV ...] [--budget MS]
+
+--budget MS: exit 1 bila median time-to-first-render home melebihi MS, bila
+pandas/plotly.graph_objects ikut ter-import di home/step 1, atau bila `import
+mesin_skor` ikut meng-import streamlit (cek regresi cold start).
+"""
+import json, os, re, statistics, subprocess, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+BERAT = ["pandas", "pyarrow", "plotly.graph_objs._figure", "lightgbm", "sklearn"]
+
+_RENDER = r"""
+import json, os, sys, time
+os.environ["STREAMLIT_LOGGER_LEVEL"] = "error"
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+if sys.argv[2] == "step1": at.session_state["page"] = "survey"; at.session_state["step"] = 1
+awal = set(sys.modules)
+t = time.perf_counter(); at.run(); dt = time.perf_counter() - t
+assert not at.exception, at.exception
+print(json.dumps({"ms": dt * 1e3, "berat": [m for m in %r if m in sys.modules and m not in awal]}))
+""" % (BERAT,)
+
+_MESIN = r"""
+import json, sys, time
+t = time.perf_counter(); import mesin_skor; t_imp = time.perf_counter() - t
+d = {**dict.fromkeys(mesin_skor.SUBTES, 550), "fokus": 3, "pede": 3, "cemas": 3, "distrak": 3, "jam": 3, "hari": 3,
+     "latihan": 3, "tryout": 2, "review": 3, "kampus": "Universitas Indonesia", "prodi": "Pendidikan Dokter"}
+t = time.perf_counter(); mesin_skor.compute(d); t_c = time.perf_counter() - t
+t = time.perf_counter(); mesin_skor.compute({**d, "PU": 551}); t_c2 = time.perf_counter() - t
+print(json.dumps({"import": t_imp * 1e3, "compute": t_c * 1e3, "compute2": t_c2 * 1e3,
+                  "berat": [m for m in %r + ["streamlit"] if m in sys.modules]}))
+""" % (BERAT,)
+
+
+def ttfr(path, halaman):
+    out = subprocess.run([sys.executable, "-c", _RENDER, path, halaman],
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def mesin():
+    out = subprocess.run([sys.executable, "-c", _MESIN], capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def profil_import(path, top):
+    """Baris `-X importtime` saat mengeksekusi app (bare mode) setelah streamlit di-import."""
+    kode = f"import streamlit, runpy; print('@@mulai', file=__import__('sys').stderr); runpy.run_path({path!r})"
+    err = subprocess.run([sys.executable, "-X", "importtime", "-c", kode],
+                         capture_output=True, text=True, env={**os.environ, "STREAMLIT_LOGGER_LEVEL": "error"}).stderr
+    err = err[err.index("@@mulai"):]
+    baris = []
+    for m in re.finditer(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)", err):
+        baris.append((int(m[2]) / 1e3, len(m[3]) // 2, m[4]))
+    puncak = [b for b in baris if b[1] == 0]
+    total = sum(b[0] for b in puncak)
+    print(f"import oleh app (di luar streamlit): {len(baris)} modul, {total:.0f} ms — {top} teratas (kumulatif):")
+    for ms, _, nama in sorted(puncak, key=lambda b: -b[0])[:top]:
+        anak = sorted((b for b in baris if b[1] == 1 and b[2].startswith(nama + ".")), key=lambda b: -b[0])[:2]
+        print(f"  {ms:>8.1f} ms  {nama:<28}{', '.join(f'{a[2]} {a[0]:.0f}' for a in anak)}")
+
+
+def main(argv):
+    n = int(argv[0]) if argv and argv[0].isdigit() else 3
+    top = int(argv[argv.index("--top") + 1]) if "--top" in argv else 15
+    budget = float(argv[argv.index("--budget") + 1]) if "--budget" in argv else None
+    refs = [argv[i + 1] for i, a in enumerate(argv) if a == "--ref" and i + 1 < len(argv)]
+    target = [("working tree", os.path.join(ROOT, "app.py"), None)]
+    for rev in refs:
+        tmp = os.path.join(ROOT, f"_bench_import_{rev.replace('~', '_').replace('/', '_')}.py")
+        src = subprocess.run(["git", "show", f"{rev}:app.py"], capture_output=True, check=True).stdout
+        with open(tmp, "wb") as fp: fp.write(src)
+        target.append((rev, tmp, tmp))
+    gagal = []
+    try:
+        profil_import(target[0][1], top)
+        print(f"\ntime-to-first-render, median {n} proses baru")
+        print(f"{'versi':<14}{'halaman':<9}{'median':>10}{'min':>10}   modul berat ter-import")
+        for versi, path, _ in target:
+            for hal in ("home", "step1"):
+                hasil = [ttfr(path, hal) for _ in range(n)]
+                med = statistics.median(h["ms"] for h in hasil)
+                berat = sorted({m for h in hasil for m in h["berat"]})
+                print(f"{versi:<14}{hal:<9}{med:>7.0f} ms{min(h['ms'] for h in hasil):>7.0f} ms   {', '.join(berat) or '-'}")
+                if path == target[0][1]:
+                    if berat: gagal.append(f"{hal}: meng-import {', '.join(berat)}")
+                    if budget is not None and hal == "home" and med > budget:
+                        gagal.append(f"home {med:.0f} ms > budget {budget:.0f} ms")
+        hasil = [mesin() for _ in range(n)]
+        med = {k: statistics.median(h[k] for h in hasil) for k in ("import", "compute", "compute2")}
+        berat = sorted({m for h in hasil for m in h["berat"]})
+        print(f"\nmesin_skor tanpa UI, median {n} proses baru: import {med['import']:.0f} ms · compute() pertama "
+              f"{med['compute']:.0f} ms (katalog + model) · berikutnya {med['compute2']:.2f} ms · "
+              f"modul berat: {', '.join(berat) or '-'}")
+        if "streamlit" in berat: gagal.append("mesin_skor meng-import streamlit")
+    finally:
+        for _, _, tmp in target:
+            if tmp and os.path.exists(tmp): os.remove(tmp)
+    if budget is not None:
+        print("\nbudget: " + ("; ".join(gagal) if gagal else f"OK (≤ {budget:.0f} ms, tanpa modul berat)"))
+        return 1 if gagal else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
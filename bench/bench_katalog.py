@@ -0,0 +1,75 @@
+"""Katalog struct-of-arrays vs dict bersarang lama (salinan per-prodi dari
+load_database): memori (tracemalloc), latensi per lookup get_skor_info /
+get_daftar_prodi, dan biaya salinan per rerun — load_database lama memakai
+st.cache_data, yang mengembalikan salinan hasil pickle di setiap rerun. Sekaligus memeriksa hasil keduanya identik.
+
+    python bench/bench_katalog.py [jumlah_lookup]
+"""
+import gc, os, pickle, random, sys, time, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(sys.path[0])
+import mesin_skor as mesin  # noqa: E402
+from data_ptn import PTN_PRODI_D3, PTN_PRODI_D4, PTN_PRODI_S1  # noqa: E402
+
+
+def bangun_lama():
+    return tuple({k: {p: dict(v) for p, v in vv.items()} for k, vv in db.items()}
+                 for db in (PTN_PRODI_S1, PTN_PRODI_D3, PTN_PRODI_D4))
+
+
+def skor_info_lama(dbs, ptn, prodi, jenjang):
+    db = dbs[mesin.kode_jenjang(jenjang)]
+    data = db.get(ptn, {}).get(prodi, None)
+    return {"mn": 600, "mx": 670} if data is None else data
+
+
+def prodi_lama(dbs, ptn, jenjang):
+    return sorted(dbs[mesin.kode_jenjang(jenjang)].get(ptn, {}).keys())
+
+
+def memori(fn):
+    gc.collect()
+    tracemalloc.start()
+    obj = fn()
+    gc.collect()  # kosongkan free-list tuple/int sementara agar tidak ikut terhitung
+    ukuran = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, ukuran
+
+
+def waktu(fn, args):
+    t = time.perf_counter()
+    for a in args: fn(*a)
+    return (time.perf_counter() - t) / len(args) * 1e9
+
+
+def main(n):
+    lama, m_lama = memori(bangun_lama)
+    mesin.build_bobot_resolver()  # resolver bobot (dipakai saat membangun katalog) tidak ikut diukur
+    kat, m_baru = memori(lambda: mesin.Katalog((PTN_PRODI_S1, PTN_PRODI_D3, PTN_PRODI_D4)))
+
+    kunci = [(k, p, mesin.JENJANG_KATALOG[j]) for j, db in enumerate(lama) for k, v in db.items() for p in v]
+    for k, p, j in kunci + [("Kampus X", "Prodi Y", "S1 (Sarjana)")]:
+        assert dict(mesin.get_skor_info(k, p, j)) == dict(skor_info_lama(lama, k, p, j)), (k, p, j)
+        assert mesin.get_daftar_prodi(k, j) == prodi_lama(lama, k, j), (k, j)
+    for j in mesin.JENJANG_KATALOG:
+        assert mesin.get_daftar_ptn(j) == sorted(lama[mesin.kode_jenjang(j)])
+
+    rnd = random.Random(0)
+    q = [rnd.choice(kunci) for _ in range(n)]
+    qk = [(k, j) for k, _, j in q]
+    print(f"{len(kunci)} baris, hasil identik")
+    print(f"{'':<24}{'dict lama':>12}{'katalog':>12}")
+    print(f"{'memori':<24}{m_lama/1024:>9.1f} KB{m_baru/1024:>9.1f} KB")
+    print(f"{'get_skor_info':<24}{waktu(lambda *a: skor_info_lama(lama, *a), q):>9.0f} ns"
+          f"{waktu(lambda *a: mesin.get_skor_info(*a), q):>9.0f} ns")
+    print(f"{'get_daftar_prodi':<24}{waktu(lambda *a: prodi_lama(lama, *a), qk):>9.0f} ns"
+          f"{waktu(lambda *a: mesin.get_daftar_prodi(*a), qk):>9.0f} ns")
+    blob = pickle.dumps(lama)
+    print(f"{'salinan per rerun':<24}{waktu(pickle.loads, [(blob,)] * 50) / 1e3:>9.0f} µs{0:>9.0f} µs"
+          "  (katalog: st.cache_resource, tanpa salinan)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,43 @@
+"""Load test inferensi live di 1/8/32/128 sesi bersamaan (thread, 1 baris per panggilan):
+latensi p50/p99 dan throughput untuk LightGBM dengan threading OpenMP bawaan,
+LightGBM dengan num_threads dipatok, dan broker dengan pool pekerja terbatas
+(STRATEGI_INFER_WORKERS × STRATEGI_INFER_THREADS).
+
+    python bench/bench_load.py [panggilan_per_sesi] [--sesi 1,8,32,128]
+"""
+import os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "bench"))
+os.chdir(ROOT)
+import model_strategi as ms  # noqa: E402
+from bench_broker import beban  # noqa: E402
+
+
+def main(argv):
+    m = int(argv[0]) if argv and argv[0].isdigit() else 100
+    sesi = [int(x) for x in argv[argv.index("--sesi") + 1].split(",")] if "--sesi" in argv else [1, 8, 32, 128]
+    path = next(f for f in ms.MODEL_FILES if os.path.exists(f))
+    konfig = []
+    try:
+        model = ms._muat_model(path)
+        konfig += [("lightgbm, OpenMP bawaan", lambda: ms.StrategyPredictor(model)),
+                   (f"lightgbm, num_threads={ms.INFER_THREADS}", lambda: ms.StrategyPredictor(model, num_threads=ms.INFER_THREADS)),
+                   ("lightgbm via broker", lambda: ms.BrokerInferensi(ms.StrategyPredictor(model, num_threads=ms.INFER_THREADS)))]
+    except ImportError:
+        print("lightgbm tidak terpasang — hanya mengukur pohon NumPy")
+    pohon = ms.muat_pohon(path)
+    if pohon is not None:
+        konfig.append(("pohon NumPy via broker", lambda: ms.BrokerInferensi(ms.StrategyPredictor(pohon))))
+    print(f"{os.cpu_count()} core · {m} panggilan/sesi · broker: {ms.INFER_PEKERJA} pekerja, "
+          f"jendela {ms.BATCH_JENDELA_MS:g} ms, maks {ms.BATCH_MAKS} baris")
+    print(f"{'konfigurasi':<26}{'sesi':>6}{'req/s':>10}{'p50':>11}{'p99':>11}")
+    for nama, buat in konfig:
+        for n in sesi:
+            rps, p50, p99 = beban(buat(), n, m)
+            print(f"{nama:<26}{n:>6}{rps:>10.0f}{p50:>8.2f} ms{p99:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,81 @@
+"""Microbenchmark predict_lgbm: jalur lama (DataFrame 1 baris + reindex + predict
++ predict_proba) vs StrategyPredictor (NumPy langsung, satu pass booster) vs
+StrategyLUT (tabel lookup 5^9 hasil `python model_strategi.py build`) vs
+ModelPohon (pohon hasil ekspor dump_model, dievaluasi NumPy tanpa lightgbm).
+
+    python bench/bench_predict.py [jumlah_input]
+"""
+import itertools, os, pickle, sys, time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(sys.path[0])
+import mesin_skor as mesin  # noqa: E402
+import model_strategi  # noqa: E402
+
+
+def predict_lama(model, inp):
+    feat = pd.DataFrame([{
+        "Jam_Belajar":inp["jam"],"Hari_Belajar":inp["hari"],
+        "Latihan_Soal":inp["latihan"],"Frekuensi_Tryout":inp["tryout"],
+        "Review_Soal":inp["review"],"Fokus":inp["fokus"],
+        "Percaya_Diri":inp["pede"],
+        "Kecemasan_Rev":6-inp["cemas"],"Distraksi_Rev":6-inp["distrak"],
+    }])
+    if hasattr(model,"feature_name_"):     feat = feat.reindex(columns=model.feature_name_,fill_value=0)
+    elif hasattr(model,"feature_names_in_"):feat = feat.reindex(columns=model.feature_names_in_,fill_value=0)
+    kode = int(model.predict(feat)[0])
+    kpct = None
+    if hasattr(model,"predict_proba"): kpct = float(model.predict_proba(feat)[0][kode])*100
+    return kode, kpct
+
+
+def main(n):
+    model = pickle.load(open("lgbm_model_2_.pkl", "rb"))
+    pred  = model_strategi.StrategyPredictor(model)
+    rng   = np.random.default_rng(0)
+    keys  = ["jam","hari","latihan","tryout","review","fokus","pede","cemas","distrak"]
+    inps  = [dict(zip(keys, map(int, row))) for row in rng.integers(1, 6, size=(n, 9))]
+
+    t = time.perf_counter(); lama = [predict_lama(model, d) for d in inps]; t_lama = time.perf_counter() - t
+    t = time.perf_counter(); baru = [mesin.predict_lgbm(pred, d) for d in inps]; t_baru = time.perf_counter() - t
+    assert [k for k, _ in lama] == [r["kode"] for r in baru]
+    X = np.array([mesin.fitur_lgbm(d) for d in inps])
+    t = time.perf_counter(); kode, _ = pred.predict(X); t_batch = time.perf_counter() - t
+    assert kode.tolist() == [k for k, _ in lama]
+    lut = model_strategi.muat_lut("lgbm_model_2_.pkl")
+    if lut is not None:
+        t = time.perf_counter(); r_lut = [mesin.predict_lgbm(lut, d) for d in inps]; t_lut = time.perf_counter() - t
+        assert [r["kode"] for r in r_lut] == [k for k, _ in lama]
+        t = time.perf_counter(); kode_lut, _ = lut.predict(X); t_lut_b = time.perf_counter() - t
+        assert np.array_equal(kode_lut, kode)
+    pohon = model_strategi.muat_pohon("lgbm_model_2_.pkl")
+    if pohon is not None:
+        p_np = model_strategi.StrategyPredictor(pohon)
+        t = time.perf_counter(); r_np = [mesin.predict_lgbm(p_np, d) for d in inps]; t_np = time.perf_counter() - t
+        assert [r["kode"] for r in r_np] == [k for k, _ in lama]
+        t = time.perf_counter(); kode_np, _ = p_np.predict(X); t_np_b = time.perf_counter() - t
+        assert np.array_equal(kode_np, kode)
+
+    print(f"{n} input, model {type(model).__name__}")
+    print(f"  lama  (DataFrame per baris) : {t_lama / n * 1e6:8.1f} us/input")
+    print(f"  baru  (predict_lgbm, 1 baris): {t_baru / n * 1e6:8.1f} us/input  ({t_lama / t_baru:.1f}x)")
+    print(f"  batch (semua baris sekaligus) : {t_batch / n * 1e6:8.2f} us/input  ({t_lama / t_batch:.0f}x)")
+    if lut is not None:
+        print(f"  LUT   (predict_lgbm, 1 baris): {t_lut / n * 1e6:8.1f} us/input  ({t_lama / t_lut:.0f}x)")
+        print(f"  LUT   (batch)                 : {t_lut_b / n * 1e6:8.3f} us/input  ({t_lama / t_lut_b:.0f}x)")
+    else:
+        print("  LUT belum dibangun — jalankan `python model_strategi.py build`")
+    if pohon is not None:
+        print(f"  pohon NumPy (1 baris)         : {t_np / n * 1e6:8.1f} us/input  ({t_lama / t_np:.1f}x)")
+        print(f"  pohon NumPy (batch)           : {t_np_b / n * 1e6:8.2f} us/input  ({t_lama / t_np_b:.0f}x)")
+
+    grid = np.array(list(itertools.product(range(1, 6), repeat=9)), dtype=float)
+    full = pd.DataFrame(pred.matriks(grid), columns=pred.kolom)
+    assert np.array_equal(model.predict(full).astype(int), pred.predict(grid)[0])
+    print(f"  grid penuh 5^9 = {len(grid)} input: kode identik dengan model.predict")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,135 @@
+"""Stale-while-revalidate RefresherData melawan server HTTP lokal pengganti GitHub
+raw: workbook hanya tersedia lewat URL (tanpa file lokal), server bisa dibuat lambat,
+error 500, atau menyajikan workbook yang berubah. Selama skenario berjalan, beberapa
+thread "request" terus membaca snapshot; dicatat latensi baca maksimum, apakah
+snapshot terganti, dan error yang tercatat. Pembanding: biaya rebuild yang dulu
+ditanggung satu request saat ttl load_database habis.
+
+    python bench/bench_refresh.py [--delay DETIK]
+"""
+import http.server, io, os, shutil, sys, tempfile, threading, time
+
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(sys.path[0])
+import app  # noqa: E402
+
+
+class Server(http.server.ThreadingHTTPServer):
+    """Menyajikan `isi[nama]`; `delay` detik sebelum menjawab, `status` != 200 = error."""
+    isi, delay, status = {}, 0.0, 200
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def url(self, nama): return f"http://127.0.0.1:{self.server_address[1]}/{nama}"
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(self.server.delay)
+        data = self.server.isi.get(self.path.lstrip("/"))
+        if self.server.status != 200 or data is None:
+            self.send_error(self.server.status if self.server.status != 200 else 404); return
+        self.send_response(200); self.send_header("Content-Length", str(len(data))); self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *a): pass
+
+
+def workbook_berubah(data, buang=25):
+    """Workbook yang sama minus `buang` baris terakhir (simulasi data baru di GitHub)."""
+    import openpyxl
+    wb = openpyxl.load_workbook(io.BytesIO(data))
+    ws = wb.worksheets[0]
+    ws.delete_rows(ws.max_row - buang + 1, buang)
+    out = io.BytesIO(); wb.save(out)
+    return out.getvalue()
+
+
+class Pembaca:
+    """Thread yang terus membaca snapshot seperti rerun pengguna; catat latensi maks."""
+    def __init__(self, ref, n=4):
+        self.ref, self.maks, self.jalan = ref, 0.0, True
+        self.th = [threading.Thread(target=self._loop, daemon=True) for _ in range(n)]
+        for t in self.th: t.start()
+
+    def _loop(self):
+        while self.jalan:
+            t = time.perf_counter()
+            tabel, _, _ = self.ref.snapshot
+            assert len(tabel["kampus"]) > 0
+            self.maks = max(self.maks, time.perf_counter() - t)
+            time.sleep(0.0005)
+
+    def reset(self):
+        m, self.maks = self.maks, 0.0
+        return m * 1e3
+
+    def stop(self):
+        self.jalan = False
+        for t in self.th: t.join()
+
+
+def tunggu(cond, batas=60.0):
+    t = time.perf_counter()
+    while not cond():
+        if time.perf_counter() - t > batas: return None
+        time.sleep(0.01)
+    return (time.perf_counter() - t) * 1e3
+
+
+def main(argv):
+    delay = float(argv[argv.index("--delay") + 1]) if "--delay" in argv else 3.0
+    srv = Server()
+    for f in (app.LOCAL_S1, app.LOCAL_D34):
+        with open(f, "rb") as fp: srv.isi[f] = fp.read()
+    tmp = tempfile.mkdtemp(prefix="refresh_")
+    sumber = [(os.path.join(tmp, "tidak-ada-" + f), srv.url(f)) for f in (app.LOCAL_S1, app.LOCAL_D34)]
+    cache = os.path.join(tmp, "cache")
+
+    t = time.perf_counter(); app.load_xlsx_table(sumber, os.path.join(tmp, "x")); t_ttl = (time.perf_counter() - t) * 1e3
+    print(f"rebuild penuh (unduh + parse openpyxl) = yang dulu ditunggu 1 request saat ttl habis: {t_ttl:.0f} ms"
+          f" (+{delay:g} s bila server lambat, s.d. 20 s timeout)\n")
+    print(f"{'skenario':<34}{'baca maks':>11}{'snapshot':>22}   catatan")
+
+    t = time.perf_counter(); ref = app.RefresherData(sumber, interval=3600, cache_dir=cache)
+    print(f"{'start dingin (tanpa cache)':<34}{'-':>11}{ref.info()['sidik']:>22}   konstruktor sinkron {(time.perf_counter()-t)*1e3:.0f} ms")
+    sidik0 = ref.info()["sidik"]
+
+    t = time.perf_counter(); ref = app.RefresherData(sumber, interval=3600, cache_dir=cache)
+    t_basi = (time.perf_counter() - t) * 1e3
+    baca = Pembaca(ref)
+    dt = tunggu(lambda: ref.n_refresh >= 1)
+    print(f"{'restart, cache .npz ada':<34}{baca.reset():>8.3f} ms{ref.info()['sidik']:>22}   "
+          f"konstruktor {t_basi:.1f} ms (basi), revalidasi latar {dt:.0f} ms")
+
+    srv.delay = delay
+    n = ref.n_refresh; ref.segarkan()
+    time.sleep(delay / 2)
+    tengah = ref.info()["sidik"]
+    tunggu(lambda: ref.n_refresh > n)
+    srv.delay = 0
+    print(f"{f'server lambat ({delay:g} s)':<34}{baca.reset():>8.3f} ms{ref.info()['sidik']:>22}   "
+          f"selama refresh tetap {'snapshot lama' if tengah == sidik0 else tengah}")
+
+    srv.status = 500
+    g = ref.n_gagal; ref.segarkan(); tunggu(lambda: ref.n_gagal > g)
+    srv.status = 200
+    ok = ref.info()["sidik"] == sidik0 and len(ref.snapshot[0]["kampus"]) > 0
+    print(f"{'server error 500':<34}{baca.reset():>8.3f} ms{ref.info()['sidik']:>22}   "
+          f"{'data lama dipertahankan' if ok else 'DATA HILANG'}; error: …{(ref.error or '')[-40:]}")
+
+    srv.isi[app.LOCAL_D34] = workbook_berubah(srv.isi[app.LOCAL_D34])
+    baris0 = ref.info()["baris"]
+    n = ref.n_refresh; ref.segarkan(); tunggu(lambda: ref.n_refresh > n)
+    print(f"{'workbook berubah di server':<34}{baca.reset():>8.3f} ms{ref.info()['sidik']:>22}   "
+          f"baris {baris0} → {ref.info()['baris']}, error {ref.error}")
+
+    baca.stop(); srv.shutdown()
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,98 @@
+"""Hot reload RegistriModel: salinan model di direktori sementara, N thread memanggil
+prediksi terus-menerus lewat `registri.aktif`, lalu file model diganti (pickle ulang =
+isi berbeda), diganti file rusak, dan dipatok `.sha1` yang salah. Dicatat waktu sampai
+versi berganti, prediksi gagal selama pergantian, dan latensi p50/p99 per fase.
+
+    python bench/bench_reload.py [thread] [--interval DETIK]
+"""
+import os, pickle, shutil, statistics, sys, tempfile, threading, time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+import model_strategi as ms  # noqa: E402
+
+
+def tunggu(cond, batas=30.0):
+    t = time.perf_counter()
+    while not cond():
+        if time.perf_counter() - t > batas: return None
+        time.sleep(0.005)
+    return time.perf_counter() - t
+
+
+def ganti(src, dst, data):
+    """Tulis ke file sementara lalu os.replace — penggantian atomik seperti deploy."""
+    with open(src, "wb") as fp: fp.write(data)
+    os.replace(src, dst)
+
+
+def main(argv):
+    n = int(argv[0]) if argv and argv[0].isdigit() else 8
+    interval = float(argv[argv.index("--interval") + 1]) if "--interval" in argv else 0.05
+    asal = next(f for f in ms.MODEL_FILES if os.path.exists(f))
+    tmp = tempfile.mkdtemp(prefix="reload_")
+    path = os.path.join(tmp, os.path.basename(asal))
+    for f in [asal, ms.path_pohon(asal), *ms.path_lut(asal)]:
+        if os.path.exists(f): shutil.copy(f, tmp)
+    with open(asal, "rb") as fp: model = pickle.load(fp)
+
+    t = time.perf_counter(); reg = ms.RegistriModel([path], interval); t_awal = time.perf_counter() - t
+    print(f"{n} thread · interval {interval:g} s · muat awal {t_awal*1e3:.0f} ms "
+          f"({reg.aktif.sumber}, LUT {'ya' if reg.aktif.lut else 'tidak'})")
+    X = np.random.default_rng(0).integers(1, 6, size=(4096, 9)).astype(float)
+    fase, lat, gagal, henti = ["stabil"], {}, [], threading.Event()
+
+    def sesi(i):
+        k = i
+        while not henti.is_set():
+            x = X[k % len(X)][None]; k += n
+            t = time.perf_counter()
+            try:
+                reg.aktif.pred.predict(x)
+            except Exception as e:
+                gagal.append(repr(e))
+            lat.setdefault(fase[0], []).append(time.perf_counter() - t)
+
+    th = [threading.Thread(target=sesi, args=(i,), daemon=True) for i in range(n)]
+    for t in th: t.start()
+    time.sleep(0.5)
+
+    print(f"{'skenario':<28}{'hasil':<34}{'waktu':>10}")
+    v0 = reg.aktif
+    fase[0] = "reload"
+    ganti(path + ".tmp", path, pickle.dumps(model, protocol=4))
+    dt = tunggu(lambda: reg.aktif is not v0)
+    print(f"{'pickle ulang (isi baru)':<28}{f'{v0.id} → {reg.aktif.id}, reload {reg.n_reload}':<34}"
+          f"{dt*1e3 if dt else float('nan'):>7.0f} ms")
+    print(f"{'':<28}muat di thread pengawas {reg.aktif.durasi_muat*1e3:.0f} ms ({reg.aktif.sumber})")
+    time.sleep(0.3)
+    fase[0] = "stabil"; time.sleep(0.3)
+
+    v1 = reg.aktif
+    ganti(path + ".tmp", path, b"bukan pickle")
+    tunggu(lambda: reg.error is not None)
+    ok = reg.aktif is v1
+    print(f"{'file rusak':<28}{('ditolak, versi tetap ' + v1.id) if ok else 'VERSI BERGANTI':<34}")
+    print(f"{'':<28}{reg.error[:70]}")
+
+    with open(path + ".sha1", "w") as fp: fp.write("0" * 40 + "  " + os.path.basename(path) + "\n")
+    reg.error = None
+    ganti(path + ".tmp", path, pickle.dumps(model, protocol=5))
+    tunggu(lambda: reg.error is not None)
+    ok = reg.aktif is v1
+    print(f"{'.sha1 tidak cocok':<28}{('ditolak, versi tetap ' + v1.id) if ok else 'VERSI BERGANTI':<34}")
+
+    henti.set()
+    for t in th: t.join()
+    print(f"prediksi gagal selama uji: {len(gagal)}" + (f" — {gagal[0]}" if gagal else ""))
+    for f, l in lat.items():
+        l = sorted(l)
+        print(f"latensi fase {f:<8}: {len(l):>7} panggilan, p50 {statistics.median(l)*1e3:.3f} ms, "
+              f"p99 {l[int(len(l) * .99) - 1]*1e3:.3f} ms")
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
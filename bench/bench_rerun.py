@@ -0,0 +1,52 @@
+"""Waktu per rerun Streamlit (script app.py dieksekusi ulang penuh), diukur
+dengan streamlit.testing AppTest di halaman home.
+
+    python bench/bench_rerun.py [jumlah_rerun] [--ref REV ...]
+
+Tanpa --ref mengukur app.py di working tree. Dengan --ref (mis. HEAD~1),
+app.py dari revisi git tsb ditulis sementara ke root repo lalu diukur juga,
+sehingga sebelum/sesudah bisa dibandingkan berdampingan.
+"""
+import os, statistics, subprocess, sys, time
+
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+
+def ukur(path, n):
+    at = AppTest.from_file(path, default_timeout=120)
+    t = time.perf_counter(); at.run(); pertama = time.perf_counter() - t
+    if at.exception:
+        raise RuntimeError(f"{path}: {at.exception[0].message}")
+    waktu = []
+    for _ in range(n):
+        t = time.perf_counter(); at.run(); waktu.append(time.perf_counter() - t)
+    return pertama, waktu
+
+
+def main(argv):
+    n = int(argv[0]) if argv and argv[0].isdigit() else 20
+    refs = [argv[i + 1] for i, a in enumerate(argv) if a == "--ref" and i + 1 < len(argv)]
+    target = [("working tree", os.path.join(ROOT, "app.py"), None)]
+    for rev in refs:
+        tmp = os.path.join(ROOT, f"_bench_rerun_{rev.replace('~', '_').replace('/', '_')}.py")
+        src = subprocess.run(["git", "show", f"{rev}:app.py"], capture_output=True, check=True).stdout
+        with open(tmp, "wb") as fp: fp.write(src)
+        target.append((rev, tmp, tmp))
+
+    print(f"{'versi':<14}{'run pertama':>14}{'median rerun':>15}{'p90 rerun':>12}")
+    try:
+        for label, path, _ in target:
+            pertama, w = ukur(path, n)
+            p90 = sorted(w)[int(0.9 * (len(w) - 1))]
+            print(f"{label:<14}{pertama*1e3:>11.1f} ms{statistics.median(w)*1e3:>12.1f} ms{p90*1e3:>9.1f} ms")
+    finally:
+        for _, _, tmp in target:
+            if tmp and os.path.exists(tmp): os.remove(tmp)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,79 @@
+"""Biaya rerun halaman result per tab: waktu eksekusi script dan byte payload
+elemen yang dikirim ke browser (jumlah ByteSize proto semua elemen di tree
+AppTest, tanpa framing ForwardMsg/websocket).
+
+    python bench/bench_result_page.py [jumlah_rerun] [--ref REV ...]
+
+Kolom "tab saja" = byte elemen di dalam tab yang terbuka, yaitu payload
+fragment tab ketika pengguna berinteraksi di dalam tab tersebut.
+Dengan --ref (mis. HEAD~1) app.py revisi tsb diukur berdampingan.
+"""
+import os, statistics, subprocess, sys, time
+
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+INPUT = {"nama": "Bench", "jenjang": "S1 (Sarjana)", "kampus": "Universitas Indonesia",
+         "prodi": "Pendidikan Dokter", "PU": 600, "PPU": 650, "PBM": 700, "PK": 550, "LBI": 600,
+         "LBE": 620, "PM": 580, "fokus": 3, "pede": 4, "cemas": 2, "distrak": 3,
+         "jam": 3, "hari": 4, "latihan": 3, "tryout": 2, "review": 3}
+
+
+def byte_tree(node):
+    p = getattr(node, "proto", None)
+    n = p.ByteSize() if p is not None and hasattr(p, "ByteSize") else 0
+    return n + sum(byte_tree(c) for c in getattr(node, "children", {}).values())
+
+
+def buka_result(path):
+    at = AppTest.from_file(path, default_timeout=120).run()
+    at.session_state["data"] = dict(INPUT)
+    at.session_state["page"] = "survey"; at.session_state["step"] = 4
+    at.run(); at.button[-1].click().run()
+    if at.exception or at.session_state["page"] != "result":
+        raise RuntimeError(f"{path}: gagal membuka halaman result")
+    return at
+
+
+def ukur(path, n):
+    at = buka_result(path)
+    label = [t.label for t in at.tabs][:7]
+    lazy = "r_tab" in at.session_state
+    hasil = []
+    for i, lbl in enumerate(label if lazy else label[:1]):
+        if lazy: at.session_state["r_tab"] = lbl
+        w = []
+        for _ in range(n):
+            t = time.perf_counter(); at.run(); w.append(time.perf_counter() - t)
+        tab = at.tabs[i] if lazy else None
+        hasil.append((lbl if lazy else "(semua tab)", statistics.median(w), byte_tree(at._tree),
+                      byte_tree(tab) if tab is not None else None))
+    return hasil
+
+
+def main(argv):
+    n = int(argv[0]) if argv and argv[0].isdigit() else 10
+    refs = [argv[i + 1] for i, a in enumerate(argv) if a == "--ref" and i + 1 < len(argv)]
+    target = [("working tree", os.path.join(ROOT, "app.py"), None)]
+    for rev in refs:
+        tmp = os.path.join(ROOT, f"_bench_result_{rev.replace('~', '_').replace('/', '_')}.py")
+        src = subprocess.run(["git", "show", f"{rev}:app.py"], capture_output=True, check=True).stdout
+        with open(tmp, "wb") as fp: fp.write(src)
+        target.append((rev, tmp, tmp))
+
+    print(f"{'versi':<14}{'tab terbuka':<24}{'rerun':>10}{'payload':>11}{'tab saja':>11}")
+    try:
+        for versi, path, _ in target:
+            for lbl, dt, b, b_tab in ukur(path, n):
+                tab = f"{b_tab/1024:>8.1f} KB" if b_tab is not None else f"{'—':>11}"
+                print(f"{versi:<14}{lbl:<24}{dt*1e3:>7.1f} ms{b/1024:>8.1f} KB{tab}")
+    finally:
+        for _, _, tmp in target:
+            if tmp and os.path.exists(tmp): os.remove(tmp)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,71 @@
+"""Sesi panjang di halaman result: 100 interaksi (ganti tab, toggle alternatif,
+tombol export) lewat AppTest. Dicatat per interaksi: jumlah key session_state,
+ukuran pickle session_state, dan berapa chart Plotly yang id elemennya baru
+(id baru = frontend unmount + mount ulang chart, bukan diff).
+
+    python bench/bench_session.py [jumlah_interaksi] [--ref REV ...]
+"""
+import os, pickle, subprocess, sys, time
+
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "bench"))
+from bench_result_page import buka_result  # noqa: E402
+
+
+def id_chart(at):
+    return {e.proto.id for e in at.get("plotly_chart")}
+
+
+def ukuran_state(at):
+    state = at.session_state.to_dict()
+    n = 0
+    for v in state.values():
+        try: n += len(pickle.dumps(v))
+        except Exception: pass
+    return len(state), n
+
+
+def sesi(path, n):
+    at = buka_result(path)
+    label = [t.label for t in at.tabs][:7]
+    lazy = "r_tab" in at.session_state
+    dilihat, remount, t_total = id_chart(at), 0, 0.0
+    awal = ukuran_state(at)
+    for i in range(n):
+        aksi = i % 9
+        if aksi < 7 and lazy:
+            at.session_state["r_tab"] = label[aksi]
+        elif aksi == 7 and at.toggle:
+            at.toggle[0].set_value(not at.toggle[0].value)
+        t = time.perf_counter(); at.run(); t_total += time.perf_counter() - t
+        ids = id_chart(at)
+        remount += len(ids - dilihat); dilihat |= ids
+    return awal, ukuran_state(at), remount, len(dilihat), t_total / n
+
+
+def main(argv):
+    n = int(argv[0]) if argv and argv[0].isdigit() else 100
+    refs = [argv[i + 1] for i, a in enumerate(argv) if a == "--ref" and i + 1 < len(argv)]
+    target = [("working tree", os.path.join(ROOT, "app.py"), None)]
+    for rev in refs:
+        tmp = os.path.join(ROOT, f"_bench_session_{rev.replace('~', '_').replace('/', '_')}.py")
+        src = subprocess.run(["git", "show", f"{rev}:app.py"], capture_output=True, check=True).stdout
+        with open(tmp, "wb") as fp: fp.write(src)
+        target.append((rev, tmp, tmp))
+    print(f"{n} interaksi")
+    print(f"{'versi':<14}{'key state':>14}{'pickle state':>20}{'chart id baru':>15}{'rerun':>10}")
+    try:
+        for versi, path, _ in target:
+            (k0, b0), (k1, b1), remount, n_id, dt = sesi(path, n)
+            print(f"{versi:<14}{k0:>6} → {k1:<5}{b0/1024:>9.1f} → {b1/1024:<6.1f}KB"
+                  f"{remount:>8} / {n_id:<4}{dt*1e3:>7.0f} ms")
+    finally:
+        for _, _, tmp in target:
+            if tmp and os.path.exists(tmp): os.remove(tmp)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+"""Penjelasan SHAP strategi: biaya per input (miss: TreeSHAP ModelPohon + cache,
+hit: memo per tuple fitur), chart kontribusi (bangun vs cache hit), dan kecocokan
+dengan `pred_contrib` native LightGBM bila terpasang.
+
+    python bench/bench_shap.py [jumlah_input]
+
+Dampak ke halaman result: python bench/bench_result_page.py 10 --ref <rev sebelum SHAP>
+(baris "Strategi Belajar").
+"""
+import os, sys, time
+import numpy as np
+
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(sys.path[0])
+import app  # noqa: E402
+import mesin_skor as mesin  # noqa: E402
+import model_strategi as ms  # noqa: E402
+import streamlit as st  # noqa: E402
+
+KEYS = ["jam","hari","latihan","tryout","review","fokus","pede","cemas","distrak"]
+
+
+def per_call(fn, args):
+    t = time.perf_counter()
+    for a in args: fn(a)
+    return (time.perf_counter() - t) / len(args) * 1e3
+
+
+def main(n):
+    rng  = np.random.default_rng(0)
+    inps = [dict(zip(KEYS, map(int, row))) for row in rng.integers(1, 6, size=(n, 9))]
+    pen  = mesin.load_penjelas()
+    print(f"model {type(pen.model).__name__}, {len(pen.kolom)} kolom")
+    t = time.perf_counter(); pen.kontribusi([[3] * 9]); t_siap = time.perf_counter() - t
+    print(f"siapkan tabel TreeSHAP (sekali per proses) : {t_siap*1e3:8.1f} ms")
+    mesin.explain_cache()._data.clear()
+    print(f"jelaskan_strategi, miss                   : {per_call(app.jelaskan_strategi, inps):8.3f} ms/input")
+    print(f"jelaskan_strategi, hit                    : {per_call(app.jelaskan_strategi, inps):8.3f} ms/input")
+    X = np.array([ms.fitur_lgbm(d) for d in inps], dtype=float)
+    t = time.perf_counter(); c = pen.kontribusi(X); t_b = time.perf_counter() - t
+    print(f"{f'kontribusi batch {n} baris':<43}: {t_b / n * 1e3:8.3f} ms/input")
+
+    pj = [app.jelaskan_strategi(d) for d in inps[:50]]
+    print(f"fig_kontribusi bangun + to_json           : {per_call(lambda p: app.fig_kontribusi(*p).to_json(), pj):8.2f} ms")
+    st.plotly_chart = lambda *a, **kw: None
+    for p in pj: app.ch_kontribusi(p)
+    print(f"ch_kontribusi, cache hit                  : {per_call(app.ch_kontribusi, pj):8.2f} ms")
+
+    try:
+        model = ms._muat_model(app.lgbm_fname)
+    except ImportError:
+        print("lightgbm tidak terpasang — perbandingan pred_contrib dilewati"); return
+    ref = model.booster_.predict(pen.matriks(X), pred_contrib=True)
+    t = time.perf_counter(); model.booster_.predict(pen.matriks(X[:1]), pred_contrib=True); t_1 = time.perf_counter() - t
+    print(f"lightgbm pred_contrib 1 baris (pembanding) : {t_1*1e3:8.3f} ms")
+    print(f"selisih maks vs lightgbm pred_contrib     : {np.abs(ref - c).max():.3g}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
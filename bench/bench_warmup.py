@@ -0,0 +1,131 @@
+"""Pengunjung pertama setelah start, tanpa warm-up vs dengan `warmup()`.
+
+1. Server sungguhan: `streamlit run app.py` vs `streamlit run server.py` (setelah
+   /readyz 200). Sesi websocket pertama meminta halaman home; dicatat waktu sampai
+   script_finished, dibanding sesi-sesi berikutnya.
+2. AppTest (warm-up dijalankan seperti server.py di proses yang sama): render home,
+   submit survei (isian default, pasangan populer) sampai halaman result, lalu
+   kunjungan pertama tiap tab. Yang dicatat waktu CPU proses (AppTest menunggu script
+   dengan polling sleep, jadi wall time-nya berbutir kasar), median beberapa proses
+   baru, plus hit cache compute/figure dari warm-up yang dipakai sesi tersebut.
+   AppTest mengompilasi app.py sendiri, jadi baris "home" tetap membayar kompilasi
+   yang pada server.py sudah dilakukan warm-up.
+
+    python bench/bench_warmup.py [proses] [--kampus K] [--prodi P] [--port N]
+"""
+import asyncio, json, os, statistics, subprocess, sys, time, urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+# = INPUT_DEFAULT app.py (isian awal form survei); tidak diambil dari app.py supaya
+# proses "tanpa warm-up" tidak mengeksekusi app lebih dulu.
+INPUT = {"PU": 550, "PPU": 550, "PBM": 550, "PK": 550, "LBI": 550, "LBE": 550, "PM": 550,
+         "fokus": 3, "pede": 3, "cemas": 3, "distrak": 3, "jam": 3, "hari": 3, "latihan": 3, "tryout": 2, "review": 3}
+
+_SESI = r"""
+import json, os, runpy, sys, time
+os.environ["STREAMLIT_LOGGER_LEVEL"] = "error"
+from streamlit.testing.v1 import AppTest
+app, warm, kampus, prodi = sys.argv[1], sys.argv[2] == "1", sys.argv[3], sys.argv[4]
+hasil = {}
+if warm:
+    t = time.process_time(); g = runpy.run_path(app, run_name="__main__")
+    st = g["warmup"](); hasil["warm-up (server start)"] = (time.process_time() - t) * 1e3
+    awal = {n: g[n]().stats()["hits"] for n in ("compute_cache", "figure_cache")}
+at = AppTest.from_file(app, default_timeout=120)
+t = time.process_time(); at.run(); hasil["home"] = (time.process_time() - t) * 1e3
+at.session_state["data"] = {**json.loads(sys.argv[5]), "nama": "Bench", "jenjang": "S1 (Sarjana)", "kampus": kampus, "prodi": prodi}
+at.session_state["page"] = "survey"; at.session_state["step"] = 4
+at.run(); t = time.process_time(); at.button[-1].click().run(); hasil["submit → result"] = (time.process_time() - t) * 1e3
+assert not at.exception and at.session_state["page"] == "result", at.exception
+label = [t.label for t in at.tabs][:7]
+for lbl in label[1:]:
+    at.session_state["r_tab"] = lbl
+    t = time.process_time(); at.run(); hasil[lbl] = (time.process_time() - t) * 1e3
+ulang = {}
+for lbl in label:                      # kunjungan kedua: biaya rerun normal (semua cache hangat)
+    at.session_state["r_tab"] = lbl
+    t = time.process_time(); at.run(); ulang[lbl] = (time.process_time() - t) * 1e3
+hasil["ulang"] = ulang
+if warm:
+    hasil["hit"] = {n: g[n]().stats()["hits"] - awal[n] for n in awal}
+print(json.dumps(hasil))
+"""
+
+
+def sesi(warm, kampus, prodi):
+    out = subprocess.run([sys.executable, "-c", _SESI, os.path.join(ROOT, "app.py"), "1" if warm else "0", kampus, prodi, json.dumps(INPUT)],
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _sesi_ws(port):
+    """Satu sesi browser minimal: buka websocket, minta rerun home, tunggu script_finished."""
+    import websockets
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    async def jalan():
+        async with websockets.connect(f"ws://localhost:{port}/_stcore/stream",
+                                      subprotocols=["streamlit"], max_size=None) as ws:
+            b = BackMsg(); b.rerun_script.query_string = ""
+            t = time.perf_counter(); await ws.send(b.SerializeToString())
+            while True:
+                m = ForwardMsg(); m.ParseFromString(await ws.recv())
+                if m.WhichOneof("type") == "script_finished":
+                    return (time.perf_counter() - t) * 1e3
+    return asyncio.run(jalan())
+
+
+def server(entry, port, n):
+    """Start server, tunggu siap, lalu (waktu siap, sesi pertama, median sesi berikutnya)."""
+    cek = f"http://localhost:{port}/" + ("readyz" if entry == "server.py" else "_stcore/health")
+    proc = subprocess.Popen([sys.executable, "-m", "streamlit", "run", entry, "--server.headless", "true",
+                             "--server.port", str(port)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        t = time.perf_counter()
+        while True:
+            try:
+                if urllib.request.urlopen(cek, timeout=1).status == 200: break
+            except Exception:
+                time.sleep(0.1)
+            if time.perf_counter() - t > 120: raise RuntimeError(f"{entry} tidak siap")
+        siap = (time.perf_counter() - t) * 1e3
+        pertama = _sesi_ws(port)
+        return siap, pertama, statistics.median(_sesi_ws(port) for _ in range(n))
+    finally:
+        proc.terminate(); proc.wait()
+
+
+def median(hasil):
+    if not isinstance(hasil[0], dict): return statistics.median(hasil)
+    return {k: median([h[k] for h in hasil]) for k in hasil[0]}
+
+
+def main(argv):
+    n = int(argv[0]) if argv and argv[0].isdigit() else 3
+    opsi = dict(zip(argv[1::2], argv[2::2])) if argv and argv[0].isdigit() else dict(zip(argv[::2], argv[1::2]))
+    kampus, prodi = opsi.get("--kampus", "Universitas Indonesia"), opsi.get("--prodi", "Pendidikan Dokter")
+    port = int(opsi.get("--port", 8765))
+    print(f"{'server':<12}{'siap':>10}{'sesi pertama':>15}{'sesi berikutnya':>18}   (wall, home)")
+    for entry in ("app.py", "server.py"):
+        siap, pertama, lanjut = server(entry, port, max(n, 3))
+        print(f"{entry:<12}{siap:>7.0f} ms{pertama:>12.0f} ms{lanjut:>15.0f} ms")
+    print()
+    dingin = median([sesi(False, kampus, prodi) for _ in range(n)])
+    hangat = median([sesi(True, kampus, prodi) for _ in range(n)])
+    print(f"{kampus} · {prodi}, isian default survei · median {n} proses")
+    print(f"{'langkah pengunjung pertama':<30}{'tanpa warm-up':>15}{'dengan warm-up':>16}{'rerun ulang':>14}   (CPU)")
+    ulang = hangat["ulang"]
+    for k in hangat:
+        if k in ("hit", "ulang"): continue
+        a = f"{dingin[k]:.0f} ms" if k in dingin else "-"
+        u = f"{ulang[k]:.0f} ms" if k in ulang else "-"
+        print(f"{k:<30}{a:>15}{hangat[k]:>13.0f} ms{u:>14}")
+    total = lambda h: sum(v for k, v in h.items() if k not in ("hit", "ulang", "warm-up (server start)"))
+    print(f"{'total sesi':<30}{total(dingin):>12.0f} ms{total(hangat):>13.0f} ms")
+    print(f"hit cache dari warm-up di sesi ini: {hangat['hit']}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
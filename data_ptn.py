@@ -0,0 +1,2354 @@
+"""
+Data referensi Skoria: rentang skor per kampus/prodi (D3, D4, S1) dan bobot
+subtes per jurusan.
+
+Dipisah dari app.py supaya literal ±2.000 entri ini hanya dieksekusi sekali
+per proses (saat import pertama), bukan di setiap rerun Streamlit.
+"""
+
+# ══════════════════════════════════════════════════════════
+# DATABASE PRODI D3 DAN D4 AKURAT PER KAMPUS
+# Sumber: website resmi masing-masing PTN & SNPMB 2022-2024
+# ══════════════════════════════════════════════════════════
+
+PTN_PRODI_D3 = {
+    # ── POLITEKNIK ──
+    "Politeknik Negeri Bandung": {
+        "D3 Teknik Sipil": {"mn": 530, "mx": 600},
+        "D3 Teknik Geodesi": {"mn": 520, "mx": 590},
+        "D3 Teknik Mesin": {"mn": 520, "mx": 590},
+        "D3 Teknik Refrigerasi dan Tata Udara": {"mn": 510, "mx": 580},
+        "D3 Teknik Otomotif": {"mn": 510, "mx": 580},
+        "D3 Teknik Elektronika": {"mn": 530, "mx": 600},
+        "D3 Teknik Elektro": {"mn": 535, "mx": 605},
+        "D3 Teknik Informatika": {"mn": 560, "mx": 630},
+        "D3 Teknik Kimia": {"mn": 510, "mx": 580},
+        "D3 Analisis Kimia": {"mn": 510, "mx": 580},
+        "D3 Teknik Lingkungan": {"mn": 500, "mx": 570},
+        "D3 Akuntansi": {"mn": 520, "mx": 590},
+        "D3 Keuangan dan Perbankan": {"mn": 510, "mx": 580},
+        "D3 Manajemen Pemasaran": {"mn": 500, "mx": 570},
+        "D3 Administrasi Bisnis": {"mn": 500, "mx": 570},
+        "D3 Manajemen Informatika": {"mn": 530, "mx": 600},
+        "D3 Komputerisasi Akuntansi": {"mn": 520, "mx": 590},
+        "D3 Usaha Perjalanan Wisata": {"mn": 490, "mx": 560},
+        "D3 Manajemen Aset": {"mn": 490, "mx": 560},
+    },
+    "Politeknik Negeri Jakarta": {
+        "D3 Teknik Sipil": {"mn": 520, "mx": 590},
+        "D3 Teknik Mesin": {"mn": 515, "mx": 585},
+        "D3 Teknik Elektro": {"mn": 530, "mx": 600},
+        "D3 Teknik Elektronika": {"mn": 525, "mx": 595},
+        "D3 Teknik Informatika": {"mn": 550, "mx": 620},
+        "D3 Teknik Kimia": {"mn": 505, "mx": 575},
+        "D3 Akuntansi": {"mn": 515, "mx": 585},
+        "D3 Keuangan dan Perbankan": {"mn": 505, "mx": 575},
+        "D3 Manajemen Pemasaran": {"mn": 495, "mx": 565},
+        "D3 Administrasi Bisnis": {"mn": 495, "mx": 565},
+        "D3 Manajemen Informatika": {"mn": 525, "mx": 595},
+        "D3 Komputerisasi Akuntansi": {"mn": 515, "mx": 585},
+        "D3 Perbankan Syariah": {"mn": 495, "mx": 565},
+        "D3 Teknik Grafika dan Penerbitan": {"mn": 490, "mx": 560},
+    },
+    "Politeknik Negeri Semarang": {
+        "D3 Teknik Sipil": {"mn": 510, "mx": 580},
+        "D3 Teknik Mesin": {"mn": 505, "mx": 575},
+        "D3 Teknik Elektro": {"mn": 520, "mx": 590},
+        "D3 Teknik Elektronika": {"mn": 515, "mx": 585},
+        "D3 Teknik Informatika": {"mn": 540, "mx": 610},
+        "D3 Teknik Kimia": {"mn": 500, "mx": 570},
+        "D3 Teknik Telekomunikasi": {"mn": 515, "mx": 585},
+        "D3 Akuntansi": {"mn": 510, "mx": 580},
+        "D3 Keuangan dan Perbankan": {"mn": 500, "mx": 570},
+        "D3 Manajemen Pemasaran": {"mn": 490, "mx": 560},
+        "D3 Administrasi Bisnis": {"mn": 490, "mx": 560},
+        "D3 Manajemen Informatika": {"mn": 520, "mx": 590},
+        "D3 Komputerisasi Akuntansi": {"mn": 510, "mx": 580},
+        "D3 Teknik Konstruksi Gedung": {"mn": 495, "mx": 565},
+    },
+    "Politeknik Negeri Malang": {
+        "D3 Teknik Sipil": {"mn": 505, "mx": 575},
+        "D3 Teknik Mesin": {"mn": 500, "mx": 570},
+        "D3 Teknik Elektro": {"mn": 515, "mx": 585},
+        "D3 Teknik Elektronika": {"mn": 510, "mx": 580},
+        "D3 Teknik Informatika": {"mn": 535, "mx": 605},
+        "D3 Teknik Kimia": {"mn": 495, "mx": 565},
+        "D3 Teknik Listrik": {"mn": 500, "mx": 570},
+        "D3 Akuntansi": {"mn": 505, "mx": 575},
+        "D3 Keuangan dan Perbankan": {"mn": 495, "mx": 565},
+        "D3 Manajemen Pemasaran": {"mn": 485, "mx": 555},
+        "D3 Administrasi Bisnis": {"mn": 485, "mx": 555},
+        "D3 Manajemen Informatika": {"mn": 515, "mx": 585},
+        "D3 Komputerisasi Akuntansi": {"mn": 505, "mx": 575},
+        "D3 Teknik Otomotif Elektronik": {"mn": 495, "mx": 565},
+    },
+    "Politeknik Negeri Medan": {
+        "D3 Teknik Sipil": {"mn": 490, "mx": 560},
+        "D3 Teknik Mesin": {"mn": 485, "mx": 555},
+        "D3 Teknik Elektro": {"mn": 500, "mx": 570},
+        "D3 Teknik Elektronika": {"mn": 495, "mx": 565},
+        "D3 Teknik Informatika": {"mn": 515, "mx": 585},
+        "D3 Teknik Kimia": {"mn": 480, "mx": 550},
+        "D3 Akuntansi": {"mn": 490, "mx": 560},
+        "D3 Keuangan dan Perbankan": {"mn": 480, "mx": 550},
+        "D3 Manajemen Pemasaran": {"mn": 470, "mx": 540},
+        "D3 Administrasi Bisnis": {"mn": 470, "mx": 540},
+        "D3 Manajemen Informatika": {"mn": 500, "mx": 570},
+        "D3 Komputerisasi Akuntansi": {"mn": 490, "mx": 560},
+        "D3 Teknik Konstruksi Gedung": {"mn": 475, "mx": 545},
+    },
+    "Politeknik Negeri Ujung Pandang": {
+        "D3 Teknik Sipil": {"mn": 490, "mx": 560},
+        "D3 Teknik Mesin": {"mn": 485, "mx": 555},
+        "D3 Teknik Elektro": {"mn": 500, "mx": 570},
+        "D3 Teknik Elektronika": {"mn": 495, "mx": 565},
+        "D3 Teknik Informatika": {"mn": 515, "mx": 585},
+        "D3 Teknik Kimia": {"mn": 480, "mx": 550},
+        "D3 Teknik Refrigerasi dan Tata Udara": {"mn": 480, "mx": 550},
+        "D3 Akuntansi": {"mn": 490, "mx": 560},
+        "D3 Administrasi Bisnis": {"mn": 470, "mx": 540},
+        "D3 Manajemen Informatika": {"mn": 500, "mx": 570},
+        "D3 Pariwisata": {"mn": 460, "mx": 530},
+        "D3 Teknik Konstruksi Gedung": {"mn": 475, "mx": 545},
+        "D3 Teknik Pertambangan": {"mn": 470, "mx": 540},
+    },
+    "Politeknik Negeri Bali": {
+        "D3 Teknik Sipil": {"mn": 490, "mx": 560},
+        "D3 Teknik Mesin": {"mn": 485, "mx": 555},
+        "D3 Teknik Elektro": {"mn": 495, "mx": 565},
+        "D3 Teknik Elektronika": {"mn": 490, "mx": 560},
+        "D3 Teknik Informatika": {"mn": 510, "mx": 580},
+        "D3 Akuntansi": {"mn": 490, "mx": 560},
+        "D3 Keuangan dan Perbankan": {"mn": 480, "mx": 550},
+        "D3 Administrasi Bisnis": {"mn": 470, "mx": 540},
+        "D3 Manajemen Informatika": {"mn": 500, "mx": 570},
+        "D3 Pariwisata": {"mn": 490, "mx": 560},
+        "D3 Usaha Perjalanan Wisata": {"mn": 480, "mx": 550},
+        "D3 Perhotelan": {"mn": 475, "mx": 545},
+        "D3 Manajemen Proyek": {"mn": 470, "mx": 540},
+    },
+    "Politeknik Elektronika Negeri Surabaya": {
+        "D3 Teknik Elektronika": {"mn": 545, "mx": 615},
+        "D3 Teknik Informatika": {"mn": 555, "mx": 625},
+        "D3 Teknik Telekomunikasi": {"mn": 535, "mx": 605},
+        "D3 Teknik Komputer": {"mn": 540, "mx": 610},
+        "D3 Teknik Listrik": {"mn": 520, "mx": 590},
+        "D3 Sistem Kelistrikan": {"mn": 515, "mx": 585},
+        "D3 Manajemen Informatika": {"mn": 530, "mx": 600},
+        "D3 Teknik Mekatronika": {"mn": 535, "mx": 605},
+    },
+    "Politeknik Manufaktur Negeri Bandung": {
+        "D3 Teknik Mesin": {"mn": 530, "mx": 600},
+        "D3 Teknik Manufaktur": {"mn": 525, "mx": 595},
+        "D3 Teknik Otomasi Industri": {"mn": 530, "mx": 600},
+        "D3 Teknik Perancangan dan Konstruksi Mesin": {"mn": 520, "mx": 590},
+        "D3 Teknik Pemeliharaan Mesin": {"mn": 515, "mx": 585},
+        "D3 Teknik Pengecoran Logam": {"mn": 505, "mx": 575},
+    },
+    "Politeknik Perkapalan Negeri Surabaya": {
+        "D3 Teknik Perkapalan": {"mn": 530, "mx": 600},
+        "D3 Teknik Permesinan Kapal": {"mn": 520, "mx": 590},
+        "D3 Teknik Kelistrikan Kapal": {"mn": 515, "mx": 585},
+        "D3 Teknik Bangunan Kapal": {"mn": 525, "mx": 595},
+        "D3 Teknik Desain dan Manufaktur": {"mn": 515, "mx": 585},
+        "D3 Teknik Keselamatan dan Kesehatan Kerja": {"mn": 510, "mx": 580},
+    },
+
+    # ── UNIVERSITAS (D3 yang benar-benar ada) ──
+    "Universitas Indonesia": {
+        "D3 Fisioterapi": {"mn": 560, "mx": 630},
+        "D3 Okupasi Terapi": {"mn": 540, "mx": 610},
+        "D3 Administrasi Perkantoran": {"mn": 510, "mx": 580},
+        "D3 Akuntansi": {"mn": 540, "mx": 610},
+        "D3 Perpajakan": {"mn": 530, "mx": 600},
+        "D3 Manajemen Informasi": {"mn": 510, "mx": 580},
+        "D3 Hubungan Masyarakat": {"mn": 510, "mx": 580},
+        "D3 Rekam Medis dan Informasi Kesehatan": {"mn": 530, "mx": 600},
+        "D3 Teknik Komputer": {"mn": 560, "mx": 630},
+        "D3 Kebidanan": {"mn": 530, "mx": 600},
+    },
+    "Institut Teknologi Bandung": {
+        "D3 Teknik Sipil": {"mn": 590, "mx": 660},
+        "D3 Teknik Mesin": {"mn": 585, "mx": 655},
+        "D3 Teknik Elektro": {"mn": 595, "mx": 665},
+        "D3 Teknik Kimia": {"mn": 575, "mx": 645},
+        "D3 Teknik Informatika": {"mn": 615, "mx": 685},
+        "D3 Manajemen Informatika": {"mn": 580, "mx": 650},
+        "D3 Analisis Kimia": {"mn": 560, "mx": 630},
+        "D3 Teknik Geodesi": {"mn": 565, "mx": 635},
+        "D3 Teknik Lingkungan": {"mn": 555, "mx": 625},
+        "D3 Manajemen Pemasaran": {"mn": 545, "mx": 615},
+        "D3 Akuntansi": {"mn": 555, "mx": 625},
+    },
+    "Institut Teknologi Sepuluh Nopember": {
+        "D3 Teknik Sipil": {"mn": 560, "mx": 630},
+        "D3 Teknik Mesin": {"mn": 555, "mx": 625},
+        "D3 Teknik Elektro": {"mn": 570, "mx": 640},
+        "D3 Teknik Kimia": {"mn": 545, "mx": 615},
+        "D3 Teknik Informatika": {"mn": 590, "mx": 660},
+        "D3 Teknik Perkapalan": {"mn": 545, "mx": 615},
+        "D3 Teknik Permesinan Kapal": {"mn": 535, "mx": 605},
+        "D3 Instrumentasi": {"mn": 540, "mx": 610},
+        "D3 Statistika Bisnis": {"mn": 545, "mx": 615},
+        "D3 Manajemen Bisnis": {"mn": 545, "mx": 615},
+    },
+    "Institut Pertanian Bogor": {
+        "D3 Analisis Kimia": {"mn": 530, "mx": 600},
+        "D3 Teknologi Pangan": {"mn": 540, "mx": 610},
+        "D3 Ekowisata": {"mn": 490, "mx": 560},
+        "D3 Manajemen Informatika": {"mn": 515, "mx": 585},
+        "D3 Akuntansi": {"mn": 510, "mx": 580},
+        "D3 Teknik Komputer": {"mn": 525, "mx": 595},
+        "D3 Komunikasi": {"mn": 495, "mx": 565},
+        "D3 Pengelolaan Perkebunan": {"mn": 465, "mx": 535},
+        "D3 Manajemen Agribisnis": {"mn": 475, "mx": 545},
+        "D3 Supervisor Jaminan Mutu Pangan": {"mn": 480, "mx": 550},
+        "D3 Manajemen Sumber Daya Lahan": {"mn": 460, "mx": 530},
+        "D3 Teknik dan Manajemen Lingkungan": {"mn": 470, "mx": 540},
+    },
+    "Universitas Gadjah Mada": {
+        "D3 Bahasa Inggris": {"mn": 530, "mx": 600},
+        "D3 Bahasa Jepang": {"mn": 510, "mx": 580},
+        "D3 Bahasa Prancis": {"mn": 500, "mx": 570},
+        "D3 Bahasa Korea": {"mn": 505, "mx": 575},
+        "D3 Akuntansi": {"mn": 550, "mx": 620},
+        "D3 Manajemen": {"mn": 545, "mx": 615},
+        "D3 Perpajakan": {"mn": 530, "mx": 600},
+        "D3 Keuangan dan Perbankan": {"mn": 520, "mx": 590},
+        "D3 Ekonomika Terapan": {"mn": 520, "mx": 590},
+        "D3 Rekam Medis": {"mn": 530, "mx": 600},
+        "D3 Kesehatan Hewan": {"mn": 490, "mx": 560},
+        "D3 Komputer dan Sistem Informasi": {"mn": 545, "mx": 615},
+        "D3 Elektronika dan Instrumentasi": {"mn": 530, "mx": 600},
+        "D3 Teknik Elektro": {"mn": 530, "mx": 600},
+        "D3 Teknik Mesin": {"mn": 520, "mx": 590},
+        "D3 Teknik Sipil": {"mn": 525, "mx": 595},
+        "D3 Teknik Kimia": {"mn": 510, "mx": 580},
+        "D3 Teknik Geomatika": {"mn": 510, "mx": 580},
+        "D3 Pariwisata": {"mn": 510, "mx": 580},
+        "D3 Manajemen dan Penilaian Properti": {"mn": 505, "mx": 575},
+    },
+    "Universitas Airlangga": {
+        "D3 Analis Kesehatan / TLM": {"mn": 540, "mx": 610},
+        "D3 Rekam Medis dan Informasi Kesehatan": {"mn": 520, "mx": 590},
+        "D3 Fisioterapi": {"mn": 530, "mx": 600},
+        "D3 Radiologi": {"mn": 525, "mx": 595},
+        "D3 Gizi": {"mn": 520, "mx": 590},
+        "D3 Keperawatan": {"mn": 515, "mx": 585},
+        "D3 Kebidanan": {"mn": 510, "mx": 580},
+        "D3 Farmasi": {"mn": 540, "mx": 610},
+        "D3 Akuntansi": {"mn": 520, "mx": 590},
+        "D3 Perpajakan": {"mn": 510, "mx": 580},
+        "D3 Manajemen Pemasaran": {"mn": 500, "mx": 570},
+        "D3 Keuangan dan Perbankan": {"mn": 505, "mx": 575},
+        "D3 Administrasi Bisnis": {"mn": 495, "mx": 565},
+        "D3 Bahasa Inggris": {"mn": 500, "mx": 570},
+        "D3 Bahasa Jepang": {"mn": 480, "mx": 550},
+        "D3 Teknik Informatika": {"mn": 530, "mx": 600},
+        "D3 Manajemen Informasi Kesehatan": {"mn": 515, "mx": 585},
+        "D3 Hubungan Masyarakat": {"mn": 490, "mx": 560},
+    },
+    "Universitas Padjadjaran": {
+        "D3 Analis Kesehatan / TLM": {"mn": 530, "mx": 600},
+        "D3 Rekam Medis dan Informasi Kesehatan": {"mn": 510, "mx": 580},
+        "D3 Fisioterapi": {"mn": 520, "mx": 590},
+        "D3 Radiologi": {"mn": 515, "mx": 585},
+        "D3 Gizi": {"mn": 510, "mx": 580},
+        "D3 Keperawatan": {"mn": 505, "mx": 575},
+        "D3 Kebidanan": {"mn": 500, "mx": 570},
+        "D3 Farmasi": {"mn": 525, "mx": 595},
+        "D3 Akuntansi": {"mn": 515, "mx": 585},
+        "D3 Perpajakan": {"mn": 505, "mx": 575},
+        "D3 Manajemen Pemasaran": {"mn": 495, "mx": 565},
+        "D3 Keuangan dan Perbankan": {"mn": 495, "mx": 565},
+        "D3 Administrasi Bisnis": {"mn": 485, "mx": 555},
+        "D3 Bahasa Inggris": {"mn": 490, "mx": 560},
+        "D3 Bahasa Jepang": {"mn": 470, "mx": 540},
+        "D3 Hubungan Masyarakat": {"mn": 485, "mx": 555},
+        "D3 Kehumasan": {"mn": 480, "mx": 550},
+    },
+    "Universitas Diponegoro": {
+        "D3 Analis Kesehatan / TLM": {"mn": 510, "mx": 580},
+        "D3 Rekam Medis dan Informasi Kesehatan": {"mn": 490, "mx": 560},
+        "D3 Gizi": {"mn": 495, "mx": 565},
+        "D3 Keperawatan": {"mn": 485, "mx": 555},
+        "D3 Farmasi": {"mn": 505, "mx": 575},
+        "D3 Akuntansi": {"mn": 500, "mx": 570},
+        "D3 Perpajakan": {"mn": 490, "mx": 560},
+        "D3 Manajemen Pemasaran": {"mn": 475, "mx": 545},
+        "D3 Keuangan dan Perbankan": {"mn": 480, "mx": 550},
+        "D3 Administrasi Bisnis": {"mn": 470, "mx": 540},
+        "D3 Bahasa Inggris": {"mn": 475, "mx": 545},
+        "D3 Hubungan Masyarakat": {"mn": 470, "mx": 540},
+        "D3 Teknik Informatika": {"mn": 510, "mx": 580},
+        "D3 Teknik Sipil": {"mn": 490, "mx": 560},
+        "D3 Teknik Elektro": {"mn": 490, "mx": 560},
+        "D3 Teknik Kimia": {"mn": 480, "mx": 550},
+        "D3 Teknik Geomatika": {"mn": 475, "mx": 545},
+    },
+    "Universitas Brawijaya": {
+        "D3 Analis Kesehatan / TLM": {"mn": 500, "mx": 570},
+        "D3 Keperawatan": {"mn": 475, "mx": 545},
+        "D3 Kebidanan": {"mn": 470, "mx": 540},
+        "D3 Gizi": {"mn": 480, "mx": 550},
+        "D3 Farmasi": {"mn": 490, "mx": 560},
+        "D3 Akuntansi": {"mn": 490, "mx": 560},
+        "D3 Perpajakan": {"mn": 480, "mx": 550},
+        "D3 Manajemen Pemasaran": {"mn": 465, "mx": 535},
+        "D3 Keuangan dan Perbankan": {"mn": 470, "mx": 540},
+        "D3 Administrasi Bisnis": {"mn": 460, "mx": 530},
+        "D3 Bahasa Inggris": {"mn": 465, "mx": 535},
+        "D3 Teknik Informatika": {"mn": 495, "mx": 565},
+        "D3 Manajemen Informatika": {"mn": 480, "mx": 550},
+        "D3 Teknik Sipil": {"mn": 470, "mx": 540},
+        "D3 Teknik Pengairan": {"mn": 455, "mx": 525},
+        "D3 Statistika": {"mn": 470, "mx": 540},
+    },
+    "Universitas Sebelas Maret": {
+        "D3 Rekam Medis": {"mn": 490, "mx": 560},
+        "D3 Analis Kesehatan / TLM": {"mn": 495, "mx": 565},
+        "D3 Keperawatan": {"mn": 470, "mx": 540},
+        "D3 Kebidanan": {"mn": 465, "mx": 535},
+        "D3 Farmasi": {"mn": 480, "mx": 550},
+        "D3 Akuntansi": {"mn": 480, "mx": 550},
+        "D3 Perpajakan": {"mn": 470, "mx": 540},
+        "D3 Keuangan dan Perbankan": {"mn": 460, "mx": 530},
+        "D3 Manajemen Pemasaran": {"mn": 450, "mx": 520},
+        "D3 Manajemen Administrasi": {"mn": 450, "mx": 520},
+        "D3 Usaha Perjalanan Wisata": {"mn": 445, "mx": 515},
+        "D3 Komunikasi Terapan": {"mn": 450, "mx": 520},
+        "D3 Bahasa Inggris": {"mn": 455, "mx": 525},
+        "D3 Bahasa Mandarin": {"mn": 445, "mx": 515},
+        "D3 Bahasa Jepang": {"mn": 440, "mx": 510},
+        "D3 Teknik Informatika": {"mn": 480, "mx": 550},
+        "D3 Teknik Sipil": {"mn": 455, "mx": 525},
+        "D3 Teknik Kimia": {"mn": 445, "mx": 515},
+        "D3 Teknik Mesin": {"mn": 445, "mx": 515},
+        "D3 Statistika": {"mn": 455, "mx": 525},
+        "D3 Desain Komunikasi Visual": {"mn": 430, "mx": 500},
+    },
+    "Universitas Hasanuddin": {
+        "D3 Rekam Medis": {"mn": 480, "mx": 550},
+        "D3 Analis Kesehatan / TLM": {"mn": 480, "mx": 550},
+        "D3 Keperawatan": {"mn": 455, "mx": 525},
+        "D3 Kebidanan": {"mn": 450, "mx": 520},
+        "D3 Farmasi": {"mn": 465, "mx": 535},
+        "D3 Akuntansi": {"mn": 465, "mx": 535},
+        "D3 Perpajakan": {"mn": 455, "mx": 525},
+        "D3 Manajemen Pemasaran": {"mn": 445, "mx": 515},
+        "D3 Administrasi Bisnis": {"mn": 440, "mx": 510},
+        "D3 Teknik Informatika": {"mn": 470, "mx": 540},
+        "D3 Manajemen Informatika": {"mn": 455, "mx": 525},
+        "D3 Teknik Sipil": {"mn": 450, "mx": 520},
+        "D3 Teknik Elektro": {"mn": 455, "mx": 525},
+        "D3 Teknik Mesin": {"mn": 445, "mx": 515},
+        "D3 Statistika": {"mn": 450, "mx": 520},
+    },
+    "Universitas Sumatera Utara": {
+        "D3 Rekam Medis": {"mn": 460, "mx": 530},
+        "D3 Analis Kesehatan / TLM": {"mn": 465, "mx": 535},
+        "D3 Keperawatan": {"mn": 440, "mx": 510},
+        "D3 Kebidanan": {"mn": 435, "mx": 505},
+        "D3 Farmasi": {"mn": 450, "mx": 520},
+        "D3 Fisioterapi": {"mn": 445, "mx": 515},
+        "D3 Akuntansi": {"mn": 450, "mx": 520},
+        "D3 Perpajakan": {"mn": 440, "mx": 510},
+        "D3 Keuangan dan Perbankan": {"mn": 435, "mx": 505},
+        "D3 Manajemen Pemasaran": {"mn": 425, "mx": 495},
+        "D3 Administrasi Bisnis": {"mn": 420, "mx": 490},
+        "D3 Bahasa Inggris": {"mn": 435, "mx": 505},
+        "D3 Bahasa Jepang": {"mn": 420, "mx": 490},
+        "D3 Bahasa Mandarin": {"mn": 415, "mx": 485},
+        "D3 Teknik Informatika": {"mn": 460, "mx": 530},
+        "D3 Manajemen Informatika": {"mn": 445, "mx": 515},
+        "D3 Teknik Sipil": {"mn": 435, "mx": 505},
+        "D3 Teknik Elektro": {"mn": 435, "mx": 505},
+        "D3 Teknik Kimia": {"mn": 425, "mx": 495},
+        "D3 Statistika": {"mn": 435, "mx": 505},
+    },
+    "Universitas Andalas": {
+        "D3 Rekam Medis": {"mn": 450, "mx": 520},
+        "D3 Analis Kesehatan / TLM": {"mn": 455, "mx": 525},
+        "D3 Keperawatan": {"mn": 430, "mx": 500},
+        "D3 Kebidanan": {"mn": 425, "mx": 495},
+        "D3 Farmasi": {"mn": 445, "mx": 515},
+        "D3 Akuntansi": {"mn": 445, "mx": 515},
+        "D3 Perpajakan": {"mn": 435, "mx": 505},
+        "D3 Keuangan dan Perbankan": {"mn": 430, "mx": 500},
+        "D3 Manajemen Pemasaran": {"mn": 420, "mx": 490},
+        "D3 Teknik Informatika": {"mn": 455, "mx": 525},
+        "D3 Teknik Sipil": {"mn": 430, "mx": 500},
+        "D3 Teknik Elektro": {"mn": 430, "mx": 500},
+        "D3 Teknik Mesin": {"mn": 420, "mx": 490},
+    },
+    "Universitas Sriwijaya": {
+        "D3 Keperawatan": {"mn": 415, "mx": 485},
+        "D3 Kebidanan": {"mn": 410, "mx": 480},
+        "D3 Akuntansi": {"mn": 430, "mx": 500},
+        "D3 Perpajakan": {"mn": 420, "mx": 490},
+        "D3 Keuangan dan Perbankan": {"mn": 415, "mx": 485},
+        "D3 Manajemen Pemasaran": {"mn": 405, "mx": 475},
+        "D3 Administrasi Bisnis": {"mn": 400, "mx": 470},
+        "D3 Teknik Informatika": {"mn": 440, "mx": 510},
+        "D3 Teknik Sipil": {"mn": 415, "mx": 485},
+        "D3 Teknik Elektro": {"mn": 415, "mx": 485},
+        "D3 Teknik Mesin": {"mn": 405, "mx": 475},
+        "D3 Teknik Kimia": {"mn": 405, "mx": 475},
+    },
+    "Universitas Udayana": {
+        "D3 Rekam Medis": {"mn": 450, "mx": 520},
+        "D3 Analis Kesehatan / TLM": {"mn": 455, "mx": 525},
+        "D3 Keperawatan": {"mn": 430, "mx": 500},
+        "D3 Kebidanan": {"mn": 425, "mx": 495},
+        "D3 Farmasi": {"mn": 445, "mx": 515},
+        "D3 Fisioterapi": {"mn": 440, "mx": 510},
+        "D3 Akuntansi": {"mn": 445, "mx": 515},
+        "D3 Perpajakan": {"mn": 435, "mx": 505},
+        "D3 Keuangan dan Perbankan": {"mn": 430, "mx": 500},
+        "D3 Manajemen Pemasaran": {"mn": 420, "mx": 490},
+        "D3 Administrasi Bisnis": {"mn": 415, "mx": 485},
+        "D3 Teknik Informatika": {"mn": 455, "mx": 525},
+        "D3 Teknik Sipil": {"mn": 430, "mx": 500},
+        "D3 Pariwisata": {"mn": 450, "mx": 520},
+        "D3 Bahasa Inggris": {"mn": 430, "mx": 500},
+    },
+    "Universitas Jember": {
+        "D3 Rekam Medis": {"mn": 435, "mx": 505},
+        "D3 Analis Kesehatan / TLM": {"mn": 440, "mx": 510},
+        "D3 Keperawatan": {"mn": 415, "mx": 485},
+        "D3 Kebidanan": {"mn": 410, "mx": 480},
+        "D3 Farmasi": {"mn": 430, "mx": 500},
+        "D3 Akuntansi": {"mn": 430, "mx": 500},
+        "D3 Perpajakan": {"mn": 420, "mx": 490},
+        "D3 Manajemen Pemasaran": {"mn": 405, "mx": 475},
+        "D3 Manajemen Agribisnis": {"mn": 400, "mx": 470},
+        "D3 Teknik Informatika": {"mn": 440, "mx": 510},
+        "D3 Manajemen Perusahaan": {"mn": 405, "mx": 475},
+        "D3 Usaha Perjalanan Wisata": {"mn": 400, "mx": 470},
+    },
+    "Universitas Lampung": {
+        "D3 Keperawatan": {"mn": 405, "mx": 475},
+        "D3 Kebidanan": {"mn": 400, "mx": 470},
+        "D3 Akuntansi": {"mn": 415, "mx": 485},
+        "D3 Perpajakan": {"mn": 405, "mx": 475},
+        "D3 Manajemen Pemasaran": {"mn": 415, "mx": 485},
+        "D3 Administrasi Bisnis": {"mn": 415, "mx": 485},
+        "D3 Teknik Informatika": {"mn": 425, "mx": 495},
+        "D3 Manajemen Informatika": {"mn": 410, "mx": 480},
+        "D3 Teknik Sipil": {"mn": 400, "mx": 470},
+        "D3 Teknik Elektro": {"mn": 400, "mx": 470},
+    },
+    "Universitas Negeri Yogyakarta": {
+        "D3 Teknik Elektro": {"mn": 450, "mx": 520},
+        "D3 Teknik Mesin": {"mn": 445, "mx": 515},
+        "D3 Teknik Sipil dan Perencanaan": {"mn": 445, "mx": 515},
+        "D3 Teknik Elektronika": {"mn": 445, "mx": 515},
+        "D3 Tata Boga": {"mn": 415, "mx": 485},
+        "D3 Tata Busana": {"mn": 405, "mx": 475},
+        "D3 Tata Rias dan Kecantikan": {"mn": 405, "mx": 475},
+        "D3 Manajemen Pemasaran": {"mn": 420, "mx": 490},
+        "D3 Akuntansi": {"mn": 430, "mx": 500},
+        "D3 Teknik Informatika": {"mn": 455, "mx": 525},
+    },
+    "Universitas Negeri Malang": {
+        "D3 Teknik Elektro": {"mn": 440, "mx": 510},
+        "D3 Teknik Mesin": {"mn": 435, "mx": 505},
+        "D3 Teknik Sipil": {"mn": 435, "mx": 505},
+        "D3 Manajemen Pemasaran": {"mn": 410, "mx": 480},
+        "D3 Akuntansi": {"mn": 420, "mx": 490},
+        "D3 Teknik Informatika": {"mn": 445, "mx": 515},
+        "D3 Desain Komunikasi Visual": {"mn": 405, "mx": 475},
+    },
+    "Universitas Negeri Semarang": {
+        "D3 Teknik Elektro": {"mn": 430, "mx": 500},
+        "D3 Teknik Mesin": {"mn": 425, "mx": 495},
+        "D3 Teknik Sipil": {"mn": 425, "mx": 495},
+        "D3 Teknik Kimia": {"mn": 415, "mx": 485},
+        "D3 Manajemen Pemasaran": {"mn": 400, "mx": 470},
+        "D3 Akuntansi": {"mn": 410, "mx": 480},
+        "D3 Teknik Informatika": {"mn": 435, "mx": 505},
+        "D3 Desain Komunikasi Visual": {"mn": 400, "mx": 470},
+        "D3 Tata Boga": {"mn": 400, "mx": 470},
+    },
+    "Universitas Pendidikan Indonesia": {
+        "D3 Teknik Elektro": {"mn": 445, "mx": 515},
+        "D3 Teknik Mesin": {"mn": 435, "mx": 505},
+        "D3 Teknik Sipil": {"mn": 435, "mx": 505},
+        "D3 Manajemen Pemasaran": {"mn": 410, "mx": 480},
+        "D3 Akuntansi": {"mn": 420, "mx": 490},
+        "D3 Teknik Informatika": {"mn": 450, "mx": 520},
+        "D3 Bahasa Inggris": {"mn": 430, "mx": 500},
+        "D3 Desain Komunikasi Visual": {"mn": 410, "mx": 480},
+        "D3 Tata Boga": {"mn": 405, "mx": 475},
+        "D3 Tata Busana": {"mn": 400, "mx": 470},
+    },
+}
+
+PTN_PRODI_D4 = {
+    # ── POLITEKNIK ──
+    "Politeknik Negeri Bandung": {
+        "D4 Teknik Informatika": {"mn": 580, "mx": 650},
+        "D4 Teknik Komputer": {"mn": 565, "mx": 635},
+        "D4 Teknik Telekomunikasi": {"mn": 555, "mx": 625},
+        "D4 Teknik Elektro": {"mn": 555, "mx": 625},
+        "D4 Teknik Mesin": {"mn": 545, "mx": 615},
+        "D4 Teknik Otomasi": {"mn": 555, "mx": 625},
+        "D4 Teknik Sipil": {"mn": 545, "mx": 615},
+        "D4 Teknik Kimia": {"mn": 535, "mx": 605},
+        "D4 Teknologi Rekayasa Lingkungan": {"mn": 530, "mx": 600},
+        "D4 Akuntansi Sektor Publik": {"mn": 545, "mx": 615},
+        "D4 Keuangan dan Perbankan": {"mn": 535, "mx": 605},
+        "D4 Manajemen Pemasaran": {"mn": 525, "mx": 595},
+        "D4 Administrasi Bisnis": {"mn": 525, "mx": 595},
+        "D4 Manajemen Penilaian Properti": {"mn": 520, "mx": 590},
+        "D4 Manajemen Pariwisata": {"mn": 510, "mx": 580},
+        "D4 Logistik": {"mn": 525, "mx": 595},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 540, "mx": 610},
+        "D4 Teknik Mekatronika": {"mn": 550, "mx": 620},
+        "D4 Teknik Geomatika": {"mn": 530, "mx": 600},
+        "D4 Bahasa Inggris Terapan": {"mn": 510, "mx": 580},
+    },
+    "Politeknik Negeri Jakarta": {
+        "D4 Teknik Informatika": {"mn": 560, "mx": 630},
+        "D4 Teknik Komputer": {"mn": 545, "mx": 615},
+        "D4 Teknik Elektro": {"mn": 545, "mx": 615},
+        "D4 Teknik Mesin": {"mn": 535, "mx": 605},
+        "D4 Teknik Sipil": {"mn": 535, "mx": 605},
+        "D4 Teknik Kimia": {"mn": 520, "mx": 590},
+        "D4 Akuntansi Sektor Publik": {"mn": 525, "mx": 595},
+        "D4 Keuangan dan Perbankan": {"mn": 515, "mx": 585},
+        "D4 Manajemen Pemasaran": {"mn": 505, "mx": 575},
+        "D4 Administrasi Bisnis": {"mn": 505, "mx": 575},
+        "D4 Teknik Mekatronika": {"mn": 530, "mx": 600},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 520, "mx": 590},
+        "D4 Manajemen Logistik": {"mn": 505, "mx": 575},
+        "D4 Perbankan Syariah": {"mn": 500, "mx": 570},
+        "D4 Teknologi Rekayasa Konstruksi Bangunan Gedung": {"mn": 510, "mx": 580},
+    },
+    "Politeknik Negeri Semarang": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 555, "mx": 625},
+        "D4 Teknik Informatika": {"mn": 560, "mx": 630},
+        "D4 Teknik Elektro": {"mn": 540, "mx": 610},
+        "D4 Teknik Telekomunikasi": {"mn": 535, "mx": 605},
+        "D4 Teknik Mesin": {"mn": 530, "mx": 600},
+        "D4 Teknik Sipil": {"mn": 530, "mx": 600},
+        "D4 Teknik Kimia": {"mn": 520, "mx": 590},
+        "D4 Akuntansi Sektor Publik": {"mn": 525, "mx": 595},
+        "D4 Keuangan dan Perbankan": {"mn": 515, "mx": 585},
+        "D4 Manajemen Pemasaran": {"mn": 505, "mx": 575},
+        "D4 Administrasi Bisnis": {"mn": 500, "mx": 570},
+        "D4 Teknik Otomasi": {"mn": 530, "mx": 600},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 520, "mx": 590},
+        "D4 Logistik Bisnis": {"mn": 505, "mx": 575},
+    },
+    "Politeknik Negeri Malang": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 545, "mx": 615},
+        "D4 Teknik Informatika": {"mn": 550, "mx": 620},
+        "D4 Teknik Elektro": {"mn": 530, "mx": 600},
+        "D4 Teknik Mesin": {"mn": 520, "mx": 590},
+        "D4 Teknik Sipil": {"mn": 520, "mx": 590},
+        "D4 Teknik Kimia": {"mn": 510, "mx": 580},
+        "D4 Akuntansi Sektor Publik": {"mn": 515, "mx": 585},
+        "D4 Keuangan dan Perbankan": {"mn": 505, "mx": 575},
+        "D4 Manajemen Pemasaran": {"mn": 495, "mx": 565},
+        "D4 Administrasi Bisnis": {"mn": 490, "mx": 560},
+        "D4 Teknik Otomasi": {"mn": 520, "mx": 590},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 510, "mx": 580},
+        "D4 Manajemen Energi": {"mn": 495, "mx": 565},
+        "D4 Teknologi Rekayasa Kimia": {"mn": 505, "mx": 575},
+    },
+    "Politeknik Negeri Medan": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 520, "mx": 590},
+        "D4 Teknik Informatika": {"mn": 525, "mx": 595},
+        "D4 Teknik Elektro": {"mn": 510, "mx": 580},
+        "D4 Teknik Mesin": {"mn": 500, "mx": 570},
+        "D4 Teknik Sipil": {"mn": 500, "mx": 570},
+        "D4 Teknik Kimia": {"mn": 490, "mx": 560},
+        "D4 Akuntansi Sektor Publik": {"mn": 495, "mx": 565},
+        "D4 Keuangan dan Perbankan": {"mn": 485, "mx": 555},
+        "D4 Manajemen Pemasaran": {"mn": 475, "mx": 545},
+        "D4 Administrasi Bisnis": {"mn": 470, "mx": 540},
+        "D4 Teknik Otomasi": {"mn": 500, "mx": 570},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 490, "mx": 560},
+        "D4 Teknologi Rekayasa Konstruksi Gedung": {"mn": 485, "mx": 555},
+    },
+    "Politeknik Negeri Ujung Pandang": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 515, "mx": 585},
+        "D4 Teknik Informatika": {"mn": 520, "mx": 590},
+        "D4 Teknik Elektro": {"mn": 505, "mx": 575},
+        "D4 Teknik Mesin": {"mn": 495, "mx": 565},
+        "D4 Teknik Sipil": {"mn": 495, "mx": 565},
+        "D4 Teknik Kimia": {"mn": 485, "mx": 555},
+        "D4 Akuntansi Sektor Publik": {"mn": 490, "mx": 560},
+        "D4 Administrasi Bisnis": {"mn": 465, "mx": 535},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 485, "mx": 555},
+        "D4 Manajemen Pariwisata": {"mn": 465, "mx": 535},
+        "D4 Teknologi Rekayasa Pertambangan": {"mn": 470, "mx": 540},
+    },
+    "Politeknik Negeri Bali": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 510, "mx": 580},
+        "D4 Teknik Informatika": {"mn": 515, "mx": 585},
+        "D4 Teknik Elektro": {"mn": 500, "mx": 570},
+        "D4 Teknik Mesin": {"mn": 490, "mx": 560},
+        "D4 Teknik Sipil": {"mn": 490, "mx": 560},
+        "D4 Akuntansi Sektor Publik": {"mn": 485, "mx": 555},
+        "D4 Administrasi Bisnis": {"mn": 460, "mx": 530},
+        "D4 Manajemen Pariwisata": {"mn": 480, "mx": 550},
+        "D4 Perhotelan": {"mn": 470, "mx": 540},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 480, "mx": 550},
+    },
+    "Politeknik Elektronika Negeri Surabaya": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 580, "mx": 650},
+        "D4 Teknik Informatika": {"mn": 585, "mx": 655},
+        "D4 Teknik Komputer": {"mn": 570, "mx": 640},
+        "D4 Teknik Telekomunikasi": {"mn": 560, "mx": 630},
+        "D4 Teknik Mekatronika": {"mn": 565, "mx": 635},
+        "D4 Teknologi Informasi": {"mn": 575, "mx": 645},
+        "D4 Teknik Elektro Industri": {"mn": 555, "mx": 625},
+        "D4 Teknologi Rekayasa Komputer": {"mn": 570, "mx": 640},
+    },
+    "Politeknik Manufaktur Negeri Bandung": {
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 560, "mx": 630},
+        "D4 Teknik Otomasi Industri": {"mn": 555, "mx": 625},
+        "D4 Teknik Perancangan dan Konstruksi Mesin": {"mn": 545, "mx": 615},
+        "D4 Manajemen Produksi": {"mn": 530, "mx": 600},
+        "D4 Teknik Kimia Polimer": {"mn": 530, "mx": 600},
+    },
+    "Politeknik Perkapalan Negeri Surabaya": {
+        "D4 Teknik Perkapalan": {"mn": 555, "mx": 625},
+        "D4 Teknik Permesinan Kapal": {"mn": 545, "mx": 615},
+        "D4 Teknik Kelistrikan Kapal": {"mn": 540, "mx": 610},
+        "D4 Teknik Desain dan Manufaktur": {"mn": 540, "mx": 610},
+        "D4 Teknik Keselamatan dan Kesehatan Kerja": {"mn": 530, "mx": 600},
+        "D4 Teknologi Pengelasan Kapal": {"mn": 530, "mx": 600},
+    },
+
+    # ── UNIVERSITAS (D4 yang benar-benar ada) ──
+    "Universitas Indonesia": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 580, "mx": 650},
+        "D4 Fisioterapi": {"mn": 575, "mx": 645},
+        "D4 Gizi Klinik": {"mn": 570, "mx": 640},
+        "D4 Keperawatan": {"mn": 555, "mx": 625},
+        "D4 Kebidanan": {"mn": 545, "mx": 615},
+        "D4 Teknik Geomatika": {"mn": 580, "mx": 650},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 640, "mx": 710},
+        "D4 Teknologi Informasi": {"mn": 630, "mx": 700},
+        "D4 Teknik Mekatronika": {"mn": 600, "mx": 670},
+        "D4 Teknik Perkapalan": {"mn": 580, "mx": 650},
+        "D4 Teknologi Pangan": {"mn": 575, "mx": 645},
+        "D4 Keselamatan dan Kesehatan Kerja": {"mn": 565, "mx": 635},
+        "D4 Akuntansi Sektor Publik": {"mn": 580, "mx": 650},
+        "D4 Administrasi Bisnis": {"mn": 570, "mx": 640},
+        "D4 Manajemen Pariwisata": {"mn": 555, "mx": 625},
+        "D4 Bahasa Inggris Terapan": {"mn": 545, "mx": 615},
+    },
+    "Institut Teknologi Bandung": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 660, "mx": 730},
+        "D4 Teknologi Informasi": {"mn": 650, "mx": 720},
+        "D4 Teknik Mekatronika": {"mn": 635, "mx": 705},
+        "D4 Teknologi Rekayasa Kimia": {"mn": 615, "mx": 685},
+        "D4 Teknologi Rekayasa Lingkungan": {"mn": 605, "mx": 675},
+        "D4 Teknik Geomatika": {"mn": 610, "mx": 680},
+        "D4 Teknik Perkapalan": {"mn": 610, "mx": 680},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 620, "mx": 690},
+        "D4 Teknik Otomasi": {"mn": 630, "mx": 700},
+        "D4 Keselamatan dan Kesehatan Kerja": {"mn": 595, "mx": 665},
+        "D4 Teknologi Pangan": {"mn": 600, "mx": 670},
+        "D4 Gizi Klinik": {"mn": 595, "mx": 665},
+        "D4 Manajemen Bisnis": {"mn": 640, "mx": 710},
+        "D4 Logistik dan Supply Chain": {"mn": 610, "mx": 680},
+    },
+    "Institut Teknologi Sepuluh Nopember": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 625, "mx": 695},
+        "D4 Teknologi Informasi": {"mn": 615, "mx": 685},
+        "D4 Teknik Mekatronika": {"mn": 605, "mx": 675},
+        "D4 Teknologi Rekayasa Kimia": {"mn": 585, "mx": 655},
+        "D4 Teknologi Rekayasa Lingkungan": {"mn": 575, "mx": 645},
+        "D4 Teknik Geomatika": {"mn": 580, "mx": 650},
+        "D4 Teknik Perkapalan": {"mn": 580, "mx": 650},
+        "D4 Teknik Kelautan Terapan": {"mn": 570, "mx": 640},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 585, "mx": 655},
+        "D4 Teknik Otomasi": {"mn": 595, "mx": 665},
+        "D4 Keselamatan dan Kesehatan Kerja": {"mn": 565, "mx": 635},
+        "D4 Manajemen Bisnis": {"mn": 595, "mx": 665},
+        "D4 Logistik dan Supply Chain": {"mn": 575, "mx": 645},
+        "D4 Statistika Bisnis": {"mn": 580, "mx": 650},
+    },
+    "Institut Pertanian Bogor": {
+        "D4 Teknologi Pangan": {"mn": 560, "mx": 630},
+        "D4 Teknologi Rekayasa Pertanian": {"mn": 540, "mx": 610},
+        "D4 Manajemen Agribisnis": {"mn": 530, "mx": 600},
+        "D4 Teknologi Industri Benih": {"mn": 515, "mx": 585},
+        "D4 Supervisor Jaminan Mutu Pangan": {"mn": 520, "mx": 590},
+        "D4 Ekowisata": {"mn": 500, "mx": 570},
+        "D4 Teknik dan Manajemen Lingkungan Hidup": {"mn": 510, "mx": 580},
+        "D4 Manajemen Informatika": {"mn": 530, "mx": 600},
+        "D4 Akuntansi Alih Program": {"mn": 510, "mx": 580},
+    },
+    "Universitas Gadjah Mada": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 620, "mx": 690},
+        "D4 Teknologi Informasi": {"mn": 610, "mx": 680},
+        "D4 Teknik Mekatronika": {"mn": 595, "mx": 665},
+        "D4 Teknologi Rekayasa Kimia": {"mn": 570, "mx": 640},
+        "D4 Teknologi Rekayasa Lingkungan": {"mn": 560, "mx": 630},
+        "D4 Teknik Geomatika": {"mn": 565, "mx": 635},
+        "D4 Teknik Pengelolaan dan Pemeliharaan Infrastruktur Sipil": {"mn": 550, "mx": 620},
+        "D4 Teknologi Rekayasa Manufaktur": {"mn": 565, "mx": 635},
+        "D4 Teknik Otomasi": {"mn": 575, "mx": 645},
+        "D4 Keselamatan dan Kesehatan Kerja": {"mn": 545, "mx": 615},
+        "D4 Gizi Klinik": {"mn": 555, "mx": 625},
+        "D4 Fisioterapi": {"mn": 555, "mx": 625},
+        "D4 Teknologi Laboratorium Medis": {"mn": 560, "mx": 630},
+        "D4 Teknologi Pangan": {"mn": 555, "mx": 625},
+        "D4 Manajemen Bisnis": {"mn": 590, "mx": 660},
+        "D4 Logistik dan Supply Chain": {"mn": 560, "mx": 630},
+        "D4 Manajemen Penilaian Properti": {"mn": 545, "mx": 615},
+        "D4 Manajemen Pariwisata": {"mn": 545, "mx": 615},
+        "D4 Bahasa Inggris Terapan": {"mn": 530, "mx": 600},
+        "D4 Akuntansi Sektor Publik": {"mn": 560, "mx": 630},
+    },
+    "Universitas Airlangga": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 560, "mx": 630},
+        "D4 Fisioterapi": {"mn": 555, "mx": 625},
+        "D4 Gizi Klinik": {"mn": 550, "mx": 620},
+        "D4 Keperawatan": {"mn": 535, "mx": 605},
+        "D4 Kebidanan": {"mn": 530, "mx": 600},
+        "D4 Rekam Medis dan Informasi Kesehatan": {"mn": 540, "mx": 610},
+        "D4 Keselamatan dan Kesehatan Kerja": {"mn": 530, "mx": 600},
+        "D4 Teknologi Pangan": {"mn": 540, "mx": 610},
+        "D4 Akuntansi Sektor Publik": {"mn": 540, "mx": 610},
+        "D4 Manajemen Pemasaran": {"mn": 530, "mx": 600},
+        "D4 Keuangan dan Perbankan": {"mn": 530, "mx": 600},
+        "D4 Administrasi Bisnis": {"mn": 520, "mx": 590},
+        "D4 Manajemen Pariwisata": {"mn": 515, "mx": 585},
+        "D4 Bahasa Inggris Terapan": {"mn": 510, "mx": 580},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 565, "mx": 635},
+    },
+    "Universitas Padjadjaran": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 545, "mx": 615},
+        "D4 Fisioterapi": {"mn": 540, "mx": 610},
+        "D4 Gizi Klinik": {"mn": 535, "mx": 605},
+        "D4 Keperawatan": {"mn": 520, "mx": 590},
+        "D4 Kebidanan": {"mn": 515, "mx": 585},
+        "D4 Keselamatan dan Kesehatan Kerja": {"mn": 515, "mx": 585},
+        "D4 Teknologi Pangan": {"mn": 525, "mx": 595},
+        "D4 Akuntansi Sektor Publik": {"mn": 525, "mx": 595},
+        "D4 Manajemen Pemasaran": {"mn": 515, "mx": 585},
+        "D4 Administrasi Bisnis": {"mn": 505, "mx": 575},
+        "D4 Manajemen Pariwisata": {"mn": 505, "mx": 575},
+        "D4 Bahasa Inggris Terapan": {"mn": 495, "mx": 565},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 550, "mx": 620},
+        "D4 Teknologi Informasi": {"mn": 545, "mx": 615},
+    },
+    "Universitas Diponegoro": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 520, "mx": 590},
+        "D4 Fisioterapi": {"mn": 515, "mx": 585},
+        "D4 Gizi Klinik": {"mn": 510, "mx": 580},
+        "D4 Keperawatan": {"mn": 495, "mx": 565},
+        "D4 Kebidanan": {"mn": 490, "mx": 560},
+        "D4 Keselamatan dan Kesehatan Kerja": {"mn": 490, "mx": 560},
+        "D4 Teknologi Pangan": {"mn": 500, "mx": 570},
+        "D4 Akuntansi Sektor Publik": {"mn": 500, "mx": 570},
+        "D4 Manajemen Pemasaran": {"mn": 490, "mx": 560},
+        "D4 Administrasi Bisnis": {"mn": 480, "mx": 550},
+        "D4 Teknik Geomatika": {"mn": 495, "mx": 565},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 525, "mx": 595},
+        "D4 Teknologi Informasi": {"mn": 515, "mx": 585},
+        "D4 Teknik Mekatronika": {"mn": 505, "mx": 575},
+        "D4 Teknologi Rekayasa Kimia": {"mn": 490, "mx": 560},
+    },
+    "Universitas Brawijaya": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 505, "mx": 575},
+        "D4 Gizi Klinik": {"mn": 495, "mx": 565},
+        "D4 Keperawatan": {"mn": 480, "mx": 550},
+        "D4 Kebidanan": {"mn": 475, "mx": 545},
+        "D4 Keselamatan dan Kesehatan Kerja": {"mn": 475, "mx": 545},
+        "D4 Teknologi Pangan": {"mn": 490, "mx": 560},
+        "D4 Akuntansi Sektor Publik": {"mn": 490, "mx": 560},
+        "D4 Manajemen Pemasaran": {"mn": 475, "mx": 545},
+        "D4 Administrasi Bisnis": {"mn": 465, "mx": 535},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 510, "mx": 580},
+        "D4 Teknologi Informasi": {"mn": 500, "mx": 570},
+        "D4 Teknik Pengairan Terapan": {"mn": 465, "mx": 535},
+        "D4 Manajemen Agribisnis": {"mn": 465, "mx": 535},
+    },
+    "Universitas Sebelas Maret": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 495, "mx": 565},
+        "D4 Fisioterapi": {"mn": 490, "mx": 560},
+        "D4 Gizi Klinik": {"mn": 485, "mx": 555},
+        "D4 Keperawatan": {"mn": 470, "mx": 540},
+        "D4 Kebidanan": {"mn": 465, "mx": 535},
+        "D4 Keselamatan dan Kesehatan Kerja": {"mn": 465, "mx": 535},
+        "D4 Teknologi Pangan": {"mn": 480, "mx": 550},
+        "D4 Akuntansi Sektor Publik": {"mn": 480, "mx": 550},
+        "D4 Manajemen Pemasaran": {"mn": 465, "mx": 535},
+        "D4 Manajemen Pariwisata": {"mn": 455, "mx": 525},
+        "D4 Usaha Perjalanan Wisata": {"mn": 450, "mx": 520},
+        "D4 Bahasa Inggris Terapan": {"mn": 455, "mx": 525},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 495, "mx": 565},
+        "D4 Teknologi Informasi": {"mn": 485, "mx": 555},
+        "D4 Desain Komunikasi Visual": {"mn": 445, "mx": 515},
+    },
+    "Universitas Hasanuddin": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 485, "mx": 555},
+        "D4 Fisioterapi": {"mn": 480, "mx": 550},
+        "D4 Gizi Klinik": {"mn": 475, "mx": 545},
+        "D4 Keperawatan": {"mn": 460, "mx": 530},
+        "D4 Kebidanan": {"mn": 455, "mx": 525},
+        "D4 Teknologi Pangan": {"mn": 465, "mx": 535},
+        "D4 Akuntansi Sektor Publik": {"mn": 465, "mx": 535},
+        "D4 Manajemen Pemasaran": {"mn": 450, "mx": 520},
+        "D4 Administrasi Bisnis": {"mn": 445, "mx": 515},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 480, "mx": 550},
+        "D4 Teknologi Informasi": {"mn": 470, "mx": 540},
+        "D4 Teknik Geomatika": {"mn": 455, "mx": 525},
+    },
+    "Universitas Sumatera Utara": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 470, "mx": 540},
+        "D4 Fisioterapi": {"mn": 455, "mx": 525},
+        "D4 Gizi Klinik": {"mn": 460, "mx": 530},
+        "D4 Keperawatan": {"mn": 445, "mx": 515},
+        "D4 Kebidanan": {"mn": 440, "mx": 510},
+        "D4 Teknologi Pangan": {"mn": 450, "mx": 520},
+        "D4 Akuntansi Sektor Publik": {"mn": 450, "mx": 520},
+        "D4 Manajemen Pemasaran": {"mn": 435, "mx": 505},
+        "D4 Administrasi Bisnis": {"mn": 430, "mx": 500},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 465, "mx": 535},
+        "D4 Teknologi Informasi": {"mn": 455, "mx": 525},
+        "D4 Bahasa Inggris Terapan": {"mn": 430, "mx": 500},
+    },
+    "Universitas Andalas": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 455, "mx": 525},
+        "D4 Gizi Klinik": {"mn": 450, "mx": 520},
+        "D4 Keperawatan": {"mn": 435, "mx": 505},
+        "D4 Kebidanan": {"mn": 430, "mx": 500},
+        "D4 Teknologi Pangan": {"mn": 440, "mx": 510},
+        "D4 Akuntansi Sektor Publik": {"mn": 440, "mx": 510},
+        "D4 Manajemen Pemasaran": {"mn": 425, "mx": 495},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 455, "mx": 525},
+        "D4 Teknologi Informasi": {"mn": 445, "mx": 515},
+    },
+    "Universitas Sriwijaya": {
+        "D4 Gizi Klinik": {"mn": 430, "mx": 500},
+        "D4 Keperawatan": {"mn": 415, "mx": 485},
+        "D4 Kebidanan": {"mn": 410, "mx": 480},
+        "D4 Teknologi Pangan": {"mn": 420, "mx": 490},
+        "D4 Akuntansi Sektor Publik": {"mn": 420, "mx": 490},
+        "D4 Manajemen Pemasaran": {"mn": 405, "mx": 475},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 435, "mx": 505},
+        "D4 Teknologi Informasi": {"mn": 425, "mx": 495},
+    },
+    "Universitas Udayana": {
+        "D4 Teknologi Laboratorium Medis": {"mn": 455, "mx": 525},
+        "D4 Fisioterapi": {"mn": 450, "mx": 520},
+        "D4 Gizi Klinik": {"mn": 445, "mx": 515},
+        "D4 Keperawatan": {"mn": 430, "mx": 500},
+        "D4 Kebidanan": {"mn": 425, "mx": 495},
+        "D4 Teknologi Pangan": {"mn": 435, "mx": 505},
+        "D4 Akuntansi Sektor Publik": {"mn": 440, "mx": 510},
+        "D4 Manajemen Pemasaran": {"mn": 420, "mx": 490},
+        "D4 Administrasi Bisnis": {"mn": 415, "mx": 485},
+        "D4 Manajemen Pariwisata": {"mn": 440, "mx": 510},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 450, "mx": 520},
+        "D4 Teknologi Informasi": {"mn": 440, "mx": 510},
+    },
+    "Universitas Jember": {
+        "D4 Gizi Klinik": {"mn": 430, "mx": 500},
+        "D4 Keperawatan": {"mn": 415, "mx": 485},
+        "D4 Kebidanan": {"mn": 410, "mx": 480},
+        "D4 Teknologi Pangan": {"mn": 425, "mx": 495},
+        "D4 Akuntansi Sektor Publik": {"mn": 420, "mx": 490},
+        "D4 Manajemen Pemasaran": {"mn": 405, "mx": 475},
+        "D4 Manajemen Agribisnis": {"mn": 400, "mx": 470},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 435, "mx": 505},
+        "D4 Teknologi Informasi": {"mn": 425, "mx": 495},
+    },
+    "Universitas Lampung": {
+        "D4 Keperawatan": {"mn": 405, "mx": 475},
+        "D4 Kebidanan": {"mn": 400, "mx": 470},
+        "D4 Akuntansi Sektor Publik": {"mn": 410, "mx": 480},
+        "D4 Manajemen Pemasaran": {"mn": 415, "mx": 485},
+        "D4 Rekayasa Perangkat Lunak": {"mn": 420, "mx": 490},
+        "D4 Teknologi Informasi": {"mn": 410, "mx": 480},
+    },
+    "Universitas Negeri Yogyakarta": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 490, "mx": 560},
+        "D4 Teknologi Informasi": {"mn": 480, "mx": 550},
+        "D4 Teknik Otomasi Industri": {"mn": 470, "mx": 540},
+        "D4 Manajemen Pemasaran": {"mn": 440, "mx": 510},
+        "D4 Akuntansi Manajerial": {"mn": 445, "mx": 515},
+        "D4 Tata Boga": {"mn": 420, "mx": 490},
+        "D4 Tata Busana": {"mn": 415, "mx": 485},
+    },
+    "Universitas Negeri Malang": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 480, "mx": 550},
+        "D4 Teknologi Informasi": {"mn": 470, "mx": 540},
+        "D4 Teknik Otomasi Industri": {"mn": 460, "mx": 530},
+        "D4 Manajemen Pemasaran": {"mn": 430, "mx": 500},
+        "D4 Akuntansi Manajerial": {"mn": 435, "mx": 505},
+    },
+    "Universitas Negeri Semarang": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 465, "mx": 535},
+        "D4 Teknologi Informasi": {"mn": 455, "mx": 525},
+        "D4 Akuntansi Manajerial": {"mn": 420, "mx": 490},
+        "D4 Manajemen Pemasaran": {"mn": 415, "mx": 485},
+        "D4 Tata Boga": {"mn": 405, "mx": 475},
+    },
+    "Universitas Pendidikan Indonesia": {
+        "D4 Rekayasa Perangkat Lunak": {"mn": 470, "mx": 540},
+        "D4 Teknologi Informasi": {"mn": 460, "mx": 530},
+        "D4 Teknik Otomasi Industri": {"mn": 455, "mx": 525},
+        "D4 Akuntansi Manajerial": {"mn": 430, "mx": 500},
+        "D4 Manajemen Pemasaran": {"mn": 425, "mx": 495},
+        "D4 Bahasa Inggris Terapan": {"mn": 435, "mx": 505},
+        "D4 Tata Boga": {"mn": 410, "mx": 480},
+        "D4 Tata Busana": {"mn": 405, "mx": 475},
+    },
+}
+
+
+# ══════════════════════════════════════════════════════════
+# DATABASE PRODI S1 AKURAT PER KAMPUS
+# Sumber: website resmi masing-masing PTN & SNPMB 2022-2024
+# ══════════════════════════════════════════════════════════
+PTN_PRODI_S1 = {
+    "Universitas Indonesia": {
+        # FK / FKG / FF / FIK
+        "Pendidikan Dokter": {"mn": 760, "mx": 830},
+        "Kedokteran Gigi": {"mn": 710, "mx": 780},
+        "Farmasi": {"mn": 680, "mx": 750},
+        "Ilmu Keperawatan": {"mn": 620, "mx": 690},
+        "Kesehatan Masyarakat": {"mn": 620, "mx": 690},
+        "Gizi": {"mn": 620, "mx": 685},
+        "Ilmu Keolahragaan": {"mn": 560, "mx": 630},
+        # FTUI
+        "Teknik Sipil": {"mn": 660, "mx": 730},
+        "Teknik Mesin": {"mn": 660, "mx": 730},
+        "Teknik Elektro": {"mn": 690, "mx": 760},
+        "Teknik Kimia": {"mn": 660, "mx": 730},
+        "Teknik Industri": {"mn": 700, "mx": 770},
+        "Teknik Lingkungan": {"mn": 640, "mx": 710},
+        "Teknik Metalurgi dan Material": {"mn": 630, "mx": 700},
+        "Teknik Perkapalan": {"mn": 620, "mx": 690},
+        "Arsitektur": {"mn": 670, "mx": 740},
+        "Teknik Komputer": {"mn": 700, "mx": 770},
+        # FMIPA
+        "Matematika": {"mn": 640, "mx": 710},
+        "Fisika": {"mn": 630, "mx": 700},
+        "Kimia": {"mn": 640, "mx": 710},
+        "Biologi": {"mn": 640, "mx": 710},
+        "Ilmu Komputer": {"mn": 730, "mx": 800},
+        "Statistika": {"mn": 660, "mx": 730},
+        "Geografi": {"mn": 620, "mx": 690},
+        # FH
+        "Ilmu Hukum": {"mn": 680, "mx": 750},
+        # FEB
+        "Ilmu Ekonomi": {"mn": 670, "mx": 740},
+        "Akuntansi": {"mn": 700, "mx": 770},
+        "Manajemen": {"mn": 710, "mx": 780},
+        # FISIP
+        "Ilmu Komunikasi": {"mn": 680, "mx": 750},
+        "Hubungan Internasional": {"mn": 700, "mx": 770},
+        "Sosiologi": {"mn": 640, "mx": 710},
+        "Ilmu Politik": {"mn": 650, "mx": 720},
+        "Ilmu Administrasi Fiskal": {"mn": 650, "mx": 720},
+        "Ilmu Administrasi Niaga": {"mn": 660, "mx": 730},
+        "Administrasi Negara": {"mn": 650, "mx": 720},
+        "Ilmu Perpustakaan": {"mn": 590, "mx": 660},
+        "Ilmu Kesejahteraan Sosial": {"mn": 620, "mx": 690},
+        "Kriminologi": {"mn": 640, "mx": 710},
+        # FIB
+        "Sastra Indonesia": {"mn": 600, "mx": 670},
+        "Sastra Inggris": {"mn": 630, "mx": 700},
+        "Sastra Arab": {"mn": 590, "mx": 660},
+        "Sastra Jepang": {"mn": 620, "mx": 690},
+        "Sastra Belanda": {"mn": 580, "mx": 650},
+        "Sastra Prancis": {"mn": 580, "mx": 650},
+        "Sastra Cina": {"mn": 590, "mx": 660},
+        "Filsafat": {"mn": 600, "mx": 670},
+        # FPsi
+        "Psikologi": {"mn": 680, "mx": 750},
+        # FIA
+        "Administrasi Bisnis": {"mn": 640, "mx": 710},
+    },
+    "Institut Teknologi Bandung": {
+        # FTSL
+        "Teknik Sipil": {"mn": 720, "mx": 790},
+        "Teknik Lingkungan": {"mn": 700, "mx": 770},
+        "Teknik Kelautan": {"mn": 680, "mx": 750},
+        # FTMD
+        "Teknik Mesin": {"mn": 730, "mx": 800},
+        "Teknik Material": {"mn": 700, "mx": 770},
+        "Teknik Dirgantara": {"mn": 710, "mx": 780},
+        # FTTM
+        "Teknik Pertambangan": {"mn": 690, "mx": 760},
+        "Teknik Perminyakan": {"mn": 720, "mx": 790},
+        "Teknik Geologi": {"mn": 700, "mx": 770},
+        "Teknik Geodesi dan Geomatika": {"mn": 690, "mx": 760},
+        "Meteorologi": {"mn": 680, "mx": 750},
+        "Oseanografi": {"mn": 680, "mx": 750},
+        # FTIF
+        "Teknik Informatika": {"mn": 800, "mx": 870},
+        "Sistem dan Teknologi Informasi": {"mn": 790, "mx": 860},
+        # FTEIC
+        "Teknik Elektro": {"mn": 760, "mx": 830},
+        "Teknik Fisika": {"mn": 720, "mx": 790},
+        "Teknik Tenaga Listrik": {"mn": 720, "mx": 790},
+        "Teknik Telekomunikasi": {"mn": 730, "mx": 800},
+        "Teknik Biomedis": {"mn": 720, "mx": 790},
+        # FTI
+        "Teknik Kimia": {"mn": 730, "mx": 800},
+        "Teknik Industri": {"mn": 770, "mx": 840},
+        "Manajemen Rekayasa": {"mn": 750, "mx": 820},
+        # FMIPA
+        "Matematika": {"mn": 720, "mx": 790},
+        "Fisika": {"mn": 710, "mx": 780},
+        "Kimia": {"mn": 720, "mx": 790},
+        "Biologi": {"mn": 700, "mx": 770},
+        "Astronomi": {"mn": 700, "mx": 770},
+        "Aktuaria": {"mn": 750, "mx": 820},
+        # SAPPK
+        "Arsitektur": {"mn": 750, "mx": 820},
+        "Perencanaan Wilayah dan Kota": {"mn": 730, "mx": 800},
+        # FSRD
+        "Desain Produk": {"mn": 720, "mx": 790},
+        "Desain Komunikasi Visual": {"mn": 730, "mx": 800},
+        "Seni Rupa": {"mn": 680, "mx": 750},
+        "Kriya": {"mn": 670, "mx": 740},
+        # SBM
+        "Manajemen": {"mn": 780, "mx": 850},
+        "Kewirausahaan": {"mn": 750, "mx": 820},
+        # SF
+        "Farmasi": {"mn": 740, "mx": 810},
+        # SITH
+        "Bioteknologi": {"mn": 720, "mx": 790},
+        "Rekayasa Hayati": {"mn": 710, "mx": 780},
+        "Rekayasa Pertanian": {"mn": 680, "mx": 750},
+    },
+    "Institut Teknologi Sepuluh Nopember": {
+        # FTK
+        "Teknik Perkapalan": {"mn": 630, "mx": 700},
+        "Teknik Sistem Perkapalan": {"mn": 610, "mx": 680},
+        "Teknik Kelautan": {"mn": 620, "mx": 690},
+        "Transportasi Laut": {"mn": 600, "mx": 670},
+        # FTI
+        "Teknik Industri": {"mn": 670, "mx": 740},
+        "Teknik Kimia": {"mn": 660, "mx": 730},
+        "Teknik Material dan Metalurgi": {"mn": 630, "mx": 700},
+        "Teknik Fisika": {"mn": 630, "mx": 700},
+        "Teknik Geofisika": {"mn": 620, "mx": 690},
+        # FTEIC
+        "Teknik Elektro": {"mn": 700, "mx": 770},
+        "Teknik Komputer": {"mn": 690, "mx": 760},
+        "Teknik Informatika": {"mn": 740, "mx": 810},
+        "Sistem Informasi": {"mn": 690, "mx": 760},
+        "Teknologi Informasi": {"mn": 700, "mx": 770},
+        # FTSP
+        "Teknik Sipil": {"mn": 640, "mx": 710},
+        "Teknik Lingkungan": {"mn": 620, "mx": 690},
+        "Arsitektur": {"mn": 670, "mx": 740},
+        "Perencanaan Wilayah dan Kota": {"mn": 650, "mx": 720},
+        "Desain Produk Industri": {"mn": 650, "mx": 720},
+        "Desain Interior": {"mn": 640, "mx": 710},
+        # FV (Teknik Mesin ada di ITS)
+        "Teknik Mesin": {"mn": 640, "mx": 710},
+        # FMKSD
+        "Matematika": {"mn": 660, "mx": 730},
+        "Fisika": {"mn": 630, "mx": 700},
+        "Kimia": {"mn": 640, "mx": 710},
+        "Biologi": {"mn": 610, "mx": 680},
+        "Statistika": {"mn": 660, "mx": 730},
+        "Aktuaria": {"mn": 670, "mx": 740},
+        # SB
+        "Manajemen Bisnis": {"mn": 680, "mx": 750},
+        "Studi Pembangunan": {"mn": 610, "mx": 680},
+    },
+    "Institut Pertanian Bogor": {
+        # FAPERTA
+        "Agronomi dan Hortikultura": {"mn": 600, "mx": 670},
+        "Ilmu Tanah": {"mn": 580, "mx": 650},
+        "Proteksi Tanaman": {"mn": 590, "mx": 660},
+        "Arsitektur Lanskap": {"mn": 620, "mx": 690},
+        # FMIPA
+        "Matematika": {"mn": 630, "mx": 700},
+        "Statistika": {"mn": 650, "mx": 720},
+        "Ilmu Komputer": {"mn": 680, "mx": 750},
+        "Fisika": {"mn": 600, "mx": 670},
+        "Kimia": {"mn": 605, "mx": 675},
+        "Biologi": {"mn": 610, "mx": 680},
+        "Biokimia": {"mn": 625, "mx": 695},
+        "Meteorologi Terapan": {"mn": 590, "mx": 660},
+        # FKH
+        "Kedokteran Hewan": {"mn": 660, "mx": 730},
+        # FPIK
+        "Budidaya Perairan": {"mn": 590, "mx": 660},
+        "Manajemen Sumber Daya Perairan": {"mn": 580, "mx": 650},
+        "Ilmu Kelautan": {"mn": 600, "mx": 670},
+        "Teknologi Hasil Perairan": {"mn": 580, "mx": 650},
+        # FEM
+        "Ekonomi Sumber Daya dan Lingkungan": {"mn": 610, "mx": 680},
+        "Agribisnis": {"mn": 635, "mx": 705},
+        "Ekonomi Syariah": {"mn": 590, "mx": 660},
+        "Manajemen": {"mn": 650, "mx": 720},
+        # FATETA / FTK
+        "Teknologi Pangan": {"mn": 645, "mx": 715},
+        "Ilmu Gizi": {"mn": 645, "mx": 715},
+        "Teknik Pertanian dan Biosistem": {"mn": 610, "mx": 680},
+        "Teknik Kimia": {"mn": 620, "mx": 690},
+        # FAHUTAN
+        "Manajemen Hutan": {"mn": 590, "mx": 660},
+        "Teknologi Hasil Hutan": {"mn": 580, "mx": 650},
+        "Konservasi Sumber Daya Hutan dan Ekowisata": {"mn": 590, "mx": 660},
+        "Silvikultur": {"mn": 580, "mx": 650},
+        # FAPET
+        "Ilmu Nutrisi dan Teknologi Pakan": {"mn": 580, "mx": 650},
+        "Teknologi Produksi Ternak": {"mn": 580, "mx": 650},
+        # FEMA
+        "Ilmu Keluarga dan Konsumen": {"mn": 600, "mx": 670},
+        "Komunikasi dan Pengembangan Masyarakat": {"mn": 610, "mx": 680},
+    },
+    "Universitas Gadjah Mada": {
+        # FK
+        "Pendidikan Dokter": {"mn": 770, "mx": 840},
+        "Ilmu Keperawatan": {"mn": 630, "mx": 700},
+        "Gizi Kesehatan": {"mn": 650, "mx": 720},
+        "Kedokteran Gigi": {"mn": 730, "mx": 800},
+        "Kesehatan Masyarakat": {"mn": 635, "mx": 705},
+        # FF
+        "Farmasi": {"mn": 700, "mx": 770},
+        # FT
+        "Teknik Sipil": {"mn": 690, "mx": 760},
+        "Teknik Mesin": {"mn": 690, "mx": 760},
+        "Teknik Elektro": {"mn": 720, "mx": 790},
+        "Teknik Kimia": {"mn": 700, "mx": 770},
+        "Teknik Industri": {"mn": 730, "mx": 800},
+        "Teknik Fisika": {"mn": 680, "mx": 750},
+        "Teknik Nuklir dan Teknik Fisika": {"mn": 680, "mx": 750},
+        "Teknik Geodesi": {"mn": 680, "mx": 750},
+        "Teknik Geologi": {"mn": 685, "mx": 755},
+        "Perencanaan Wilayah dan Kota": {"mn": 700, "mx": 770},
+        "Arsitektur": {"mn": 720, "mx": 790},
+        "Teknik Informatika": {"mn": 770, "mx": 840},
+        "Ilmu Komputer": {"mn": 760, "mx": 830},
+        "Teknologi Informasi": {"mn": 750, "mx": 820},
+        # FMIPA
+        "Matematika": {"mn": 660, "mx": 730},
+        "Fisika": {"mn": 650, "mx": 720},
+        "Kimia": {"mn": 660, "mx": 730},
+        "Biologi": {"mn": 650, "mx": 720},
+        "Statistika": {"mn": 680, "mx": 750},
+        "Geofisika": {"mn": 640, "mx": 710},
+        "Elektronika dan Instrumentasi": {"mn": 660, "mx": 730},
+        # FH
+        "Ilmu Hukum": {"mn": 700, "mx": 770},
+        # FEB
+        "Ilmu Ekonomi": {"mn": 690, "mx": 760},
+        "Akuntansi": {"mn": 720, "mx": 790},
+        "Manajemen": {"mn": 730, "mx": 800},
+        # FISIPOL
+        "Ilmu Komunikasi": {"mn": 690, "mx": 760},
+        "Manajemen dan Kebijakan Publik": {"mn": 670, "mx": 740},
+        "Sosiologi": {"mn": 650, "mx": 720},
+        "Ilmu Politik": {"mn": 660, "mx": 730},
+        "Pembangunan Sosial dan Kesejahteraan": {"mn": 640, "mx": 710},
+        "Hubungan Internasional": {"mn": 710, "mx": 780},
+        # FPN / Pertanian
+        "Agronomi": {"mn": 610, "mx": 680},
+        "Ilmu Tanah": {"mn": 590, "mx": 660},
+        "Proteksi Tanaman": {"mn": 600, "mx": 670},
+        "Teknologi Pangan dan Hasil Pertanian": {"mn": 625, "mx": 695},
+        "Agribisnis": {"mn": 640, "mx": 710},
+        "Penyuluhan dan Komunikasi Pertanian": {"mn": 590, "mx": 660},
+        # FKH
+        "Kedokteran Hewan": {"mn": 660, "mx": 730},
+        # Kehutanan
+        "Kehutanan": {"mn": 610, "mx": 680},
+        # Peternakan
+        "Peternakan": {"mn": 600, "mx": 670},
+        # FIB
+        "Sastra Indonesia": {"mn": 600, "mx": 670},
+        "Sastra Inggris": {"mn": 640, "mx": 710},
+        "Sastra Arab": {"mn": 590, "mx": 660},
+        "Sastra Jawa": {"mn": 560, "mx": 630},
+        "Arkeologi": {"mn": 590, "mx": 660},
+        "Sejarah": {"mn": 590, "mx": 660},
+        "Antropologi Budaya": {"mn": 600, "mx": 670},
+        "Pariwisata": {"mn": 620, "mx": 690},
+        "Bahasa Korea": {"mn": 610, "mx": 680},
+        "Bahasa dan Sastra Prancis": {"mn": 600, "mx": 670},
+        # Filsafat
+        "Filsafat": {"mn": 595, "mx": 665},
+        # FPsi
+        "Psikologi": {"mn": 700, "mx": 770},
+        # FGE
+        "Geografi Lingkungan": {"mn": 620, "mx": 690},
+        "Kartografi dan Penginderaan Jauh": {"mn": 610, "mx": 680},
+        "Pembangunan Wilayah": {"mn": 620, "mx": 690},
+    },
+    "Universitas Airlangga": {
+        # FK
+        "Pendidikan Dokter": {"mn": 740, "mx": 810},
+        "Ilmu Keperawatan": {"mn": 610, "mx": 680},
+        "Ilmu Gizi": {"mn": 620, "mx": 690},
+        "Kedokteran Gigi": {"mn": 700, "mx": 770},
+        # FKM
+        "Kesehatan Masyarakat": {"mn": 610, "mx": 680},
+        # FF
+        "Farmasi": {"mn": 680, "mx": 750},
+        # FKH
+        "Kedokteran Hewan": {"mn": 650, "mx": 720},
+        # FST
+        "Matematika": {"mn": 610, "mx": 680},
+        "Fisika": {"mn": 590, "mx": 660},
+        "Kimia": {"mn": 610, "mx": 680},
+        "Biologi": {"mn": 610, "mx": 680},
+        "Ilmu Komputer": {"mn": 670, "mx": 740},
+        "Statistika": {"mn": 630, "mx": 700},
+        "Teknik Lingkungan": {"mn": 605, "mx": 675},
+        # FH
+        "Ilmu Hukum": {"mn": 660, "mx": 730},
+        # FEB
+        "Ilmu Ekonomi": {"mn": 650, "mx": 720},
+        "Akuntansi": {"mn": 680, "mx": 750},
+        "Manajemen": {"mn": 690, "mx": 760},
+        "Ekonomi Islam": {"mn": 625, "mx": 695},
+        # FISIP
+        "Ilmu Komunikasi": {"mn": 650, "mx": 720},
+        "Hubungan Internasional": {"mn": 670, "mx": 740},
+        "Sosiologi": {"mn": 610, "mx": 680},
+        "Ilmu Politik": {"mn": 620, "mx": 690},
+        "Ilmu Informasi dan Perpustakaan": {"mn": 570, "mx": 640},
+        "Ilmu Kesejahteraan Sosial": {"mn": 590, "mx": 660},
+        "Administrasi Publik": {"mn": 610, "mx": 680},
+        "Administrasi Bisnis": {"mn": 620, "mx": 690},
+        # FPsi
+        "Psikologi": {"mn": 670, "mx": 740},
+        # FIB
+        "Sastra Indonesia": {"mn": 570, "mx": 640},
+        "Sastra Inggris": {"mn": 610, "mx": 680},
+        "Sastra Jepang": {"mn": 590, "mx": 660},
+    },
+    "Universitas Padjadjaran": {
+        # FK
+        "Pendidikan Dokter": {"mn": 730, "mx": 800},
+        "Ilmu Keperawatan": {"mn": 600, "mx": 670},
+        "Ilmu Gizi": {"mn": 610, "mx": 680},
+        "Kedokteran Gigi": {"mn": 690, "mx": 760},
+        # FKM
+        "Kesehatan Masyarakat": {"mn": 600, "mx": 670},
+        # FF
+        "Farmasi": {"mn": 660, "mx": 730},
+        # FKH
+        "Kedokteran Hewan": {"mn": 630, "mx": 700},
+        # FMIPA
+        "Matematika": {"mn": 600, "mx": 670},
+        "Fisika": {"mn": 580, "mx": 650},
+        "Kimia": {"mn": 600, "mx": 670},
+        "Biologi": {"mn": 600, "mx": 670},
+        "Ilmu Komputer": {"mn": 660, "mx": 730},
+        "Statistika": {"mn": 620, "mx": 690},
+        "Geofisika": {"mn": 590, "mx": 660},
+        # FT
+        "Teknik Informatika": {"mn": 680, "mx": 750},
+        "Teknik Elektro": {"mn": 650, "mx": 720},
+        "Teknik Industri": {"mn": 650, "mx": 720},
+        "Teknik Geologi": {"mn": 620, "mx": 690},
+        "Teknik Pertambangan": {"mn": 610, "mx": 680},
+        # FH
+        "Ilmu Hukum": {"mn": 640, "mx": 710},
+        # FEB
+        "Ilmu Ekonomi": {"mn": 640, "mx": 710},
+        "Akuntansi": {"mn": 660, "mx": 730},
+        "Manajemen": {"mn": 670, "mx": 740},
+        "Bisnis Digital": {"mn": 640, "mx": 710},
+        # FISIP
+        "Ilmu Komunikasi": {"mn": 650, "mx": 720},
+        "Hubungan Internasional": {"mn": 660, "mx": 730},
+        "Sosiologi": {"mn": 600, "mx": 670},
+        "Ilmu Politik": {"mn": 610, "mx": 680},
+        "Administrasi Publik": {"mn": 600, "mx": 670},
+        "Kesejahteraan Sosial": {"mn": 580, "mx": 650},
+        # FIB
+        "Sastra Indonesia": {"mn": 570, "mx": 640},
+        "Sastra Inggris": {"mn": 610, "mx": 680},
+        "Sastra Arab": {"mn": 570, "mx": 640},
+        "Sastra Jepang": {"mn": 590, "mx": 660},
+        "Sastra Jerman": {"mn": 570, "mx": 640},
+        "Sastra Prancis": {"mn": 570, "mx": 640},
+        "Sejarah": {"mn": 560, "mx": 630},
+        # FPsi
+        "Psikologi": {"mn": 660, "mx": 730},
+        # FPIK
+        "Ilmu Kelautan": {"mn": 580, "mx": 650},
+        "Perikanan": {"mn": 570, "mx": 640},
+        # FAPERTA
+        "Agribisnis": {"mn": 600, "mx": 670},
+        "Agroteknologi": {"mn": 590, "mx": 660},
+        # FAPET
+        "Peternakan": {"mn": 570, "mx": 640},
+    },
+    "Universitas Diponegoro": {
+        "Pendidikan Dokter": {"mn": 710, "mx": 780},
+        "Ilmu Keperawatan": {"mn": 590, "mx": 660},
+        "Kesehatan Masyarakat": {"mn": 590, "mx": 660},
+        "Ilmu Gizi": {"mn": 590, "mx": 660},
+        "Kedokteran Gigi": {"mn": 660, "mx": 730},
+        "Farmasi": {"mn": 630, "mx": 700},
+        "Teknik Sipil": {"mn": 640, "mx": 710},
+        "Teknik Mesin": {"mn": 640, "mx": 710},
+        "Teknik Elektro": {"mn": 660, "mx": 730},
+        "Teknik Kimia": {"mn": 650, "mx": 720},
+        "Teknik Industri": {"mn": 660, "mx": 730},
+        "Teknik Lingkungan": {"mn": 620, "mx": 690},
+        "Teknik Geologi": {"mn": 620, "mx": 690},
+        "Teknik Perkapalan": {"mn": 610, "mx": 680},
+        "Arsitektur": {"mn": 650, "mx": 720},
+        "Perencanaan Wilayah dan Kota": {"mn": 640, "mx": 710},
+        "Teknik Informatika": {"mn": 690, "mx": 760},
+        "Sistem Komputer": {"mn": 655, "mx": 725},
+        "Matematika": {"mn": 600, "mx": 670},
+        "Fisika": {"mn": 580, "mx": 650},
+        "Kimia": {"mn": 590, "mx": 660},
+        "Biologi": {"mn": 580, "mx": 650},
+        "Statistika": {"mn": 610, "mx": 680},
+        "Ilmu Hukum": {"mn": 620, "mx": 690},
+        "Ilmu Ekonomi": {"mn": 620, "mx": 690},
+        "Akuntansi": {"mn": 640, "mx": 710},
+        "Manajemen": {"mn": 650, "mx": 720},
+        "Perpajakan": {"mn": 610, "mx": 680},
+        "Ilmu Komunikasi": {"mn": 630, "mx": 700},
+        "Hubungan Internasional": {"mn": 640, "mx": 710},
+        "Administrasi Publik": {"mn": 590, "mx": 660},
+        "Ilmu Politik": {"mn": 590, "mx": 660},
+        "Ilmu Pemerintahan": {"mn": 590, "mx": 660},
+        "Psikologi": {"mn": 640, "mx": 710},
+        "Sastra Indonesia": {"mn": 555, "mx": 625},
+        "Sastra Inggris": {"mn": 590, "mx": 660},
+        "Ilmu Kelautan": {"mn": 570, "mx": 640},
+        "Perikanan": {"mn": 560, "mx": 630},
+        "Peternakan": {"mn": 550, "mx": 620},
+        "Agribisnis": {"mn": 570, "mx": 640},
+        "Teknologi Pangan": {"mn": 590, "mx": 660},
+        "Ilmu Keolahragaan": {"mn": 530, "mx": 600},
+    },
+    "Universitas Brawijaya": {
+        "Pendidikan Dokter": {"mn": 710, "mx": 780},
+        "Ilmu Keperawatan": {"mn": 580, "mx": 650},
+        "Ilmu Gizi": {"mn": 590, "mx": 660},
+        "Kesehatan Masyarakat": {"mn": 580, "mx": 650},
+        "Kedokteran Gigi": {"mn": 650, "mx": 720},
+        "Farmasi": {"mn": 620, "mx": 690},
+        "Kedokteran Hewan": {"mn": 620, "mx": 690},
+        "Teknik Sipil": {"mn": 620, "mx": 690},
+        "Teknik Mesin": {"mn": 620, "mx": 690},
+        "Teknik Elektro": {"mn": 640, "mx": 710},
+        "Teknik Kimia": {"mn": 630, "mx": 700},
+        "Teknik Industri": {"mn": 640, "mx": 710},
+        "Teknik Pengairan": {"mn": 590, "mx": 660},
+        "Arsitektur": {"mn": 640, "mx": 710},
+        "Teknik Informatika": {"mn": 680, "mx": 750},
+        "Sistem Informasi": {"mn": 650, "mx": 720},
+        "Teknologi Informasi": {"mn": 640, "mx": 710},
+        "Teknik Komputer": {"mn": 640, "mx": 710},
+        "Matematika": {"mn": 580, "mx": 650},
+        "Fisika": {"mn": 560, "mx": 630},
+        "Kimia": {"mn": 570, "mx": 640},
+        "Biologi": {"mn": 570, "mx": 640},
+        "Statistika": {"mn": 590, "mx": 660},
+        "Ilmu Hukum": {"mn": 600, "mx": 670},
+        "Ilmu Ekonomi": {"mn": 600, "mx": 670},
+        "Akuntansi": {"mn": 620, "mx": 690},
+        "Manajemen": {"mn": 630, "mx": 700},
+        "Ilmu Komunikasi": {"mn": 610, "mx": 680},
+        "Hubungan Internasional": {"mn": 620, "mx": 690},
+        "Sosiologi": {"mn": 570, "mx": 640},
+        "Ilmu Politik": {"mn": 570, "mx": 640},
+        "Administrasi Bisnis": {"mn": 590, "mx": 660},
+        "Administrasi Publik": {"mn": 575, "mx": 645},
+        "Psikologi": {"mn": 630, "mx": 700},
+        "Sastra Indonesia": {"mn": 540, "mx": 610},
+        "Sastra Inggris": {"mn": 580, "mx": 650},
+        "Sastra Jepang": {"mn": 560, "mx": 630},
+        "Agribisnis": {"mn": 570, "mx": 640},
+        "Agroekoteknologi": {"mn": 560, "mx": 630},
+        "Kehutanan": {"mn": 560, "mx": 630},
+        "Peternakan": {"mn": 550, "mx": 620},
+        "Ilmu Kelautan": {"mn": 560, "mx": 630},
+        "Budidaya Perairan": {"mn": 550, "mx": 620},
+        "Teknologi Pangan": {"mn": 580, "mx": 650},
+        "Ilmu Tanah": {"mn": 550, "mx": 620},
+    },
+    "Universitas Sebelas Maret": {
+        "Pendidikan Dokter": {"mn": 700, "mx": 770},
+        "Ilmu Keperawatan": {"mn": 570, "mx": 640},
+        "Ilmu Gizi": {"mn": 580, "mx": 650},
+        "Kesehatan Masyarakat": {"mn": 570, "mx": 640},
+        "Kedokteran Gigi": {"mn": 640, "mx": 710},
+        "Farmasi": {"mn": 610, "mx": 680},
+        "Teknik Sipil": {"mn": 610, "mx": 680},
+        "Teknik Mesin": {"mn": 610, "mx": 680},
+        "Teknik Elektro": {"mn": 620, "mx": 690},
+        "Teknik Kimia": {"mn": 610, "mx": 680},
+        "Teknik Industri": {"mn": 620, "mx": 690},
+        "Arsitektur": {"mn": 630, "mx": 700},
+        "Teknik Informatika": {"mn": 660, "mx": 730},
+        "Informatika": {"mn": 655, "mx": 725},
+        "Matematika": {"mn": 570, "mx": 640},
+        "Fisika": {"mn": 550, "mx": 620},
+        "Kimia": {"mn": 560, "mx": 630},
+        "Biologi": {"mn": 560, "mx": 630},
+        "Statistika": {"mn": 580, "mx": 650},
+        "Ilmu Hukum": {"mn": 590, "mx": 660},
+        "Ilmu Ekonomi": {"mn": 590, "mx": 660},
+        "Akuntansi": {"mn": 610, "mx": 680},
+        "Manajemen": {"mn": 620, "mx": 690},
+        "Ilmu Komunikasi": {"mn": 600, "mx": 670},
+        "Hubungan Internasional": {"mn": 610, "mx": 680},
+        "Sosiologi": {"mn": 560, "mx": 630},
+        "Ilmu Politik": {"mn": 560, "mx": 630},
+        "Administrasi Negara": {"mn": 565, "mx": 635},
+        "Psikologi": {"mn": 620, "mx": 690},
+        "Sastra Indonesia": {"mn": 530, "mx": 600},
+        "Sastra Inggris": {"mn": 570, "mx": 640},
+        "Sastra Jawa": {"mn": 510, "mx": 580},
+        "Sastra Daerah (Jawa)": {"mn": 505, "mx": 575},
+        "Sejarah": {"mn": 520, "mx": 590},
+        "Seni Rupa Murni": {"mn": 500, "mx": 570},
+        "Kriya Seni": {"mn": 490, "mx": 560},
+        "Agribisnis": {"mn": 550, "mx": 620},
+        "Agroteknologi": {"mn": 540, "mx": 610},
+        "Peternakan": {"mn": 530, "mx": 600},
+        "Ilmu Tanah": {"mn": 530, "mx": 600},
+        "Kehutanan": {"mn": 535, "mx": 605},
+        "Teknologi Pangan": {"mn": 560, "mx": 630},
+        "Pendidikan Matematika": {"mn": 565, "mx": 635},
+        "Pendidikan Biologi": {"mn": 545, "mx": 615},
+        "Pendidikan Kimia": {"mn": 545, "mx": 615},
+        "Pendidikan Fisika": {"mn": 545, "mx": 615},
+        "Pendidikan Bahasa Inggris": {"mn": 570, "mx": 640},
+        "Pendidikan Bahasa Indonesia": {"mn": 530, "mx": 600},
+        "Pendidikan Ekonomi": {"mn": 540, "mx": 610},
+        "Pendidikan Sejarah": {"mn": 510, "mx": 580},
+        "Pendidikan Sosiologi Antropologi": {"mn": 510, "mx": 580},
+        "Pendidikan Pancasila dan Kewarganegaraan": {"mn": 510, "mx": 580},
+    },
+    "Universitas Hasanuddin": {
+        "Pendidikan Dokter": {"mn": 690, "mx": 760},
+        "Ilmu Keperawatan": {"mn": 560, "mx": 630},
+        "Ilmu Gizi": {"mn": 570, "mx": 640},
+        "Kesehatan Masyarakat": {"mn": 560, "mx": 630},
+        "Kedokteran Gigi": {"mn": 640, "mx": 710},
+        "Farmasi": {"mn": 600, "mx": 670},
+        "Kedokteran Hewan": {"mn": 590, "mx": 660},
+        "Teknik Sipil": {"mn": 600, "mx": 670},
+        "Teknik Mesin": {"mn": 600, "mx": 670},
+        "Teknik Elektro": {"mn": 620, "mx": 690},
+        "Teknik Kimia": {"mn": 600, "mx": 670},
+        "Teknik Industri": {"mn": 610, "mx": 680},
+        "Teknik Geologi": {"mn": 600, "mx": 670},
+        "Teknik Perminyakan": {"mn": 620, "mx": 690},
+        "Arsitektur": {"mn": 620, "mx": 690},
+        "Perencanaan Wilayah dan Kota": {"mn": 600, "mx": 670},
+        "Teknik Informatika": {"mn": 650, "mx": 720},
+        "Sistem Informasi": {"mn": 620, "mx": 690},
+        "Teknik Lingkungan": {"mn": 590, "mx": 660},
+        "Teknik Kelautan": {"mn": 580, "mx": 650},
+        "Matematika": {"mn": 560, "mx": 630},
+        "Fisika": {"mn": 540, "mx": 610},
+        "Kimia": {"mn": 550, "mx": 620},
+        "Biologi": {"mn": 550, "mx": 620},
+        "Statistika": {"mn": 570, "mx": 640},
+        "Ilmu Hukum": {"mn": 580, "mx": 650},
+        "Ilmu Ekonomi": {"mn": 580, "mx": 650},
+        "Akuntansi": {"mn": 600, "mx": 670},
+        "Manajemen": {"mn": 610, "mx": 680},
+        "Ilmu Komunikasi": {"mn": 590, "mx": 660},
+        "Hubungan Internasional": {"mn": 600, "mx": 670},
+        "Sosiologi": {"mn": 550, "mx": 620},
+        "Ilmu Politik": {"mn": 555, "mx": 625},
+        "Administrasi Negara": {"mn": 560, "mx": 630},
+        "Ilmu Pemerintahan": {"mn": 560, "mx": 630},
+        "Psikologi": {"mn": 610, "mx": 680},
+        "Sastra Indonesia": {"mn": 520, "mx": 590},
+        "Sastra Inggris": {"mn": 560, "mx": 630},
+        "Sejarah": {"mn": 510, "mx": 580},
+        "Agribisnis": {"mn": 540, "mx": 610},
+        "Agroteknologi": {"mn": 530, "mx": 600},
+        "Kehutanan": {"mn": 530, "mx": 600},
+        "Peternakan": {"mn": 520, "mx": 590},
+        "Ilmu Kelautan": {"mn": 540, "mx": 610},
+        "Budidaya Perairan": {"mn": 530, "mx": 600},
+        "Teknologi Pangan": {"mn": 560, "mx": 630},
+    },
+    "Universitas Sumatera Utara": {
+        "Pendidikan Dokter": {"mn": 680, "mx": 750},
+        "Ilmu Keperawatan": {"mn": 550, "mx": 620},
+        "Ilmu Gizi": {"mn": 560, "mx": 630},
+        "Kesehatan Masyarakat": {"mn": 550, "mx": 620},
+        "Kedokteran Gigi": {"mn": 630, "mx": 700},
+        "Farmasi": {"mn": 590, "mx": 660},
+        "Teknik Sipil": {"mn": 590, "mx": 660},
+        "Teknik Mesin": {"mn": 590, "mx": 660},
+        "Teknik Elektro": {"mn": 610, "mx": 680},
+        "Teknik Kimia": {"mn": 590, "mx": 660},
+        "Teknik Industri": {"mn": 600, "mx": 670},
+        "Teknik Informatika": {"mn": 630, "mx": 700},
+        "Arsitektur": {"mn": 600, "mx": 670},
+        "Teknik Lingkungan": {"mn": 575, "mx": 645},
+        "Matematika": {"mn": 540, "mx": 610},
+        "Fisika": {"mn": 520, "mx": 590},
+        "Kimia": {"mn": 530, "mx": 600},
+        "Biologi": {"mn": 530, "mx": 600},
+        "Statistika": {"mn": 550, "mx": 620},
+        "Ilmu Komputer": {"mn": 600, "mx": 670},
+        "Ilmu Hukum": {"mn": 560, "mx": 630},
+        "Ilmu Ekonomi": {"mn": 560, "mx": 630},
+        "Akuntansi": {"mn": 580, "mx": 650},
+        "Manajemen": {"mn": 590, "mx": 660},
+        "Ilmu Komunikasi": {"mn": 570, "mx": 640},
+        "Hubungan Internasional": {"mn": 580, "mx": 650},
+        "Sosiologi": {"mn": 530, "mx": 600},
+        "Ilmu Politik": {"mn": 530, "mx": 600},
+        "Administrasi Negara": {"mn": 540, "mx": 610},
+        "Administrasi Bisnis": {"mn": 545, "mx": 615},
+        "Ilmu Perpustakaan": {"mn": 500, "mx": 570},
+        "Kesejahteraan Sosial": {"mn": 520, "mx": 590},
+        "Psikologi": {"mn": 580, "mx": 650},
+        "Sastra Indonesia": {"mn": 500, "mx": 570},
+        "Sastra Inggris": {"mn": 540, "mx": 610},
+        "Sastra Melayu": {"mn": 490, "mx": 560},
+        "Sastra Arab": {"mn": 490, "mx": 560},
+        "Sastra Jepang": {"mn": 510, "mx": 580},
+        "Sastra Cina": {"mn": 510, "mx": 580},
+        "Sejarah": {"mn": 490, "mx": 560},
+        "Agribisnis": {"mn": 520, "mx": 590},
+        "Agroekoteknologi": {"mn": 510, "mx": 580},
+        "Kehutanan": {"mn": 510, "mx": 580},
+        "Peternakan": {"mn": 500, "mx": 570},
+        "Ilmu Kelautan": {"mn": 510, "mx": 580},
+        "Budidaya Perairan": {"mn": 500, "mx": 570},
+        "Teknologi Pangan": {"mn": 530, "mx": 600},
+    },
+    "Universitas Andalas": {
+        "Pendidikan Dokter": {"mn": 680, "mx": 750},
+        "Ilmu Keperawatan": {"mn": 550, "mx": 620},
+        "Ilmu Gizi": {"mn": 560, "mx": 630},
+        "Kesehatan Masyarakat": {"mn": 550, "mx": 620},
+        "Kedokteran Gigi": {"mn": 620, "mx": 690},
+        "Farmasi": {"mn": 590, "mx": 660},
+        "Kedokteran Hewan": {"mn": 580, "mx": 650},
+        "Teknik Sipil": {"mn": 580, "mx": 650},
+        "Teknik Mesin": {"mn": 580, "mx": 650},
+        "Teknik Elektro": {"mn": 600, "mx": 670},
+        "Teknik Kimia": {"mn": 580, "mx": 650},
+        "Teknik Industri": {"mn": 590, "mx": 660},
+        "Teknik Lingkungan": {"mn": 570, "mx": 640},
+        "Arsitektur": {"mn": 590, "mx": 660},
+        "Teknik Informatika": {"mn": 620, "mx": 690},
+        "Sistem Informasi": {"mn": 600, "mx": 670},
+        "Matematika": {"mn": 530, "mx": 600},
+        "Fisika": {"mn": 510, "mx": 580},
+        "Kimia": {"mn": 520, "mx": 590},
+        "Biologi": {"mn": 520, "mx": 590},
+        "Statistika": {"mn": 540, "mx": 610},
+        "Ilmu Hukum": {"mn": 550, "mx": 620},
+        "Ilmu Ekonomi": {"mn": 550, "mx": 620},
+        "Akuntansi": {"mn": 570, "mx": 640},
+        "Manajemen": {"mn": 580, "mx": 650},
+        "Ilmu Komunikasi": {"mn": 560, "mx": 630},
+        "Sosiologi": {"mn": 520, "mx": 590},
+        "Ilmu Politik": {"mn": 520, "mx": 590},
+        "Administrasi Publik": {"mn": 525, "mx": 595},
+        "Ilmu Pemerintahan": {"mn": 525, "mx": 595},
+        "Hubungan Internasional": {"mn": 560, "mx": 630},
+        "Psikologi": {"mn": 570, "mx": 640},
+        "Sastra Indonesia": {"mn": 490, "mx": 560},
+        "Sastra Inggris": {"mn": 530, "mx": 600},
+        "Sastra Minangkabau": {"mn": 460, "mx": 530},
+        "Sejarah": {"mn": 480, "mx": 550},
+        "Agribisnis": {"mn": 510, "mx": 580},
+        "Agroteknologi": {"mn": 500, "mx": 570},
+        "Peternakan": {"mn": 490, "mx": 560},
+        "Kehutanan": {"mn": 490, "mx": 560},
+        "Teknologi Pangan": {"mn": 540, "mx": 610},
+        "Ilmu Kelautan": {"mn": 500, "mx": 570},
+        "Budidaya Perairan": {"mn": 490, "mx": 560},
+        "Ilmu Tanah": {"mn": 490, "mx": 560},
+    },
+    "Universitas Sriwijaya": {
+        "Pendidikan Dokter": {"mn": 650, "mx": 720},
+        "Ilmu Keperawatan": {"mn": 530, "mx": 600},
+        "Kesehatan Masyarakat": {"mn": 530, "mx": 600},
+        "Kedokteran Gigi": {"mn": 600, "mx": 670},
+        "Farmasi": {"mn": 570, "mx": 640},
+        "Teknik Sipil": {"mn": 560, "mx": 630},
+        "Teknik Mesin": {"mn": 560, "mx": 630},
+        "Teknik Elektro": {"mn": 580, "mx": 650},
+        "Teknik Kimia": {"mn": 570, "mx": 640},
+        "Teknik Industri": {"mn": 575, "mx": 645},
+        "Teknik Pertambangan": {"mn": 560, "mx": 630},
+        "Teknik Geologi": {"mn": 560, "mx": 630},
+        "Teknik Informatika": {"mn": 600, "mx": 670},
+        "Sistem Informasi": {"mn": 580, "mx": 650},
+        "Ilmu Komputer": {"mn": 580, "mx": 650},
+        "Arsitektur": {"mn": 565, "mx": 635},
+        "Teknik Kimia": {"mn": 570, "mx": 640},
+        "Matematika": {"mn": 510, "mx": 580},
+        "Fisika": {"mn": 490, "mx": 560},
+        "Kimia": {"mn": 500, "mx": 570},
+        "Biologi": {"mn": 500, "mx": 570},
+        "Ilmu Hukum": {"mn": 530, "mx": 600},
+        "Ilmu Ekonomi": {"mn": 530, "mx": 600},
+        "Akuntansi": {"mn": 550, "mx": 620},
+        "Manajemen": {"mn": 560, "mx": 630},
+        "Ilmu Komunikasi": {"mn": 540, "mx": 610},
+        "Sosiologi": {"mn": 500, "mx": 570},
+        "Administrasi Negara": {"mn": 510, "mx": 580},
+        "Hubungan Internasional": {"mn": 550, "mx": 620},
+        "Ilmu Pemerintahan": {"mn": 510, "mx": 580},
+        "Psikologi": {"mn": 550, "mx": 620},
+        "Sastra Indonesia": {"mn": 470, "mx": 540},
+        "Sastra Inggris": {"mn": 510, "mx": 580},
+        "Sastra Arab": {"mn": 460, "mx": 530},
+        "Agribisnis": {"mn": 490, "mx": 560},
+        "Agroekoteknologi": {"mn": 480, "mx": 550},
+        "Peternakan": {"mn": 470, "mx": 540},
+        "Kehutanan": {"mn": 470, "mx": 540},
+        "Ilmu Kelautan": {"mn": 480, "mx": 550},
+        "Budidaya Perairan": {"mn": 470, "mx": 540},
+        "Teknologi Pangan": {"mn": 510, "mx": 580},
+    },
+    "Universitas Udayana": {
+        "Pendidikan Dokter": {"mn": 680, "mx": 750},
+        "Ilmu Keperawatan": {"mn": 550, "mx": 620},
+        "Ilmu Gizi": {"mn": 560, "mx": 630},
+        "Kesehatan Masyarakat": {"mn": 550, "mx": 620},
+        "Kedokteran Gigi": {"mn": 630, "mx": 700},
+        "Farmasi": {"mn": 590, "mx": 660},
+        "Kedokteran Hewan": {"mn": 600, "mx": 670},
+        "Teknik Sipil": {"mn": 580, "mx": 650},
+        "Teknik Mesin": {"mn": 575, "mx": 645},
+        "Teknik Elektro": {"mn": 600, "mx": 670},
+        "Teknik Kimia": {"mn": 575, "mx": 645},
+        "Teknik Industri": {"mn": 580, "mx": 650},
+        "Arsitektur": {"mn": 600, "mx": 670},
+        "Teknik Informatika": {"mn": 630, "mx": 700},
+        "Sistem Informasi": {"mn": 600, "mx": 670},
+        "Teknologi Informasi": {"mn": 610, "mx": 680},
+        "Teknik Lingkungan": {"mn": 570, "mx": 640},
+        "Matematika": {"mn": 530, "mx": 600},
+        "Fisika": {"mn": 510, "mx": 580},
+        "Kimia": {"mn": 520, "mx": 590},
+        "Biologi": {"mn": 520, "mx": 590},
+        "Ilmu Komputer": {"mn": 600, "mx": 670},
+        "Ilmu Hukum": {"mn": 550, "mx": 620},
+        "Ilmu Ekonomi": {"mn": 550, "mx": 620},
+        "Akuntansi": {"mn": 570, "mx": 640},
+        "Manajemen": {"mn": 580, "mx": 650},
+        "Ilmu Komunikasi": {"mn": 560, "mx": 630},
+        "Sosiologi": {"mn": 520, "mx": 590},
+        "Ilmu Politik": {"mn": 520, "mx": 590},
+        "Administrasi Negara": {"mn": 530, "mx": 600},
+        "Ilmu Pemerintahan": {"mn": 530, "mx": 600},
+        "Hubungan Internasional": {"mn": 565, "mx": 635},
+        "Psikologi": {"mn": 570, "mx": 640},
+        "Sastra Indonesia": {"mn": 490, "mx": 560},
+        "Sastra Inggris": {"mn": 530, "mx": 600},
+        "Sastra Bali": {"mn": 450, "mx": 520},
+        "Sejarah": {"mn": 480, "mx": 550},
+        "Pariwisata": {"mn": 560, "mx": 630},
+        "Destinasi Pariwisata": {"mn": 550, "mx": 620},
+        "Agribisnis": {"mn": 510, "mx": 580},
+        "Agroteknologi": {"mn": 500, "mx": 570},
+        "Peternakan": {"mn": 490, "mx": 560},
+        "Ilmu Kelautan": {"mn": 510, "mx": 580},
+        "Budidaya Perairan": {"mn": 500, "mx": 570},
+        "Teknologi Pangan": {"mn": 530, "mx": 600},
+    },
+    "Universitas Pendidikan Indonesia": {
+        "Pendidikan Matematika": {"mn": 580, "mx": 650},
+        "Pendidikan Biologi": {"mn": 560, "mx": 630},
+        "Pendidikan Kimia": {"mn": 560, "mx": 630},
+        "Pendidikan Fisika": {"mn": 560, "mx": 630},
+        "Pendidikan Ilmu Komputer": {"mn": 600, "mx": 670},
+        "Ilmu Komputer": {"mn": 610, "mx": 680},
+        "Teknik Informatika": {"mn": 620, "mx": 690},
+        "Teknik Elektro": {"mn": 580, "mx": 650},
+        "Teknik Mesin": {"mn": 560, "mx": 630},
+        "Pendidikan Teknik Arsitektur": {"mn": 560, "mx": 630},
+        "Pendidikan Teknik Bangunan": {"mn": 545, "mx": 615},
+        "Pendidikan Bahasa Inggris": {"mn": 590, "mx": 660},
+        "Pendidikan Bahasa Indonesia": {"mn": 540, "mx": 610},
+        "Pendidikan Bahasa Jepang": {"mn": 540, "mx": 610},
+        "Pendidikan Bahasa Arab": {"mn": 520, "mx": 590},
+        "Pendidikan Bahasa Perancis": {"mn": 520, "mx": 590},
+        "Pendidikan Bahasa Jerman": {"mn": 515, "mx": 585},
+        "Pendidikan Ekonomi": {"mn": 540, "mx": 610},
+        "Manajemen": {"mn": 580, "mx": 650},
+        "Akuntansi": {"mn": 580, "mx": 650},
+        "Pendidikan Akuntansi": {"mn": 540, "mx": 610},
+        "Pendidikan Sejarah": {"mn": 520, "mx": 590},
+        "Pendidikan Sosiologi": {"mn": 520, "mx": 590},
+        "Pendidikan Geografi": {"mn": 520, "mx": 590},
+        "Bimbingan dan Konseling": {"mn": 500, "mx": 570},
+        "Pendidikan Luar Biasa": {"mn": 500, "mx": 570},
+        "Pendidikan Luar Sekolah": {"mn": 490, "mx": 560},
+        "Psikologi": {"mn": 600, "mx": 670},
+        "Ilmu Komunikasi": {"mn": 580, "mx": 650},
+        "Pendidikan Jasmani Kesehatan dan Rekreasi": {"mn": 490, "mx": 560},
+        "Pendidikan Kepelatihan Olahraga": {"mn": 480, "mx": 550},
+        "Pendidikan Seni Rupa": {"mn": 460, "mx": 530},
+        "Pendidikan Seni Musik": {"mn": 460, "mx": 530},
+        "Perpustakaan dan Sains Informasi": {"mn": 490, "mx": 560},
+        "Administrasi Pendidikan": {"mn": 490, "mx": 560},
+        "Teknologi Pendidikan": {"mn": 490, "mx": 560},
+        "Pendidikan Guru Sekolah Dasar": {"mn": 510, "mx": 580},
+    },
+    "Universitas Negeri Yogyakarta": {
+        "Pendidikan Matematika": {"mn": 580, "mx": 650},
+        "Pendidikan Biologi": {"mn": 560, "mx": 630},
+        "Pendidikan Kimia": {"mn": 560, "mx": 630},
+        "Pendidikan Fisika": {"mn": 560, "mx": 630},
+        "Matematika": {"mn": 560, "mx": 630},
+        "Biologi": {"mn": 540, "mx": 610},
+        "Kimia": {"mn": 540, "mx": 610},
+        "Fisika": {"mn": 540, "mx": 610},
+        "Ilmu Komputer": {"mn": 590, "mx": 660},
+        "Teknik Informatika": {"mn": 600, "mx": 670},
+        "Teknik Elektro": {"mn": 560, "mx": 630},
+        "Teknik Mesin": {"mn": 550, "mx": 620},
+        "Pendidikan Teknik Sipil dan Perencanaan": {"mn": 545, "mx": 615},
+        "Teknik Boga": {"mn": 490, "mx": 560},
+        "Teknik Busana": {"mn": 470, "mx": 540},
+        "Pendidikan Bahasa Inggris": {"mn": 580, "mx": 650},
+        "Pendidikan Bahasa Indonesia": {"mn": 540, "mx": 610},
+        "Pendidikan Bahasa Jerman": {"mn": 510, "mx": 580},
+        "Pendidikan Bahasa Prancis": {"mn": 510, "mx": 580},
+        "Pendidikan Ekonomi": {"mn": 540, "mx": 610},
+        "Manajemen": {"mn": 570, "mx": 640},
+        "Akuntansi": {"mn": 570, "mx": 640},
+        "Pendidikan Akuntansi": {"mn": 530, "mx": 600},
+        "Pendidikan Sejarah": {"mn": 510, "mx": 580},
+        "Pendidikan Sosiologi": {"mn": 510, "mx": 580},
+        "Pendidikan Geografi": {"mn": 510, "mx": 580},
+        "Ilmu Keolahragaan": {"mn": 490, "mx": 560},
+        "Pendidikan Jasmani Kesehatan dan Rekreasi": {"mn": 480, "mx": 550},
+        "Psikologi": {"mn": 590, "mx": 660},
+        "Pendidikan Luar Biasa": {"mn": 490, "mx": 560},
+        "Pendidikan Seni Rupa": {"mn": 460, "mx": 530},
+        "Pendidikan Seni Musik": {"mn": 460, "mx": 530},
+        "Administrasi Pendidikan": {"mn": 490, "mx": 560},
+        "Bimbingan dan Konseling": {"mn": 490, "mx": 560},
+        "Pendidikan Guru Sekolah Dasar": {"mn": 510, "mx": 580},
+        "Teknologi Pendidikan": {"mn": 490, "mx": 560},
+    },
+    "Universitas Negeri Malang": {
+        "Pendidikan Matematika": {"mn": 560, "mx": 630},
+        "Pendidikan Biologi": {"mn": 540, "mx": 610},
+        "Pendidikan Kimia": {"mn": 540, "mx": 610},
+        "Pendidikan Fisika": {"mn": 540, "mx": 610},
+        "Matematika": {"mn": 540, "mx": 610},
+        "Biologi": {"mn": 520, "mx": 590},
+        "Kimia": {"mn": 520, "mx": 590},
+        "Fisika": {"mn": 520, "mx": 590},
+        "Ilmu Komputer": {"mn": 570, "mx": 640},
+        "Teknik Informatika": {"mn": 580, "mx": 650},
+        "Teknik Elektro": {"mn": 540, "mx": 610},
+        "Teknik Mesin": {"mn": 530, "mx": 600},
+        "Teknik Sipil": {"mn": 530, "mx": 600},
+        "Arsitektur": {"mn": 550, "mx": 620},
+        "Pendidikan Bahasa Inggris": {"mn": 560, "mx": 630},
+        "Pendidikan Bahasa Indonesia": {"mn": 520, "mx": 590},
+        "Pendidikan Bahasa Arab": {"mn": 500, "mx": 570},
+        "Pendidikan Bahasa Jepang": {"mn": 500, "mx": 570},
+        "Pendidikan Bahasa Mandarin": {"mn": 500, "mx": 570},
+        "Pendidikan Ekonomi": {"mn": 520, "mx": 590},
+        "Manajemen": {"mn": 550, "mx": 620},
+        "Akuntansi": {"mn": 550, "mx": 620},
+        "Pendidikan Akuntansi": {"mn": 510, "mx": 580},
+        "Pendidikan Sejarah": {"mn": 490, "mx": 560},
+        "Pendidikan Sosiologi": {"mn": 490, "mx": 560},
+        "Pendidikan Geografi": {"mn": 490, "mx": 560},
+        "Ilmu Keolahragaan": {"mn": 470, "mx": 540},
+        "Pendidikan Jasmani Kesehatan dan Rekreasi": {"mn": 460, "mx": 530},
+        "Psikologi": {"mn": 570, "mx": 640},
+        "Bimbingan dan Konseling": {"mn": 470, "mx": 540},
+        "Pendidikan Luar Biasa": {"mn": 460, "mx": 530},
+        "Administrasi Pendidikan": {"mn": 470, "mx": 540},
+        "Teknologi Pendidikan": {"mn": 470, "mx": 540},
+        "Pendidikan Guru Sekolah Dasar": {"mn": 490, "mx": 560},
+        "Seni dan Desain": {"mn": 460, "mx": 530},
+    },
+    "Universitas Negeri Semarang": {
+        "Pendidikan Matematika": {"mn": 540, "mx": 610},
+        "Pendidikan Biologi": {"mn": 520, "mx": 590},
+        "Pendidikan Kimia": {"mn": 520, "mx": 590},
+        "Pendidikan Fisika": {"mn": 520, "mx": 590},
+        "Matematika": {"mn": 520, "mx": 590},
+        "Biologi": {"mn": 500, "mx": 570},
+        "Kimia": {"mn": 500, "mx": 570},
+        "Fisika": {"mn": 500, "mx": 570},
+        "Ilmu Komputer": {"mn": 550, "mx": 620},
+        "Teknik Informatika": {"mn": 560, "mx": 630},
+        "Teknik Elektro": {"mn": 520, "mx": 590},
+        "Teknik Mesin": {"mn": 510, "mx": 580},
+        "Teknik Sipil": {"mn": 510, "mx": 580},
+        "Teknik Kimia": {"mn": 510, "mx": 580},
+        "Arsitektur": {"mn": 530, "mx": 600},
+        "Pendidikan Bahasa Inggris": {"mn": 540, "mx": 610},
+        "Pendidikan Bahasa Indonesia": {"mn": 500, "mx": 570},
+        "Pendidikan Bahasa Jawa": {"mn": 460, "mx": 530},
+        "Pendidikan Ekonomi": {"mn": 500, "mx": 570},
+        "Manajemen": {"mn": 530, "mx": 600},
+        "Akuntansi": {"mn": 530, "mx": 600},
+        "Ekonomi Pembangunan": {"mn": 510, "mx": 580},
+        "Pendidikan Sejarah": {"mn": 470, "mx": 540},
+        "Pendidikan Sosiologi dan Antropologi": {"mn": 470, "mx": 540},
+        "Pendidikan Geografi": {"mn": 470, "mx": 540},
+        "Ilmu Hukum": {"mn": 520, "mx": 590},
+        "Ilmu Keolahragaan": {"mn": 450, "mx": 520},
+        "Psikologi": {"mn": 550, "mx": 620},
+        "Kesehatan Masyarakat": {"mn": 530, "mx": 600},
+        "Bimbingan dan Konseling": {"mn": 450, "mx": 520},
+        "Pendidikan Guru Sekolah Dasar": {"mn": 490, "mx": 560},
+        "Teknologi Pendidikan": {"mn": 450, "mx": 520},
+        "Pendidikan Luar Sekolah": {"mn": 440, "mx": 510},
+        "Seni Rupa": {"mn": 440, "mx": 510},
+    },
+    "Universitas Lampung": {
+        "Pendidikan Dokter": {"mn": 640, "mx": 710},
+        "Ilmu Keperawatan": {"mn": 520, "mx": 590},
+        "Kesehatan Masyarakat": {"mn": 510, "mx": 580},
+        "Farmasi": {"mn": 545, "mx": 615},
+        "Teknik Sipil": {"mn": 550, "mx": 620},
+        "Teknik Mesin": {"mn": 540, "mx": 610},
+        "Teknik Elektro": {"mn": 560, "mx": 630},
+        "Teknik Kimia": {"mn": 550, "mx": 620},
+        "Teknik Informatika": {"mn": 580, "mx": 650},
+        "Ilmu Komputer": {"mn": 570, "mx": 640},
+        "Arsitektur": {"mn": 550, "mx": 620},
+        "Matematika": {"mn": 500, "mx": 570},
+        "Fisika": {"mn": 480, "mx": 550},
+        "Kimia": {"mn": 490, "mx": 560},
+        "Biologi": {"mn": 490, "mx": 560},
+        "Ilmu Hukum": {"mn": 510, "mx": 580},
+        "Ilmu Ekonomi": {"mn": 510, "mx": 580},
+        "Akuntansi": {"mn": 530, "mx": 600},
+        "Manajemen": {"mn": 540, "mx": 610},
+        "Ilmu Komunikasi": {"mn": 520, "mx": 590},
+        "Sosiologi": {"mn": 480, "mx": 550},
+        "Ilmu Pemerintahan": {"mn": 490, "mx": 560},
+        "Administrasi Negara": {"mn": 490, "mx": 560},
+        "Hubungan Internasional": {"mn": 530, "mx": 600},
+        "Psikologi": {"mn": 540, "mx": 610},
+        "Sastra Indonesia": {"mn": 450, "mx": 520},
+        "Sastra Inggris": {"mn": 490, "mx": 560},
+        "Agribisnis": {"mn": 480, "mx": 550},
+        "Agroteknologi": {"mn": 470, "mx": 540},
+        "Peternakan": {"mn": 460, "mx": 530},
+        "Kehutanan": {"mn": 460, "mx": 530},
+        "Teknologi Pangan": {"mn": 490, "mx": 560},
+        "Ilmu Kelautan": {"mn": 465, "mx": 535},
+        "Perikanan": {"mn": 455, "mx": 525},
+        "Ilmu Tanah": {"mn": 455, "mx": 525},
+    },
+    "Universitas Riau": {
+        "Pendidikan Dokter": {"mn": 620, "mx": 690},
+        "Ilmu Keperawatan": {"mn": 500, "mx": 570},
+        "Kesehatan Masyarakat": {"mn": 490, "mx": 560},
+        "Farmasi": {"mn": 545, "mx": 615},
+        "Teknik Sipil": {"mn": 530, "mx": 600},
+        "Teknik Mesin": {"mn": 520, "mx": 590},
+        "Teknik Elektro": {"mn": 540, "mx": 610},
+        "Teknik Kimia": {"mn": 530, "mx": 600},
+        "Teknik Informatika": {"mn": 560, "mx": 630},
+        "Sistem Informasi": {"mn": 540, "mx": 610},
+        "Ilmu Komputer": {"mn": 550, "mx": 620},
+        "Teknik Lingkungan": {"mn": 510, "mx": 580},
+        "Teknik Perminyakan": {"mn": 540, "mx": 610},
+        "Matematika": {"mn": 480, "mx": 550},
+        "Fisika": {"mn": 460, "mx": 530},
+        "Kimia": {"mn": 470, "mx": 540},
+        "Biologi": {"mn": 470, "mx": 540},
+        "Ilmu Hukum": {"mn": 490, "mx": 560},
+        "Ilmu Ekonomi": {"mn": 490, "mx": 560},
+        "Akuntansi": {"mn": 510, "mx": 580},
+        "Manajemen": {"mn": 520, "mx": 590},
+        "Ilmu Komunikasi": {"mn": 500, "mx": 570},
+        "Sosiologi": {"mn": 460, "mx": 530},
+        "Ilmu Pemerintahan": {"mn": 470, "mx": 540},
+        "Administrasi Negara": {"mn": 460, "mx": 530},
+        "Hubungan Internasional": {"mn": 500, "mx": 570},
+        "Ilmu Politik": {"mn": 460, "mx": 530},
+        "Psikologi": {"mn": 510, "mx": 580},
+        "Sastra Indonesia": {"mn": 430, "mx": 500},
+        "Sastra Inggris": {"mn": 460, "mx": 530},
+        "Sastra Melayu": {"mn": 410, "mx": 480},
+        "Agribisnis": {"mn": 450, "mx": 520},
+        "Agroteknologi": {"mn": 440, "mx": 510},
+        "Peternakan": {"mn": 430, "mx": 500},
+        "Kehutanan": {"mn": 440, "mx": 510},
+        "Ilmu Kelautan": {"mn": 450, "mx": 520},
+        "Budidaya Perairan": {"mn": 430, "mx": 500},
+        "Teknologi Pangan": {"mn": 470, "mx": 540},
+        "Ilmu Tanah": {"mn": 430, "mx": 500},
+    },
+    "Universitas Jember": {
+        "Pendidikan Dokter": {"mn": 640, "mx": 710},
+        "Ilmu Keperawatan": {"mn": 510, "mx": 580},
+        "Kesehatan Masyarakat": {"mn": 500, "mx": 570},
+        "Kedokteran Gigi": {"mn": 600, "mx": 670},
+        "Farmasi": {"mn": 560, "mx": 630},
+        "Teknik Sipil": {"mn": 540, "mx": 610},
+        "Teknik Mesin": {"mn": 530, "mx": 600},
+        "Teknik Elektro": {"mn": 550, "mx": 620},
+        "Teknik Kimia": {"mn": 540, "mx": 610},
+        "Teknik Informatika": {"mn": 570, "mx": 640},
+        "Sistem Informasi": {"mn": 550, "mx": 620},
+        "Ilmu Komputer": {"mn": 555, "mx": 625},
+        "Matematika": {"mn": 490, "mx": 560},
+        "Fisika": {"mn": 470, "mx": 540},
+        "Kimia": {"mn": 480, "mx": 550},
+        "Biologi": {"mn": 480, "mx": 550},
+        "Ilmu Hukum": {"mn": 500, "mx": 570},
+        "Ilmu Ekonomi": {"mn": 500, "mx": 570},
+        "Akuntansi": {"mn": 520, "mx": 590},
+        "Manajemen": {"mn": 530, "mx": 600},
+        "Ilmu Komunikasi": {"mn": 510, "mx": 580},
+        "Sosiologi": {"mn": 470, "mx": 540},
+        "Ilmu Pemerintahan": {"mn": 470, "mx": 540},
+        "Administrasi Bisnis": {"mn": 490, "mx": 560},
+        "Hubungan Internasional": {"mn": 510, "mx": 580},
+        "Ilmu Politik": {"mn": 470, "mx": 540},
+        "Psikologi": {"mn": 520, "mx": 590},
+        "Sastra Indonesia": {"mn": 440, "mx": 510},
+        "Sastra Inggris": {"mn": 470, "mx": 540},
+        "Sejarah": {"mn": 440, "mx": 510},
+        "Agribisnis": {"mn": 460, "mx": 530},
+        "Agroteknologi": {"mn": 450, "mx": 520},
+        "Peternakan": {"mn": 440, "mx": 510},
+        "Kehutanan": {"mn": 440, "mx": 510},
+        "Teknologi Pangan": {"mn": 480, "mx": 550},
+        "Ilmu Kelautan": {"mn": 460, "mx": 530},
+        "Budidaya Perairan": {"mn": 450, "mx": 520},
+        "Ilmu Tanah": {"mn": 440, "mx": 510},
+    },
+    "Universitas Mulawarman": {
+        "Pendidikan Dokter": {"mn": 590, "mx": 660},
+        "Ilmu Keperawatan": {"mn": 470, "mx": 540},
+        "Kesehatan Masyarakat": {"mn": 460, "mx": 530},
+        "Farmasi": {"mn": 520, "mx": 590},
+        "Teknik Sipil": {"mn": 490, "mx": 560},
+        "Teknik Mesin": {"mn": 480, "mx": 550},
+        "Teknik Elektro": {"mn": 500, "mx": 570},
+        "Teknik Kimia": {"mn": 490, "mx": 560},
+        "Teknik Informatika": {"mn": 520, "mx": 590},
+        "Ilmu Komputer": {"mn": 510, "mx": 580},
+        "Teknik Pertambangan": {"mn": 490, "mx": 560},
+        "Teknik Geologi": {"mn": 490, "mx": 560},
+        "Teknik Perminyakan": {"mn": 510, "mx": 580},
+        "Arsitektur": {"mn": 490, "mx": 560},
+        "Teknik Lingkungan": {"mn": 470, "mx": 540},
+        "Matematika": {"mn": 440, "mx": 510},
+        "Fisika": {"mn": 420, "mx": 490},
+        "Kimia": {"mn": 430, "mx": 500},
+        "Biologi": {"mn": 430, "mx": 500},
+        "Ilmu Hukum": {"mn": 450, "mx": 520},
+        "Ilmu Ekonomi": {"mn": 450, "mx": 520},
+        "Akuntansi": {"mn": 470, "mx": 540},
+        "Manajemen": {"mn": 480, "mx": 550},
+        "Ilmu Komunikasi": {"mn": 460, "mx": 530},
+        "Sosiologi": {"mn": 420, "mx": 490},
+        "Ilmu Pemerintahan": {"mn": 430, "mx": 500},
+        "Administrasi Bisnis": {"mn": 440, "mx": 510},
+        "Administrasi Negara": {"mn": 435, "mx": 505},
+        "Sastra Indonesia": {"mn": 405, "mx": 475},
+        "Sastra Inggris": {"mn": 430, "mx": 500},
+        "Agribisnis": {"mn": 415, "mx": 485},
+        "Agroteknologi": {"mn": 410, "mx": 480},
+        "Peternakan": {"mn": 405, "mx": 475},
+        "Kehutanan": {"mn": 415, "mx": 485},
+        "Ilmu Kelautan": {"mn": 415, "mx": 485},
+        "Budidaya Perairan": {"mn": 410, "mx": 480},
+        "Teknologi Pangan": {"mn": 435, "mx": 505},
+        "Ilmu Tanah": {"mn": 405, "mx": 475},
+    },
+    "Universitas Syiah Kuala": {
+        "Pendidikan Dokter": {"mn": 650, "mx": 720},
+        "Ilmu Keperawatan": {"mn": 530, "mx": 600},
+        "Kesehatan Masyarakat": {"mn": 520, "mx": 590},
+        "Kedokteran Gigi": {"mn": 600, "mx": 670},
+        "Farmasi": {"mn": 560, "mx": 630},
+        "Kedokteran Hewan": {"mn": 560, "mx": 630},
+        "Teknik Sipil": {"mn": 550, "mx": 620},
+        "Teknik Mesin": {"mn": 540, "mx": 610},
+        "Teknik Elektro": {"mn": 560, "mx": 630},
+        "Teknik Kimia": {"mn": 550, "mx": 620},
+        "Teknik Informatika": {"mn": 580, "mx": 650},
+        "Arsitektur": {"mn": 560, "mx": 630},
+        "Teknik Geologi": {"mn": 540, "mx": 610},
+        "Teknik Industri": {"mn": 545, "mx": 615},
+        "Matematika": {"mn": 490, "mx": 560},
+        "Fisika": {"mn": 470, "mx": 540},
+        "Kimia": {"mn": 480, "mx": 550},
+        "Biologi": {"mn": 480, "mx": 550},
+        "Ilmu Hukum": {"mn": 500, "mx": 570},
+        "Ilmu Ekonomi": {"mn": 500, "mx": 570},
+        "Akuntansi": {"mn": 520, "mx": 590},
+        "Manajemen": {"mn": 530, "mx": 600},
+        "Ilmu Komunikasi": {"mn": 510, "mx": 580},
+        "Sosiologi": {"mn": 470, "mx": 540},
+        "Ilmu Pemerintahan": {"mn": 480, "mx": 550},
+        "Administrasi Negara": {"mn": 480, "mx": 550},
+        "Hubungan Internasional": {"mn": 510, "mx": 580},
+        "Ilmu Politik": {"mn": 475, "mx": 545},
+        "Psikologi": {"mn": 530, "mx": 600},
+        "Sastra Indonesia": {"mn": 440, "mx": 510},
+        "Sastra Inggris": {"mn": 470, "mx": 540},
+        "Sastra Arab": {"mn": 450, "mx": 520},
+        "Agribisnis": {"mn": 460, "mx": 530},
+        "Agroteknologi": {"mn": 450, "mx": 520},
+        "Peternakan": {"mn": 440, "mx": 510},
+        "Kehutanan": {"mn": 440, "mx": 510},
+        "Teknologi Pangan": {"mn": 470, "mx": 540},
+        "Ilmu Kelautan": {"mn": 460, "mx": 530},
+        "Budidaya Perairan": {"mn": 445, "mx": 515},
+    },
+    "Universitas Negeri Jakarta": {
+        "Pendidikan Matematika": {"mn": 560, "mx": 630},
+        "Pendidikan Biologi": {"mn": 540, "mx": 610},
+        "Pendidikan Kimia": {"mn": 540, "mx": 610},
+        "Pendidikan Fisika": {"mn": 540, "mx": 610},
+        "Matematika": {"mn": 540, "mx": 610},
+        "Biologi": {"mn": 520, "mx": 590},
+        "Kimia": {"mn": 520, "mx": 590},
+        "Fisika": {"mn": 520, "mx": 590},
+        "Ilmu Komputer": {"mn": 570, "mx": 640},
+        "Teknik Informatika": {"mn": 580, "mx": 650},
+        "Teknik Elektro": {"mn": 540, "mx": 610},
+        "Teknik Mesin": {"mn": 530, "mx": 600},
+        "Teknik Sipil": {"mn": 530, "mx": 600},
+        "Pendidikan Bahasa Inggris": {"mn": 570, "mx": 640},
+        "Pendidikan Bahasa Indonesia": {"mn": 530, "mx": 600},
+        "Pendidikan Bahasa Jerman": {"mn": 500, "mx": 570},
+        "Pendidikan Bahasa Perancis": {"mn": 500, "mx": 570},
+        "Pendidikan Bahasa Arab": {"mn": 495, "mx": 565},
+        "Pendidikan Ekonomi": {"mn": 530, "mx": 600},
+        "Manajemen": {"mn": 560, "mx": 630},
+        "Akuntansi": {"mn": 560, "mx": 630},
+        "Pendidikan Akuntansi": {"mn": 520, "mx": 590},
+        "Pendidikan Sejarah": {"mn": 490, "mx": 560},
+        "Pendidikan Sosiologi": {"mn": 490, "mx": 560},
+        "Pendidikan Geografi": {"mn": 490, "mx": 560},
+        "Sosiologi": {"mn": 500, "mx": 570},
+        "Ilmu Komunikasi": {"mn": 560, "mx": 630},
+        "Psikologi": {"mn": 575, "mx": 645},
+        "Ilmu Keolahragaan": {"mn": 460, "mx": 530},
+        "Pendidikan Jasmani Kesehatan dan Rekreasi": {"mn": 450, "mx": 520},
+        "Pendidikan Kepelatihan Olahraga": {"mn": 445, "mx": 515},
+        "Pendidikan Luar Biasa": {"mn": 470, "mx": 540},
+        "Pendidikan Guru Sekolah Dasar": {"mn": 490, "mx": 560},
+        "Bimbingan dan Konseling": {"mn": 470, "mx": 540},
+        "Administrasi Pendidikan": {"mn": 470, "mx": 540},
+        "Teknologi Pendidikan": {"mn": 470, "mx": 540},
+        "Pendidikan Seni Rupa": {"mn": 445, "mx": 515},
+        "Pendidikan Seni Musik": {"mn": 445, "mx": 515},
+        "Desain Komunikasi Visual": {"mn": 555, "mx": 625},
+        "Pendidikan Vokasional Teknik Elektronika": {"mn": 500, "mx": 570},
+        "Pendidikan Vokasional Konstruksi Bangunan": {"mn": 490, "mx": 560},
+    },
+    "Universitas Negeri Makassar": {
+        "Pendidikan Matematika": {"mn": 530, "mx": 600},
+        "Pendidikan Biologi": {"mn": 510, "mx": 580},
+        "Pendidikan Kimia": {"mn": 510, "mx": 580},
+        "Pendidikan Fisika": {"mn": 510, "mx": 580},
+        "Matematika": {"mn": 510, "mx": 580},
+        "Biologi": {"mn": 490, "mx": 560},
+        "Kimia": {"mn": 490, "mx": 560},
+        "Fisika": {"mn": 490, "mx": 560},
+        "Ilmu Komputer": {"mn": 540, "mx": 610},
+        "Teknik Informatika": {"mn": 550, "mx": 620},
+        "Teknik Elektro": {"mn": 510, "mx": 580},
+        "Teknik Mesin": {"mn": 500, "mx": 570},
+        "Teknik Sipil": {"mn": 510, "mx": 580},
+        "Arsitektur": {"mn": 520, "mx": 590},
+        "Pendidikan Bahasa Inggris": {"mn": 540, "mx": 610},
+        "Pendidikan Bahasa Indonesia": {"mn": 500, "mx": 570},
+        "Pendidikan Bahasa Arab": {"mn": 480, "mx": 550},
+        "Pendidikan Ekonomi": {"mn": 500, "mx": 570},
+        "Manajemen": {"mn": 530, "mx": 600},
+        "Akuntansi": {"mn": 530, "mx": 600},
+        "Pendidikan Akuntansi": {"mn": 490, "mx": 560},
+        "Ilmu Ekonomi": {"mn": 510, "mx": 580},
+        "Administrasi Bisnis": {"mn": 490, "mx": 560},
+        "Administrasi Negara": {"mn": 485, "mx": 555},
+        "Pendidikan Sejarah": {"mn": 460, "mx": 530},
+        "Pendidikan Sosiologi": {"mn": 460, "mx": 530},
+        "Pendidikan Geografi": {"mn": 460, "mx": 530},
+        "Sosiologi": {"mn": 470, "mx": 540},
+        "Ilmu Komunikasi": {"mn": 520, "mx": 590},
+        "Psikologi": {"mn": 540, "mx": 610},
+        "Ilmu Keolahragaan": {"mn": 440, "mx": 510},
+        "Pendidikan Jasmani Kesehatan dan Rekreasi": {"mn": 430, "mx": 500},
+        "Pendidikan Luar Biasa": {"mn": 440, "mx": 510},
+        "Pendidikan Guru Sekolah Dasar": {"mn": 460, "mx": 530},
+        "Bimbingan dan Konseling": {"mn": 440, "mx": 510},
+        "Teknologi Pendidikan": {"mn": 440, "mx": 510},
+        "Pendidikan Seni Rupa": {"mn": 420, "mx": 490},
+        "Seni Rupa": {"mn": 420, "mx": 490},
+        "Pendidikan Teknik Otomotif": {"mn": 460, "mx": 530},
+        "Pendidikan Teknik Bangunan": {"mn": 455, "mx": 525},
+    },
+    "Universitas Tanjungpura": {
+        "Pendidikan Dokter": {"mn": 610, "mx": 680},
+        "Ilmu Keperawatan": {"mn": 490, "mx": 560},
+        "Kesehatan Masyarakat": {"mn": 480, "mx": 550},
+        "Farmasi": {"mn": 530, "mx": 600},
+        "Teknik Sipil": {"mn": 510, "mx": 580},
+        "Teknik Mesin": {"mn": 500, "mx": 570},
+        "Teknik Elektro": {"mn": 520, "mx": 590},
+        "Teknik Kimia": {"mn": 510, "mx": 580},
+        "Teknik Informatika": {"mn": 540, "mx": 610},
+        "Ilmu Komputer": {"mn": 530, "mx": 600},
+        "Teknik Lingkungan": {"mn": 495, "mx": 565},
+        "Arsitektur": {"mn": 510, "mx": 580},
+        "Teknik Pertambangan": {"mn": 495, "mx": 565},
+        "Matematika": {"mn": 460, "mx": 530},
+        "Fisika": {"mn": 440, "mx": 510},
+        "Kimia": {"mn": 450, "mx": 520},
+        "Biologi": {"mn": 450, "mx": 520},
+        "Statistika": {"mn": 470, "mx": 540},
+        "Ilmu Hukum": {"mn": 470, "mx": 540},
+        "Ilmu Ekonomi": {"mn": 470, "mx": 540},
+        "Akuntansi": {"mn": 490, "mx": 560},
+        "Manajemen": {"mn": 500, "mx": 570},
+        "Ilmu Komunikasi": {"mn": 480, "mx": 550},
+        "Sosiologi": {"mn": 440, "mx": 510},
+        "Ilmu Pemerintahan": {"mn": 445, "mx": 515},
+        "Administrasi Publik": {"mn": 445, "mx": 515},
+        "Ilmu Politik": {"mn": 440, "mx": 510},
+        "Hubungan Internasional": {"mn": 475, "mx": 545},
+        "Psikologi": {"mn": 500, "mx": 570},
+        "Sastra Indonesia": {"mn": 415, "mx": 485},
+        "Sastra Inggris": {"mn": 445, "mx": 515},
+        "Sejarah": {"mn": 415, "mx": 485},
+        "Agribisnis": {"mn": 430, "mx": 500},
+        "Agroteknologi": {"mn": 420, "mx": 490},
+        "Peternakan": {"mn": 410, "mx": 480},
+        "Kehutanan": {"mn": 420, "mx": 490},
+        "Ilmu Kelautan": {"mn": 430, "mx": 500},
+        "Budidaya Perairan": {"mn": 415, "mx": 485},
+        "Teknologi Pangan": {"mn": 445, "mx": 515},
+    },
+    "Universitas Mataram": {
+        "Pendidikan Dokter": {"mn": 630, "mx": 700},
+        "Ilmu Keperawatan": {"mn": 500, "mx": 570},
+        "Kesehatan Masyarakat": {"mn": 490, "mx": 560},
+        "Kedokteran Gigi": {"mn": 580, "mx": 650},
+        "Farmasi": {"mn": 540, "mx": 610},
+        "Teknik Sipil": {"mn": 520, "mx": 590},
+        "Teknik Mesin": {"mn": 510, "mx": 580},
+        "Teknik Elektro": {"mn": 530, "mx": 600},
+        "Teknik Informatika": {"mn": 550, "mx": 620},
+        "Sistem Informasi": {"mn": 530, "mx": 600},
+        "Teknik Pertambangan": {"mn": 500, "mx": 570},
+        "Teknik Lingkungan": {"mn": 495, "mx": 565},
+        "Arsitektur": {"mn": 515, "mx": 585},
+        "Matematika": {"mn": 470, "mx": 540},
+        "Fisika": {"mn": 450, "mx": 520},
+        "Kimia": {"mn": 460, "mx": 530},
+        "Biologi": {"mn": 460, "mx": 530},
+        "Ilmu Hukum": {"mn": 480, "mx": 550},
+        "Ilmu Ekonomi": {"mn": 480, "mx": 550},
+        "Akuntansi": {"mn": 500, "mx": 570},
+        "Manajemen": {"mn": 510, "mx": 580},
+        "Ilmu Komunikasi": {"mn": 490, "mx": 560},
+        "Sosiologi": {"mn": 450, "mx": 520},
+        "Ilmu Pemerintahan": {"mn": 455, "mx": 525},
+        "Administrasi Negara": {"mn": 455, "mx": 525},
+        "Hubungan Internasional": {"mn": 480, "mx": 550},
+        "Ilmu Politik": {"mn": 450, "mx": 520},
+        "Psikologi": {"mn": 510, "mx": 580},
+        "Sastra Indonesia": {"mn": 425, "mx": 495},
+        "Sastra Inggris": {"mn": 455, "mx": 525},
+        "Sastra Arab": {"mn": 430, "mx": 500},
+        "Agribisnis": {"mn": 440, "mx": 510},
+        "Agroteknologi": {"mn": 430, "mx": 500},
+        "Peternakan": {"mn": 420, "mx": 490},
+        "Kehutanan": {"mn": 425, "mx": 495},
+        "Ilmu Kelautan": {"mn": 435, "mx": 505},
+        "Budidaya Perairan": {"mn": 425, "mx": 495},
+        "Teknologi Pangan": {"mn": 455, "mx": 525},
+        "Ilmu Tanah": {"mn": 420, "mx": 490},
+        "Pariwisata": {"mn": 480, "mx": 550},
+    },
+    "Universitas Bengkulu": {
+        "Pendidikan Dokter": {"mn": 600, "mx": 670},
+        "Ilmu Keperawatan": {"mn": 480, "mx": 550},
+        "Kesehatan Masyarakat": {"mn": 470, "mx": 540},
+        "Farmasi": {"mn": 510, "mx": 580},
+        "Teknik Sipil": {"mn": 495, "mx": 565},
+        "Teknik Mesin": {"mn": 485, "mx": 555},
+        "Teknik Elektro": {"mn": 505, "mx": 575},
+        "Teknik Informatika": {"mn": 525, "mx": 595},
+        "Ilmu Komputer": {"mn": 515, "mx": 585},
+        "Teknik Kimia": {"mn": 490, "mx": 560},
+        "Teknik Lingkungan": {"mn": 475, "mx": 545},
+        "Matematika": {"mn": 445, "mx": 515},
+        "Fisika": {"mn": 425, "mx": 495},
+        "Kimia": {"mn": 435, "mx": 505},
+        "Biologi": {"mn": 435, "mx": 505},
+        "Ilmu Hukum": {"mn": 455, "mx": 525},
+        "Ilmu Ekonomi": {"mn": 455, "mx": 525},
+        "Akuntansi": {"mn": 475, "mx": 545},
+        "Manajemen": {"mn": 485, "mx": 555},
+        "Ilmu Komunikasi": {"mn": 465, "mx": 535},
+        "Sosiologi": {"mn": 425, "mx": 495},
+        "Ilmu Pemerintahan": {"mn": 430, "mx": 500},
+        "Administrasi Negara": {"mn": 430, "mx": 500},
+        "Ilmu Politik": {"mn": 425, "mx": 495},
+        "Hubungan Internasional": {"mn": 455, "mx": 525},
+        "Psikologi": {"mn": 485, "mx": 555},
+        "Sastra Indonesia": {"mn": 400, "mx": 470},
+        "Sastra Inggris": {"mn": 430, "mx": 500},
+        "Sejarah": {"mn": 400, "mx": 470},
+        "Agribisnis": {"mn": 415, "mx": 485},
+        "Agroteknologi": {"mn": 405, "mx": 475},
+        "Peternakan": {"mn": 400, "mx": 470},
+        "Kehutanan": {"mn": 410, "mx": 480},
+        "Ilmu Kelautan": {"mn": 415, "mx": 485},
+        "Budidaya Perairan": {"mn": 405, "mx": 475},
+        "Teknologi Pangan": {"mn": 430, "mx": 500},
+        "Ilmu Tanah": {"mn": 400, "mx": 470},
+    },
+    "Universitas Sam Ratulangi": {
+        "Pendidikan Dokter": {"mn": 640, "mx": 710},
+        "Ilmu Keperawatan": {"mn": 520, "mx": 590},
+        "Kesehatan Masyarakat": {"mn": 510, "mx": 580},
+        "Kedokteran Gigi": {"mn": 590, "mx": 660},
+        "Farmasi": {"mn": 550, "mx": 620},
+        "Kedokteran Hewan": {"mn": 545, "mx": 615},
+        "Teknik Sipil": {"mn": 540, "mx": 610},
+        "Teknik Mesin": {"mn": 530, "mx": 600},
+        "Teknik Elektro": {"mn": 550, "mx": 620},
+        "Teknik Informatika": {"mn": 570, "mx": 640},
+        "Arsitektur": {"mn": 550, "mx": 620},
+        "Teknik Lingkungan": {"mn": 520, "mx": 590},
+        "Matematika": {"mn": 480, "mx": 550},
+        "Fisika": {"mn": 460, "mx": 530},
+        "Kimia": {"mn": 470, "mx": 540},
+        "Biologi": {"mn": 470, "mx": 540},
+        "Ilmu Hukum": {"mn": 490, "mx": 560},
+        "Ilmu Ekonomi": {"mn": 490, "mx": 560},
+        "Akuntansi": {"mn": 510, "mx": 580},
+        "Manajemen": {"mn": 520, "mx": 590},
+        "Ilmu Komunikasi": {"mn": 500, "mx": 570},
+        "Sosiologi": {"mn": 460, "mx": 530},
+        "Ilmu Pemerintahan": {"mn": 460, "mx": 530},
+        "Administrasi Bisnis": {"mn": 470, "mx": 540},
+        "Hubungan Internasional": {"mn": 490, "mx": 560},
+        "Ilmu Politik": {"mn": 460, "mx": 530},
+        "Psikologi": {"mn": 510, "mx": 580},
+        "Sastra Indonesia": {"mn": 430, "mx": 500},
+        "Sastra Inggris": {"mn": 460, "mx": 530},
+        "Agribisnis": {"mn": 440, "mx": 510},
+        "Agroteknologi": {"mn": 430, "mx": 500},
+        "Peternakan": {"mn": 420, "mx": 490},
+        "Ilmu Kelautan": {"mn": 440, "mx": 510},
+        "Budidaya Perairan": {"mn": 430, "mx": 500},
+        "Teknologi Pangan": {"mn": 450, "mx": 520},
+        "Kehutanan": {"mn": 430, "mx": 500},
+    },
+}
+
+
+# ══════════════════════════════════════════════════════════
+# BOBOT PER JURUSAN
+# ══════════════════════════════════════════════════════════
+BOBOT_KEYWORD = {
+    "Teknik Informatika":    {"PU":.20,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.10,"PM":.35},
+    "Rekayasa Perangkat Lunak":{"PU":.20,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.10,"PM":.35},
+    "Teknologi Informasi":   {"PU":.20,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.10,"PM":.35},
+    "Ilmu Komputer":         {"PU":.20,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.10,"PM":.35},
+    "Teknik Komputer":       {"PU":.20,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.10,"PM":.35},
+    "Teknik Sipil":          {"PU":.20,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.10,"PM":.35},
+    "Teknik Mesin":          {"PU":.20,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.10,"PM":.35},
+    "Teknik Elektro":        {"PU":.20,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.10,"PM":.35},
+    "Teknik Industri":       {"PU":.20,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.10,"PM":.35},
+    "Teknik Kimia":          {"PU":.18,"PPU":.08,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.07,"PM":.37},
+    "Mekatronika":           {"PU":.19,"PPU":.06,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.08,"PM":.37},
+    "Matematika":            {"PU":.15,"PPU":.05,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.05,"PM":.45},
+    "Fisika":                {"PU":.18,"PPU":.07,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.05,"PM":.40},
+    "Kimia":                 {"PU":.18,"PPU":.10,"PBM":.07,"PK":.18,"LBI":.07,"LBE":.05,"PM":.35},
+    "Biologi":               {"PU":.20,"PPU":.15,"PBM":.10,"PK":.15,"LBI":.10,"LBE":.08,"PM":.22},
+    "Statistika":            {"PU":.15,"PPU":.07,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.05,"PM":.43},
+    "Aktuaria":              {"PU":.15,"PPU":.07,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.05,"PM":.43},
+    "Bioteknologi":          {"PU":.20,"PPU":.15,"PBM":.10,"PK":.15,"LBI":.10,"LBE":.08,"PM":.22},
+    "Arsitektur":            {"PU":.20,"PPU":.10,"PBM":.10,"PK":.18,"LBI":.10,"LBE":.10,"PM":.22},
+    "Teknik Lingkungan":     {"PU":.20,"PPU":.10,"PBM":.07,"PK":.18,"LBI":.07,"LBE":.08,"PM":.30},
+    "Teknik Geologi":        {"PU":.20,"PPU":.10,"PBM":.07,"PK":.18,"LBI":.07,"LBE":.08,"PM":.30},
+    "Teknik Perminyakan":    {"PU":.20,"PPU":.10,"PBM":.07,"PK":.18,"LBI":.07,"LBE":.08,"PM":.30},
+    "Teknik Perkapalan":     {"PU":.20,"PPU":.07,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.08,"PM":.35},
+    "Teknik Geodesi":        {"PU":.20,"PPU":.08,"PBM":.07,"PK":.18,"LBI":.07,"LBE":.08,"PM":.32},
+    "Teknik Otomotif":       {"PU":.20,"PPU":.07,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.08,"PM":.35},
+    "Teknik Elektronika":    {"PU":.20,"PPU":.06,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.08,"PM":.36},
+    "Rekayasa Kimia":        {"PU":.18,"PPU":.08,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.07,"PM":.37},
+    "Teknologi Pangan":      {"PU":.18,"PPU":.12,"PBM":.08,"PK":.18,"LBI":.10,"LBE":.07,"PM":.27},
+    "Analisis Kimia":        {"PU":.18,"PPU":.12,"PBM":.08,"PK":.18,"LBI":.08,"LBE":.07,"PM":.29},
+    "Manufaktur":            {"PU":.20,"PPU":.07,"PBM":.05,"PK":.20,"LBI":.05,"LBE":.08,"PM":.35},
+    "Geomatika":             {"PU":.20,"PPU":.08,"PBM":.07,"PK":.18,"LBI":.07,"LBE":.08,"PM":.32},
+    "Geofisika":             {"PU":.18,"PPU":.08,"PBM":.06,"PK":.20,"LBI":.06,"LBE":.07,"PM":.35},
+    "Penginderaan Jauh":     {"PU":.18,"PPU":.10,"PBM":.08,"PK":.18,"LBI":.08,"LBE":.08,"PM":.30},
+    "Logistik":              {"PU":.20,"PPU":.12,"PBM":.14,"PK":.16,"LBI":.14,"LBE":.10,"PM":.14},
+    "Supply Chain":          {"PU":.20,"PPU":.12,"PBM":.14,"PK":.16,"LBI":.14,"LBE":.10,"PM":.14},
+    "Kedokteran":            {"PU":.20,"PPU":.15,"PBM":.10,"PK":.15,"LBI":.10,"LBE":.10,"PM":.20},
+    "Kedokteran Gigi":       {"PU":.20,"PPU":.15,"PBM":.10,"PK":.15,"LBI":.10,"LBE":.10,"PM":.20},
+    "Farmasi":               {"PU":.18,"PPU":.12,"PBM":.08,"PK":.18,"LBI":.08,"LBE":.08,"PM":.28},
+    "Gizi":                  {"PU":.18,"PPU":.13,"PBM":.10,"PK":.15,"LBI":.13,"LBE":.08,"PM":.23},
+    "Gizi Klinik":           {"PU":.18,"PPU":.13,"PBM":.10,"PK":.15,"LBI":.13,"LBE":.08,"PM":.23},
+    "Keperawatan":           {"PU":.18,"PPU":.12,"PBM":.12,"PK":.12,"LBI":.15,"LBE":.08,"PM":.23},
+    "Kesehatan Masyarakat":  {"PU":.20,"PPU":.12,"PBM":.12,"PK":.12,"LBI":.15,"LBE":.08,"PM":.21},
+    "Fisioterapi":           {"PU":.19,"PPU":.13,"PBM":.12,"PK":.13,"LBI":.15,"LBE":.08,"PM":.20},
+    "Kebidanan":             {"PU":.18,"PPU":.14,"PBM":.13,"PK":.12,"LBI":.17,"LBE":.08,"PM":.18},
+    "Radiologi":             {"PU":.18,"PPU":.12,"PBM":.08,"PK":.20,"LBI":.10,"LBE":.07,"PM":.25},
+    "Rekam Medis":           {"PU":.18,"PPU":.12,"PBM":.14,"PK":.15,"LBI":.16,"LBE":.08,"PM":.17},
+    "Analis Kesehatan":      {"PU":.18,"PPU":.13,"PBM":.08,"PK":.18,"LBI":.10,"LBE":.07,"PM":.26},
+    "Laboratorium Medis":    {"PU":.18,"PPU":.13,"PBM":.08,"PK":.18,"LBI":.10,"LBE":.07,"PM":.26},
+    "Keselamatan Kesehatan": {"PU":.20,"PPU":.13,"PBM":.12,"PK":.12,"LBI":.14,"LBE":.10,"PM":.19},
+    "Ekonomi":               {"PU":.20,"PPU":.15,"PBM":.10,"PK":.20,"LBI":.10,"LBE":.10,"PM":.15},
+    "Manajemen":             {"PU":.20,"PPU":.15,"PBM":.12,"PK":.18,"LBI":.12,"LBE":.10,"PM":.13},
+    "Akuntansi":             {"PU":.18,"PPU":.15,"PBM":.10,"PK":.22,"LBI":.10,"LBE":.10,"PM":.15},
+    "Bisnis":                {"PU":.20,"PPU":.15,"PBM":.12,"PK":.18,"LBI":.12,"LBE":.10,"PM":.13},
+    "Perpajakan":            {"PU":.18,"PPU":.14,"PBM":.12,"PK":.22,"LBI":.12,"LBE":.08,"PM":.14},
+    "Keuangan":              {"PU":.18,"PPU":.13,"PBM":.12,"PK":.22,"LBI":.12,"LBE":.08,"PM":.15},
+    "Perbankan":             {"PU":.18,"PPU":.13,"PBM":.12,"PK":.22,"LBI":.12,"LBE":.08,"PM":.15},
+    "Manajemen Pemasaran":   {"PU":.20,"PPU":.14,"PBM":.17,"PK":.12,"LBI":.18,"LBE":.12,"PM":.07},
+    "Administrasi Bisnis":   {"PU":.20,"PPU":.15,"PBM":.18,"PK":.12,"LBI":.18,"LBE":.10,"PM":.07},
+    "Penilaian Properti":    {"PU":.20,"PPU":.13,"PBM":.12,"PK":.18,"LBI":.12,"LBE":.10,"PM":.15},
+    "Pariwisata":            {"PU":.18,"PPU":.13,"PBM":.18,"PK":.08,"LBI":.18,"LBE":.18,"PM":.07},
+    "Perhotelan":            {"PU":.18,"PPU":.12,"PBM":.17,"PK":.08,"LBI":.18,"LBE":.20,"PM":.07},
+    "Perjalanan Wisata":     {"PU":.18,"PPU":.12,"PBM":.17,"PK":.08,"LBI":.18,"LBE":.20,"PM":.07},
+    "Ilmu Hukum":            {"PU":.22,"PPU":.18,"PBM":.20,"PK":.08,"LBI":.18,"LBE":.10,"PM":.04},
+    "Psikologi":             {"PU":.22,"PPU":.15,"PBM":.18,"PK":.10,"LBI":.18,"LBE":.10,"PM":.07},
+    "Ilmu Komunikasi":       {"PU":.20,"PPU":.15,"PBM":.22,"PK":.08,"LBI":.20,"LBE":.10,"PM":.05},
+    "Hubungan Masyarakat":   {"PU":.20,"PPU":.15,"PBM":.22,"PK":.07,"LBI":.22,"LBE":.10,"PM":.04},
+    "Hubungan Internasional":{"PU":.20,"PPU":.15,"PBM":.15,"PK":.08,"LBI":.17,"LBE":.20,"PM":.05},
+    "Administrasi Publik":   {"PU":.22,"PPU":.15,"PBM":.18,"PK":.08,"LBI":.20,"LBE":.10,"PM":.07},
+    "Sosiologi":             {"PU":.22,"PPU":.17,"PBM":.18,"PK":.08,"LBI":.18,"LBE":.10,"PM":.07},
+    "Ilmu Politik":          {"PU":.22,"PPU":.17,"PBM":.18,"PK":.08,"LBI":.18,"LBE":.10,"PM":.07},
+    "Sejarah":               {"PU":.20,"PPU":.20,"PBM":.18,"PK":.05,"LBI":.22,"LBE":.10,"PM":.05},
+    "Geografi":              {"PU":.20,"PPU":.15,"PBM":.15,"PK":.12,"LBI":.15,"LBE":.08,"PM":.15},
+    "Komunikasi":            {"PU":.20,"PPU":.15,"PBM":.22,"PK":.08,"LBI":.20,"LBE":.10,"PM":.05},
+    "Sastra Inggris":        {"PU":.12,"PPU":.12,"PBM":.20,"PK":.05,"LBI":.15,"LBE":.31,"PM":.05},
+    "Bahasa Inggris":        {"PU":.12,"PPU":.12,"PBM":.18,"PK":.05,"LBI":.12,"LBE":.33,"PM":.08},
+    "Bahasa Indonesia":      {"PU":.12,"PPU":.12,"PBM":.22,"PK":.05,"LBI":.32,"LBE":.12,"PM":.05},
+    "Pendidikan Bahasa Inggris":{"PU":.12,"PPU":.12,"PBM":.18,"PK":.05,"LBI":.12,"LBE":.33,"PM":.08},
+    "Pendidikan Bahasa Indonesia":{"PU":.12,"PPU":.12,"PBM":.22,"PK":.05,"LBI":.32,"LBE":.12,"PM":.05},
+    "Desain Grafis":         {"PU":.18,"PPU":.10,"PBM":.18,"PK":.12,"LBI":.18,"LBE":.12,"PM":.12},
+    "Animasi":               {"PU":.18,"PPU":.10,"PBM":.15,"PK":.15,"LBI":.17,"LBE":.12,"PM":.13},
+    "Seni":                  {"PU":.18,"PPU":.12,"PBM":.20,"PK":.08,"LBI":.20,"LBE":.12,"PM":.10},
+    "Agribisnis":            {"PU":.20,"PPU":.15,"PBM":.12,"PK":.15,"LBI":.15,"LBE":.08,"PM":.15},
+    "Kehutanan":             {"PU":.20,"PPU":.15,"PBM":.12,"PK":.15,"LBI":.15,"LBE":.08,"PM":.15},
+    "Peternakan":            {"PU":.20,"PPU":.15,"PBM":.12,"PK":.14,"LBI":.14,"LBE":.08,"PM":.17},
+}
+DEFAULT_BOBOT = {"PU":.16,"PPU":.14,"PBM":.14,"PK":.14,"LBI":.14,"LBE":.14,"PM":.14}
@@ -0,0 +1,735 @@
+"""
+Mesin skor Skoria tanpa ketergantungan Streamlit: kategori & skor tertimbang,
+bobot per jurusan, katalog prodi, prediksi & penjelasan strategi, rekomendasi
+alternatif, roster kelas, dan rencana belajar mingguan.
+
+app.py hanyalah UI di atas modul ini; job batch, benchmark, atau server API cukup
+
+    import mesin_skor
+    r = mesin_skor.compute({"PU": 620, ..., "kampus": "...", "prodi": "...", "jenjang": "S1 (Sarjana)"})
+
+Import modul ini tidak meng-import streamlit, pandas, plotly, maupun lightgbm.
+Sumber daya berat (katalog, resolver bobot, indeks alternatif, registri model, cache
+hasil) dibangun saat pertama dipakai, sekali per proses (`_per_proses`, padanan
+`st.cache_resource`), lalu dipakai bersama semua thread — juga semua sesi Streamlit.
+"""
+import copy, functools, hashlib, importlib, os, threading, time
+from collections import OrderedDict
+from types import MappingProxyType
+import numpy as np
+
+from data_ptn import PTN_PRODI_D3, PTN_PRODI_D4, PTN_PRODI_S1, BOBOT_KEYWORD, DEFAULT_BOBOT
+from model_strategi import FITUR_LGBM, RegistriModel, fitur_lgbm
+import tabel_bersama as tb
+
+_KOSONG = object()
+
+def _per_proses(fn):
+    """Hasil fn(*args) dibuat sekali per proses (thread-safe), seperti st.cache_resource."""
+    hasil, kunci = {}, threading.Lock()
+    @functools.wraps(fn)
+    def bungkus(*args):
+        v = hasil.get(args, _KOSONG)
+        if v is _KOSONG:
+            with kunci:
+                v = hasil.get(args, _KOSONG)
+                if v is _KOSONG:
+                    v = hasil[args] = fn(*args)
+        return v
+    bungkus.clear = hasil.clear
+    return bungkus
+
+# ══════════════════════════════════════════════════════════
+# KONSTANTA
+# ══════════════════════════════════════════════════════════
+SKOR_MIN_TPS = 200
+SKOR_MAX_TPS = 1000
+
+SUBTES = ["PU","PPU","PBM","PK","LBI","LBE","PM"]
+SUBTES_FULL = {
+    "PU":  "Penalaran Umum",
+    "PPU": "Pem. & Pengetahuan Umum",
+    "PBM": "Pemahaman Bacaan & Menulis",
+    "PK":  "Pengetahuan Kuantitatif",
+    "LBI": "Literasi Bahasa Indonesia",
+    "LBE": "Literasi Bahasa Inggris",
+    "PM":  "Penalaran Matematika",
+}
+DAFTAR_JENJANG = ["S1 (Sarjana)", "D4 (Sarjana Terapan)", "D3 (Diploma Tiga)"]
+
+# ══════════════════════════════════════════════════════════
+# KATEGORI SKOR — 4 Level
+# ══════════════════════════════════════════════════════════
+def get_kategori_skor(sw, mn, mx):
+    if sw >= mx:
+        return ("Sangat Aman",  "#148a42", "badge-sa", "🏆",
+                min(95.0, 80 + (sw - mx) / max(mx, 1) * 15))
+    elif sw >= mn:
+        return ("Aman",         "#1a5fa0", "badge-a",  "✅",
+                60 + (sw - mn) / max(mx - mn, 1) * 18)
+    elif sw >= mn - 70:
+        gap = sw - mn
+        return ("Berisiko",     "#e67e22", "badge-br", "⚡",
+                max(20, 35 + gap / 70 * 20))
+    else:
+        return ("Tidak Aman",   "#c0392b", "badge-na", "🔴",
+                max(5, 18 + (sw - (mn - 140)) / 70 * 12))
+
+# ══════════════════════════════════════════════════════════
+# BOBOT PER JURUSAN (data: BOBOT_KEYWORD / DEFAULT_BOBOT di data_ptn.py)
+# ══════════════════════════════════════════════════════════
+class KeywordMatcher:
+    """Automaton Aho–Corasick atas keyword BOBOT_KEYWORD (case-insensitive).
+
+    `cari(teks)` memindai teks sekali jalan dan mengembalikan bobot dari keyword
+    terpanjang yang muncul; jika panjangnya seri, menang yang lebih dulu di dict.
+    """
+    def __init__(self, keywords):
+        self.goto, self.fail, self.best = [{}], [0], [None]
+        for urut, (kw, bobot) in enumerate(keywords.items()):
+            node = 0
+            for ch in kw.lower():
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({}); self.fail.append(0); self.best.append(None)
+                node = nxt
+            self.best[node] = self._lebih_baik(self.best[node], (len(kw), -urut, bobot))
+        # BFS: isi fail link & wariskan match terbaik dari sufiks
+        antre = list(self.goto[0].values())
+        while antre:
+            node = antre.pop(0)
+            for ch, nxt in self.goto[node].items():
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.best[nxt] = self._lebih_baik(self.best[nxt], self.best[self.fail[nxt]])
+                antre.append(nxt)
+
+    @staticmethod
+    def _lebih_baik(a, b):
+        if a is None: return b
+        if b is None: return a
+        return a if a[:2] >= b[:2] else b
+
+    def cari(self, teks):
+        node, best = 0, None
+        for ch in teks.lower():
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            best = self._lebih_baik(best, self.best[node])
+        return best[2] if best else None
+
+@_per_proses
+def build_bobot_resolver():
+    """Resolusi bobot semua nama prodi di database sekali saja → tabel beku + matcher."""
+    matcher = KeywordMatcher(BOBOT_KEYWORD)
+    tabel = dict(BOBOT_KEYWORD)
+    for db in (PTN_PRODI_S1, PTN_PRODI_D3, PTN_PRODI_D4):
+        for prodi_map in db.values():
+            for p in prodi_map:
+                if p not in tabel:
+                    tabel[p] = matcher.cari(p) or DEFAULT_BOBOT
+    return MappingProxyType(tabel), matcher
+
+def get_bobot(prodi_name):
+    tabel, matcher = build_bobot_resolver()
+    b = tabel.get(prodi_name)
+    if b is None:
+        b = matcher.cari(prodi_name) or DEFAULT_BOBOT
+    return b
+
+# ══════════════════════════════════════════════════════════
+# KATALOG PRODI — struct-of-arrays + indeks hash (kampus, prodi, jenjang)
+# ══════════════════════════════════════════════════════════
+JENJANG_KATALOG = ("S1 (Sarjana)", "D3 (Diploma Tiga)", "D4 (Sarjana Terapan)")
+
+def kode_jenjang(jenjang):
+    """Label jenjang → kode uint8 (0=S1, 1=D3, 2=D4); aturan sama dengan get_db lama."""
+    j = _KODE_JENJANG.get(jenjang)
+    if j is None:
+        j = 2 if "D4" in jenjang else 1 if "D3" in jenjang else 0
+    return j
+
+_KODE_JENJANG = {j: i for i, j in enumerate(JENJANG_KATALOG)}
+
+class Katalog:
+    """Semua prodi D3/D4/S1 dalam satu tabel kolom yang tidak diubah setelah dibangun.
+
+    Baris diurutkan per jenjang lalu urutan kampus/prodi di data_ptn.py, sehingga
+    satu kampus selalu menempati rentang baris yang berurutan.
+      kampus, prodi : int32  — kode ke tuple nama `nama_kampus` / `nama_prodi`
+      jenjang       : uint8  — kode_jenjang()
+      mn, mx        : int16  — rentang skor aman
+      bobot         : int32  — baris di matriks bobot unik `W` (K×7, urutan SUBTES)
+    Indeks: dict kunci gabungan int (jenjang<<40 | kampus<<20 | prodi) → nilai
+    terpaket (baris<<32 | mn<<16 | mx), jadi get_skor_info tidak perlu menyentuh array.
+    """
+    __slots__ = ("nama_kampus", "nama_prodi", "kode_kampus", "kode_prodi",
+                 "kampus", "prodi", "jenjang", "mn", "mx", "bobot", "W",
+                 "_indeks", "_rentang", "_daftar_ptn", "_daftar_prodi")
+
+    KOLOM = ("kampus", "prodi", "jenjang", "mn", "mx", "bobot", "W")
+
+    def __init__(self, sumber):
+        kode_k, kode_p, kode_b = {}, {}, {}
+        cols, W = [], []
+        for j, db in enumerate(sumber):
+            for k, prodi_map in db.items():
+                ik = kode_k.setdefault(k, len(kode_k))
+                for p, info in prodi_map.items():
+                    ip = kode_p.setdefault(p, len(kode_p))
+                    bv = tuple(get_bobot(p)[s] for s in SUBTES)
+                    if bv not in kode_b:
+                        kode_b[bv] = len(W); W.append(bv)
+                    cols.append((ik, ip, j, info["mn"], info["mx"], kode_b[bv]))
+        arr = np.array(cols, dtype=np.int64).reshape(-1, 6)
+        self._pasang(tuple(kode_k), tuple(kode_p), {
+            "kampus": arr[:, 0].astype(np.int32), "prodi": arr[:, 1].astype(np.int32),
+            "jenjang": arr[:, 2].astype(np.uint8), "mn": arr[:, 3].astype(np.int16),
+            "mx": arr[:, 4].astype(np.int16), "bobot": arr[:, 5].astype(np.int32),
+            "W": np.array(W, dtype=float).reshape(-1, len(SUBTES))})
+
+    @classmethod
+    def dari_kolom(cls, kolom):
+        """Katalog di atas array yang sudah ada (mis. view mmap tabel_bersama, tanpa
+        salinan); hanya indeks dict & daftar dropdown yang dibangun ulang di proses ini."""
+        kat = cls.__new__(cls)
+        kat._pasang(tuple(kolom["nama_kampus"].tolist()), tuple(kolom["nama_prodi"].tolist()),
+                    {k: kolom[k] for k in cls.KOLOM})
+        return kat
+
+    def kolom(self):
+        """Semua kolom + nama kampus/prodi sebagai array NumPy (untuk tabel_bersama.tulis)."""
+        return {**{k: getattr(self, k) for k in self.KOLOM},
+                "nama_kampus": np.array(self.nama_kampus, dtype=str),
+                "nama_prodi": np.array(self.nama_prodi, dtype=str)}
+
+    def _pasang(self, nama_kampus, nama_prodi, kolom):
+        self.nama_kampus, self.nama_prodi = nama_kampus, nama_prodi
+        self.kode_kampus = {k: i for i, k in enumerate(nama_kampus)}
+        self.kode_prodi  = {p: i for i, p in enumerate(nama_prodi)}
+        for k in self.KOLOM:
+            v = kolom[k]
+            if v.flags.writeable: v.flags.writeable = False
+            setattr(self, k, v)
+        # Indeks & rentang per (jenjang, kampus) diturunkan dari kolom: satu kampus
+        # selalu menempati baris berurutan
+        indeks, rentang = {}, {}
+        for i, (ik, ip, j, lo, hi) in enumerate(zip(self.kampus.tolist(), self.prodi.tolist(),
+                                                    self.jenjang.tolist(), self.mn.tolist(), self.mx.tolist())):
+            indeks[j << 40 | ik << 20 | ip] = i << 32 | lo << 16 | hi
+            a, _ = rentang.get((j, ik), (i, i))
+            rentang[j, ik] = (a, i + 1)
+        self._indeks, self._rentang = indeks, rentang
+        # Daftar terurut untuk dropdown dihitung sekali
+        self._daftar_ptn = tuple(tuple(sorted(nama_kampus[ik] for jj, ik in rentang if jj == j))
+                                 for j in range(len(JENJANG_KATALOG)))
+        self._daftar_prodi = {(j, ik): tuple(sorted(nama_prodi[p] for p in self.prodi[a:b]))
+                              for (j, ik), (a, b) in rentang.items()}
+
+    def __len__(self):
+        return len(self.mn)
+
+    def cari(self, kampus, prodi, jenjang):
+        """Nilai terpaket (baris<<32 | mn<<16 | mx) untuk (kampus, prodi, jenjang) atau None."""
+        ik = self.kode_kampus.get(kampus); ip = self.kode_prodi.get(prodi)
+        if ik is None or ip is None:
+            return None
+        j = _KODE_JENJANG.get(jenjang)
+        return self._indeks.get((kode_jenjang(jenjang) if j is None else j) << 40 | ik << 20 | ip)
+
+    def baris(self, kampus, prodi, jenjang):
+        v = self.cari(kampus, prodi, jenjang)
+        return None if v is None else v >> 32
+
+    def rentang_kampus(self, jenjang):
+        """{nama kampus: (baris_awal, baris_akhir)} untuk satu jenjang, urutan data_ptn.py."""
+        j = kode_jenjang(jenjang)
+        return {self.nama_kampus[ik]: ab for (jj, ik), ab in self._rentang.items() if jj == j}
+
+    def slice_jenjang(self, jenjang):
+        idx = np.flatnonzero(self.jenjang == kode_jenjang(jenjang))
+        return slice(int(idx[0]), int(idx[-1]) + 1) if idx.size else slice(0, 0)
+
+@_per_proses
+def path_katalog(direktori):
+    """katalog_<sha1 data_ptn.py>.tbl di `direktori` — satu file per versi data_ptn.py."""
+    with open(importlib.import_module("data_ptn").__file__, "rb") as fp:
+        return os.path.join(direktori, f"katalog_{hashlib.sha1(fp.read()).hexdigest()[:16]}.tbl")
+
+@_per_proses
+def load_katalog():
+    """Katalog proses ini. Dengan DATA_BERSAMA kolomnya di-mmap dari path_katalog();
+    proses pertama yang tidak menemukan file itu membangun dan menulisnya (isi ditentukan
+    data_ptn.py, jadi penulis mana pun menghasilkan file sama). Versi lama tidak dihapus
+    di sini — saat rolling deploy worker lama & baru memakai versi berbeda bersamaan;
+    pembersihan hanya oleh loader terpilih (RefresherData di app.py)."""
+    sumber = (PTN_PRODI_S1, PTN_PRODI_D3, PTN_PRODI_D4)
+    if not tb.DIR_BERSAMA:
+        return Katalog(sumber)
+    path = path_katalog(tb.DIR_BERSAMA)
+    try:
+        return Katalog.dari_kolom(tb.buka(path)[0])
+    except (OSError, ValueError, KeyError):
+        pass
+    kat = Katalog(sumber)
+    try:
+        os.makedirs(tb.DIR_BERSAMA, exist_ok=True)
+        tb.tulis(path, kat.kolom())
+        return Katalog.dari_kolom(tb.buka(path)[0])
+    except (OSError, ValueError, KeyError):
+        return kat                            # direktori bersama tidak bisa ditulis: salinan lokal
+
+def get_db(jenjang="S1 (Sarjana)"):
+    """Dict bersarang {kampus: {prodi: {"mn","mx"}}} satu jenjang, dibangun dari katalog."""
+    kat = load_katalog()
+    return {k: {kat.nama_prodi[p]: {"mn": lo, "mx": hi}
+                for p, lo, hi in zip(kat.prodi[a:b].tolist(), kat.mn[a:b].tolist(), kat.mx[a:b].tolist())}
+            for k, (a, b) in kat.rentang_kampus(jenjang).items()}
+
+def get_daftar_ptn(jenjang="S1 (Sarjana)"):
+    return list(load_katalog()._daftar_ptn[kode_jenjang(jenjang)])
+
+def get_daftar_prodi(ptn, jenjang="S1 (Sarjana)"):
+    kat = load_katalog()
+    ik = kat.kode_kampus.get(ptn)
+    return list(kat._daftar_prodi.get((kode_jenjang(jenjang), ik), ()))
+
+def get_skor_info(ptn, prodi, jenjang="S1 (Sarjana)"):
+    v = load_katalog().cari(ptn, prodi, jenjang)
+    if v is None:
+        return {"mn": 600, "mx": 670}
+    return {"mn": v >> 16 & 0xFFFF, "mx": v & 0xFFFF}
+
+LABEL_STRATEGI = ["Intensif & Terstruktur","Penguatan Mental","Optimasi & Review","Pertahankan & Tingkatkan"]
+DESC_STRATEGI = {
+    "Intensif & Terstruktur":{"icon":"🔴","desc":"Kebiasaan belajar dan kondisi psikologis perlu ditingkatkan secara bersamaan.",
+        "tips":["Buat jadwal belajar harian yang ketat","Mulai 2 jam/hari, tingkatkan bertahap","Metode Pomodoro 25+5 menit","Cari kelompok belajar","Konsultasi guru/mentor"]},
+    "Penguatan Mental":{"icon":"🟠","desc":"Kebiasaan belajar sudah baik, namun kondisi psikologis perlu diperkuat.",
+        "tips":["Mindfulness 10 mnt sebelum belajar","Target kecil harian","Kurangi perbandingan diri","Rutinitas tidur teratur","Tryout rutin untuk adaptasi"]},
+    "Optimasi & Review":{"icon":"🟡","desc":"Kebiasaan & mental sudah baik, tingkatkan kualitas review dan evaluasi.",
+        "tips":["Review soal yang pernah salah","Analisis pola kesalahan per subtes","Tryout min. 2x/bulan","Catatan ringkasan materi","Fokus efisiensi waktu"]},
+    "Pertahankan & Tingkatkan":{"icon":"🟢","desc":"Kebiasaan belajar dan kondisi psikologis sudah sangat baik!",
+        "tips":["Pertahankan konsistensi","Tingkatkan target tryout bertahap","Manajemen waktu ujian","Bantu teman belajar","Jaga kesehatan fisik"]},
+}
+
+# ══════════════════════════════════════════════════════════
+# LOAD MODEL
+# ══════════════════════════════════════════════════════════
+@_per_proses
+def registri_model():
+    """Satu registri per proses: memuat model aktif dan memasang versi baru otomatis
+    ketika file model diganti (lihat RegistriModel di model_strategi.py)."""
+    return RegistriModel()
+
+def model_aktif():
+    """VersiModel yang sedang terpasang (atau None kalau tidak ada file model)."""
+    return registri_model().aktif
+
+def load_model():
+    """Model strategi aktif: pohon hasil ekspor (<model>.trees.npz, dievaluasi NumPy — tanpa
+    import lightgbm) bila cocok dengan file model; pickle hanya jika ekspor belum ada/basi."""
+    v = model_aktif()
+    return (v.model, v.path) if v else (None, None)
+
+def load_predictor_live():
+    """Prediktor model live di balik broker micro-batching lintas sesi (satu per versi model)."""
+    v = model_aktif()
+    return v.live if v else None
+
+def load_penjelas():
+    """StrategyPredictor tanpa broker untuk penjelasan SHAP (pred_contrib booster / ModelPohon)."""
+    v = model_aktif()
+    return v.penjelas if v else None
+
+def load_predictor():
+    """Tabel lookup 5^9 (lihat model_strategi.py) kalau tersedia & cocok dengan file
+    model; model live hanya dipakai untuk baris di luar grid, atau bila LUT belum dibangun."""
+    v = model_aktif()
+    return v.pred if v else None
+
+# ══════════════════════════════════════════════════════════
+# CACHE HASIL (dipakai bersama semua sesi)
+# ══════════════════════════════════════════════════════════
+class LRUCache:
+    """Cache LRU + TTL yang thread-safe, dengan penghitung hit/miss.
+
+    Instance-nya dibuat lewat fungsi `@_per_proses`, jadi satu cache dipakai
+    bersama oleh semua thread (dan semua sesi Streamlit) dalam proses yang sama.
+    """
+    def __init__(self, maxsize=4096, ttl=3600):
+        self.maxsize, self.ttl = maxsize, ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key, _KOSONG)
+            if item is not _KOSONG:
+                if self.ttl is None or time.monotonic() - item[0] < self.ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return item[1]
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, fn):
+        value = self.get(key, _KOSONG)
+        if value is _KOSONG:
+            value = fn()
+            self.put(key, value)
+        return value
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"size": len(self._data), "maxsize": self.maxsize,
+                    "hits": self.hits, "misses": self.misses,
+                    "hit_rate": self.hits / total if total else 0.0}
+
+@_per_proses
+def compute_cache():
+    return LRUCache(maxsize=4096, ttl=3600)
+
+@_per_proses
+def explain_cache():
+    return LRUCache(maxsize=8192, ttl=3600)
+
+# ══════════════════════════════════════════════════════════
+# KALKULASI
+# ══════════════════════════════════════════════════════════
+def hitung_tw(skor, bobot): return sum(skor[k]*bobot[k] for k in SUBTES)
+
+def predict_lgbm(pred, inp):
+    try:
+        kode, kpct = pred.predict([fitur_lgbm(inp)])
+        kode  = int(kode[0])
+        label = LABEL_STRATEGI[kode] if kode < len(LABEL_STRATEGI) else LABEL_STRATEGI[-1]
+        kpct  = None if np.isnan(kpct[0]) else float(kpct[0])
+        return {"ok":True,"kode":kode,"strategi":label,"kpct":kpct,"detail":DESC_STRATEGI.get(label,{})}
+    except Exception as e:
+        return {"ok":False,"err":str(e)}
+
+def _versi(versi):
+    """VersiModel yang dipakai: `versi` dari pemanggil (mis. snapshot satu rerun app.py)
+    atau model aktif saat ini."""
+    return model_aktif() if versi is None else versi
+
+def jelaskan_strategi(inp, kode=None, versi=None):
+    """Kontribusi SHAP tiap fitur survei terhadap keluaran model strategi.
+    Ruang input diskret, jadi hasil di-memo per tuple 9 fitur (+ kelas yang dijelaskan).
+    Kembalikan ((fitur, kontribusi) × 9, total fitur turunan, nilai dasar) atau None."""
+    v = _versi(versi)
+    pen = v.penjelas if v else None
+    if pen is None: return None
+    x = tuple(int(f) for f in fitur_lgbm(inp))
+    def hitung():
+        c = pen.kontribusi([x])[0]
+        F = len(pen.kolom) + 1
+        kelas = [] if pen.classes is None else list(pen.classes)
+        k = kelas.index(kode) if len(c) > F and kode in kelas else 0
+        c = c[k*F:(k+1)*F]
+        pos = {f: i for i, f in enumerate(pen.kolom)}
+        dasar = tuple((f, float(c[pos[f]])) for f in FITUR_LGBM if f in pos)
+        return dasar, float(c[:-1].sum()) - sum(kontrib for _, kontrib in dasar), float(c[-1])
+    try:
+        return explain_cache().get_or_set(x + (kode, v.id), hitung)
+    except Exception:
+        return None
+
+KOLOM_INPUT = SUBTES + ["fokus","pede","cemas","distrak","jam","hari","latihan","tryout","review"]
+
+def kunci_compute(d, versi_id=None):
+    """Tuple kanonik semua input yang memengaruhi compute() (nama tidak termasuk), plus
+    versi model — hasil model lama tidak terpakai lagi setelah hot reload."""
+    return (tuple(int(d[k]) for k in KOLOM_INPUT)
+            + (d["prodi"], d["kampus"], d.get("jenjang","S1 (Sarjana)"), versi_id))
+
+def compute(d, versi=None):
+    """Hasil lengkap satu isian survei `d` (skor per subtes, psikologis, kebiasaan belajar,
+    kampus/prodi/jenjang): dict `d` ditambah skor tertimbang, kategori, indeks & strategi.
+
+    Entri compute_cache() dipakai bersama semua sesi & rerun, jadi yang dikembalikan
+    adalah deepcopy-nya — isi cache (hasil _compute_inti) tidak boleh diubah di tempat."""
+    v = _versi(versi)
+    pred = v.pred if v else None
+    inti = compute_cache().get_or_set(kunci_compute(d, v.id if v else None), lambda: _compute_inti(d, pred))
+    return {**d, **copy.deepcopy(inti)}
+
+def _compute_inti(d, pred=None):
+    skor  = {k: d[k] for k in SUBTES}
+    bobot = get_bobot(d["prodi"])
+    sw    = hitung_tw(skor, bobot)
+    rata  = float(np.mean([skor[k] for k in SUBTES]))
+    jenjang = d.get("jenjang","S1 (Sarjana)")
+    info  = get_skor_info(d["kampus"], d["prodi"], jenjang)
+    mn, mx = info["mn"], info["mx"]
+    gap   = sw - mn
+    kat, kat_clr, kat_badge, kat_icon, ppct = get_kategori_skor(sw, mn, mx)
+
+    psiko   = (d["fokus"]*1.5 + d["pede"]*1.5 + (6-d["cemas"]) + (6-d["distrak"])) / 20 * 100
+    konsist = min(100, (d["jam"]*2 + d["hari"]*2.2 + d["latihan"]*1.8 + d["tryout"]*1.5 + d["review"]*1.5)*2)
+    pos  = (d["fokus"]*1.5 + d["pede"]*1.5)*10
+    neg  = (d["cemas"]*1.2 + d["distrak"]*1.2)*8
+    stab = max(0, min(100, pos - neg + 50))
+    rgb  = stab*0.6 + konsist*0.4
+    if rgb >= 75:   risk=("Rendah","✅","Kemungkinan perform sesuai/di atas kemampuan")
+    elif rgb >= 60: risk=("Sedang","⚠️","Ada potensi fluktuasi, jaga konsistensi")
+    else:           risk=("Tinggi","🔴","Risiko perform di bawah kemampuan, perlu perbaikan")
+
+    lgbm_r = predict_lgbm(pred, d) if pred else None
+
+    return {"skor":skor,"bobot":bobot,"sw":sw,"rata":rata,
+            "kat":kat,"kat_clr":kat_clr,"kat_badge":kat_badge,"kat_icon":kat_icon,
+            "ppct":ppct,"info":info,"mn":mn,"mx":mx,"gap":gap,
+            "psiko":psiko,"konsist":konsist,"stab":stab,"risk":risk,
+            "lgbm_r":lgbm_r,"jenjang":jenjang}
+
+
+# ══════════════════════════════════════════════════════════
+# REKOMENDASI ALTERNATIF
+# ══════════════════════════════════════════════════════════
+
+_KAT_META = [
+    ("Sangat Aman", "#148a42", "badge-sa", "🏆"),
+    ("Aman",        "#1a5fa0", "badge-a",  "✅"),
+    ("Berisiko",    "#e67e22", "badge-br", "⚡"),
+    ("Tidak Aman",  "#c0392b", "badge-na", "🔴"),
+]
+_KAT_ORDER = {m[0]: i for i, m in enumerate(_KAT_META)}
+
+def get_kategori_vec(sw, mn, mx):
+    """Versi vektor get_kategori_skor: kembalikan (kode kategori 0–3, persen peluang) per baris."""
+    mn = mn.astype(float); mx = mx.astype(float)
+    kode = np.select([sw >= mx, sw >= mn, sw >= mn - 70], [0, 1, 2], 3)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.select(
+            [kode == 0, kode == 1, kode == 2],
+            [np.minimum(95.0, 80 + (sw - mx) / np.maximum(mx, 1) * 15),
+             60 + (sw - mn) / np.maximum(mx - mn, 1) * 18,
+             np.maximum(20, 35 + (sw - mn) / 70 * 20)],
+            np.maximum(5, 18 + (sw - (mn - 140)) / 70 * 12))
+    return kode, pct
+
+def _bersih_prodi(nama):
+    return nama.lower().replace("d3 ", "").replace("d4 ", "").strip()
+
+@_per_proses
+def build_alt_index(jenjang):
+    """Tabel kolom semua prodi satu jenjang: matriks bobot (N×7), mn/mx, dan indeks kampus."""
+    kat = load_katalog()
+    sl = kat.slice_jenjang(jenjang)
+    a0 = sl.start
+    rentang = {k: (a - a0, b - a0) for k, (a, b) in kat.rentang_kampus(jenjang).items()}
+    prodi = [kat.nama_prodi[p] for p in kat.prodi[sl].tolist()]
+    cmp_uniq, cmp_inv = np.unique([_bersih_prodi(p) for p in prodi], return_inverse=True)
+    return {
+        "kampus": [kat.nama_kampus[k] for k in kat.kampus[sl].tolist()], "prodi": prodi, "rentang": rentang,
+        "mn": kat.mn[sl].astype(np.int64), "mx": kat.mx[sl].astype(np.int64),
+        "W": kat.W[kat.bobot[sl]],
+        "cmp_uniq": cmp_uniq.tolist(), "cmp_inv": cmp_inv.ravel(), "cocok": {},
+    }
+
+def _alt_cocok(ix, prodi_target):
+    """Mask baris yang namanya sama/mirip prodi_target (di-memo per nama)."""
+    prodi_clean = _bersih_prodi(prodi_target)
+    m = ix["cocok"].get(prodi_clean)
+    if m is None:
+        per_nama = np.array([c == prodi_clean or prodi_clean in c or c in prodi_clean
+                             for c in ix["cmp_uniq"]], dtype=bool)
+        m = per_nama[ix["cmp_inv"]] if per_nama.size else np.zeros(0, dtype=bool)
+        ix["cocok"][prodi_clean] = m
+    return m
+
+def _alt_items(ix, rows, sw, kode, pct, top_n):
+    if rows.size == 0:
+        return []
+    kd  = kode[rows]
+    gap = sw[rows] - ix["mn"][rows]
+    if top_n is not None and rows.size > top_n:
+        # Kunci urut = kategori dulu, lalu gap terbesar. Batas dilonggarkan 0.1
+        # supaya pembulatan gap 1 desimal tidak menggeser siapa yang masuk top-N.
+        key = kd * 4000.0 - gap
+        cut = np.partition(key, top_n - 1)[top_n - 1]
+        sel = rows[np.nonzero(key <= cut + 0.1)[0]]
+    else:
+        sel = rows
+    items = []
+    for i in sel.tolist():
+        kat_p, kat_clr_p, badge_p, icon_p = _KAT_META[kode[i]]
+        sw_p = float(sw[i]); mn_p = int(ix["mn"][i]); mx_p = int(ix["mx"][i])
+        items.append({
+            "prodi": ix["prodi"][i], "kampus": ix["kampus"][i],
+            "mn": mn_p, "mx": mx_p,
+            "sw": round(sw_p, 1), "gap": round(sw_p - mn_p, 1),
+            "kat": kat_p, "kat_clr": kat_clr_p,
+            "badge": badge_p, "icon": icon_p, "ppct": round(float(pct[i]), 1),
+        })
+    items.sort(key=lambda x: (_KAT_ORDER[x["kat"]], -x["gap"]))
+    return items if top_n is None else items[:top_n]
+
+def get_rekomendasi_alternatif(skor, sw, prodi_target, kampus_target, jenjang, top_n=10):
+    ix = build_alt_index(jenjang)
+    n  = len(ix["prodi"])
+    # Skor tertimbang semua prodi sekaligus; akumulasi per kolom dengan urutan
+    # yang sama seperti hitung_tw agar hasilnya identik sampai bit terakhir.
+    sw_all = np.zeros(n)
+    for j, k in enumerate(SUBTES):
+        sw_all += skor[k] * ix["W"][:, j]
+    kode, pct = get_kategori_vec(sw_all, ix["mn"], ix["mx"])
+
+    # ── 1. Prodi lain di kampus yang sama ──
+    a, b = ix["rentang"].get(kampus_target, (0, 0))
+    rows_kampus = np.array([i for i in range(a, b) if ix["prodi"][i] != prodi_target], dtype=np.int64)
+    alt_kampus_sama = _alt_items(ix, rows_kampus, sw_all, kode, pct, top_n)
+
+    # ── 2. Prodi sama / mirip di kampus lain ──
+    mask = _alt_cocok(ix, prodi_target).copy()
+    mask[a:b] = False
+    alt_prodi_sama = _alt_items(ix, np.nonzero(mask)[0], sw_all, kode, pct, top_n)
+
+    return alt_kampus_sama, alt_prodi_sama
+
+
+# ══════════════════════════════════════════════════════════
+# BATCH — ROSTER KELAS (CSV/XLSX)
+# ══════════════════════════════════════════════════════════
+KOLOM_PSIKO   = ["fokus","pede","cemas","distrak"]
+KOLOM_BELAJAR = ["jam","hari","latihan","tryout","review"]
+KOLOM_ROSTER  = ["nama","jenjang","kampus","prodi"] + SUBTES + KOLOM_PSIKO + KOLOM_BELAJAR
+
+def baca_roster(file, nama_file=""):
+    """Baca roster kelas (satu baris per siswa) dari CSV/XLSX dan validasi kolomnya."""
+    import pandas as pd
+    if str(nama_file).lower().endswith((".xlsx", ".xls")):
+        df = pd.read_excel(file, engine="openpyxl")
+    else:
+        df = pd.read_csv(file)
+    # Nama kolom tidak peka huruf besar/kecil; subtes tetap ditulis kapital
+    kolom = {c: str(c).strip() for c in df.columns}
+    kolom = {c: (v.upper() if v.upper() in SUBTES else v.lower()) for c, v in kolom.items()}
+    df = df.rename(columns=kolom)
+    if "nama" not in df:    df["nama"] = ""
+    if "jenjang" not in df: df["jenjang"] = DAFTAR_JENJANG[0]
+    kurang = [c for c in KOLOM_ROSTER if c not in df]
+    if kurang:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(kurang)}")
+    df["nama"] = df["nama"].fillna("").astype(str)
+    df["jenjang"] = df["jenjang"].fillna(DAFTAR_JENJANG[0]).astype(str)
+    for c in SUBTES + KOLOM_PSIKO + KOLOM_BELAJAR:
+        df[c] = pd.to_numeric(df[c], errors="raise").astype(int)
+    return df[KOLOM_ROSTER].reset_index(drop=True)
+
+def predict_lgbm_batch(pred, df):
+    """Prediksi strategi seluruh roster dengan satu panggilan model.
+    Kembalikan (list label strategi, array kpct) atau None jika model gagal."""
+    try:
+        kode, kpct = pred.predict(np.column_stack(fitur_lgbm(df)))
+        label = [LABEL_STRATEGI[k] if k < len(LABEL_STRATEGI) else LABEL_STRATEGI[-1] for k in kode.tolist()]
+        return label, kpct
+    except Exception:
+        return None
+
+def compute_batch(df, versi=None):
+    """Versi kolom dari compute() untuk satu roster: semua indeks dihitung dengan
+    aritmetika kolom, model dipanggil sekali untuk seluruh baris."""
+    import pandas as pd
+    n = len(df)
+    # Bobot & rentang skor cukup di-resolve sekali per prodi / kombinasi unik
+    bobot_map = {p: get_bobot(p) for p in df["prodi"].unique()}
+    W = np.array([[bobot_map[p][k] for k in SUBTES] for p in df["prodi"]], dtype=float).reshape(n, len(SUBTES))
+    kunci = list(zip(df["kampus"], df["prodi"], df["jenjang"]))
+    info_map = {k: get_skor_info(*k) for k in dict.fromkeys(kunci)}
+    mn = np.array([info_map[k]["mn"] for k in kunci], dtype=np.int64)
+    mx = np.array([info_map[k]["mx"] for k in kunci], dtype=np.int64)
+
+    sw = np.zeros(n)
+    for j, k in enumerate(SUBTES):
+        sw += df[k].to_numpy() * W[:, j]
+    kode, ppct = get_kategori_vec(sw, mn, mx)
+
+    f, p, c, d = (df[k].to_numpy() for k in KOLOM_PSIKO)
+    psiko   = (f*1.5 + p*1.5 + (6-c) + (6-d)) / 20 * 100
+    konsist = np.minimum(100, (df["jam"].to_numpy()*2 + df["hari"].to_numpy()*2.2 + df["latihan"].to_numpy()*1.8
+                               + df["tryout"].to_numpy()*1.5 + df["review"].to_numpy()*1.5)*2)
+    stab = np.clip((f*1.5 + p*1.5)*10 - (c*1.2 + d*1.2)*8 + 50, 0, 100)
+    rgb  = stab*0.6 + konsist*0.4
+    risk = np.select([rgb >= 75, rgb >= 60], ["Rendah", "Sedang"], "Tinggi")
+
+    hasil = pd.DataFrame({
+        "nama": df["nama"], "jenjang": df["jenjang"], "kampus": df["kampus"], "prodi": df["prodi"],
+        "sw": sw, "kat": [_KAT_META[k][0] for k in kode.tolist()], "ppct": ppct,
+        "mn": mn, "mx": mx, "gap": sw - mn,
+        "psiko": psiko, "konsist": konsist, "stab": stab, "risk": risk,
+    })
+    v = _versi(versi)
+    pred = predict_lgbm_batch(v.pred, df) if v and v.pred else None
+    hasil["strategi"] = pred[0] if pred else None
+    hasil["kpct"]     = pred[1] if pred else np.nan
+    return hasil
+
+# ══════════════════════════════════════════════════════════
+# RENCANA BELAJAR MINGGUAN
+# ══════════════════════════════════════════════════════════
+def buat_rencana_mingguan(r, n_minggu=8):
+    skor = r["skor"]; sw = r["sw"]; mn = r["mn"]; mx = r["mx"]
+    ranked = sorted(SUBTES, key=lambda k: skor[k])
+    terlemah3 = ranked[:3]; sedang2 = ranked[3:5]
+    gap = r["gap"]
+    target_pm = abs(gap)/n_minggu + 10 if gap < 0 else (mx-sw)/n_minggu + 5 if sw < mx else 5
+    rencana = []
+    for w in range(1, n_minggu+1):
+        fase = "Fondasi" if w<=2 else "Intensif" if w<=5 else "Pemantapan" if w<=7 else "Final"
+        target_sw = min(mx+20, sw + target_pm * w)
+        if fase == "Fondasi":
+            tasks = [
+                f"Review konsep dasar {SUBTES_FULL[terlemah3[0]]} (skor {skor[terlemah3[0]]} → target +30)",
+                f"50 soal latihan {SUBTES_FULL[terlemah3[1]]} dengan timer",
+                f"Pelajari pola soal {SUBTES_FULL[terlemah3[2]]}",
+                "Buat catatan kesalahan (error log)",
+                "Tryout mini: 30 soal campuran + analisis",
+            ]; jam = "2–3 jam/hari"
+        elif fase == "Intensif":
+            subtes_minggu = terlemah3 + sedang2
+            subtes_ini = subtes_minggu[(w-3) % len(subtes_minggu)] if subtes_minggu else "PU"
+            tasks = [
+                f"100 soal latihan {SUBTES_FULL[subtes_ini]} + timer ketat",
+                "Review error log minggu sebelumnya",
+                f"Mini tryout {SUBTES_FULL[sedang2[0] if sedang2 else 'PU']} (50 soal, 45 mnt)",
+                "Simulasi 1 paket soal lengkap (90 mnt)",
+                "Analisis & rekap kesalahan pola berulang",
+            ]; jam = "3–4 jam/hari"
+        elif fase == "Pemantapan":
+            tasks = [
+                "Full tryout 1 paket lengkap + evaluasi",
+                f"Review intensif {SUBTES_FULL[terlemah3[0]]} (subtes fokus utama)",
+                "Latihan manajemen waktu (simulasi kondisi ujian)",
+                "Review catatan penting semua subtes",
+                "Rest day: hanya review ringan 1 jam",
+            ]; jam = "3–4 jam/hari (1 hari libur)"
+        else:
+            tasks = [
+                "Full tryout final + review mendalam",
+                "Revisi soal-soal sulit yang pernah salah",
+                "Persiapan mental: teknik relaksasi & tidur cukup",
+                "Cek strategi manajemen waktu ujian",
+                "Istirahat — jaga kondisi fisik & mental",
+            ]; jam = "2 jam/hari + istirahat cukup"
+        rencana.append({
+            "minggu":w,"fase":fase,"target_skor":f"{target_sw:.0f}",
+            "jam":jam,"fokus":SUBTES_FULL.get(terlemah3[0],"TPS"),"tasks":tasks,
+        })
+    return rencana
@@ -0,0 +1,728 @@
+"""
+Inferensi model strategi belajar (LightGBM) tanpa ketergantungan Streamlit.
+
+Model hanya memakai 9 fitur berskala 1–5 dari survei, jadi seluruh ruang input
+cuma 5^9 = 1.953.125 kombinasi. Tabel lookup (LUT) hasil evaluasi model di grid
+penuh disimpan di samping file model:
+
+    <model>.lut.npy        uint8   kode strategi per kombinasi
+    <model>.lut_kpct.npy   float16 kepercayaan (%) — hanya untuk classifier
+    <model>.lut.json       metadata + sha1 file model (LUT basi otomatis diabaikan)
+
+dan dimuat dengan memory-map, sehingga prediksi = satu indeks array.
+
+Untuk baris di luar grid, model live tidak perlu lightgbm: pohon-pohon booster
+diekspor (via `dump_model`) ke array datar
+
+    <model>.trees.npz      fitur, ambang, anak kiri/kanan, nilai daun per node
+
+yang dievaluasi NumPy untuk semua pohon & semua baris sekaligus (ModelPohon).
+
+    python model_strategi.py build  [lgbm_model_2_.pkl]
+    python model_strategi.py verify [lgbm_model_2_.pkl] [--sampel N]
+"""
+import argparse, hashlib, json, os, pickle, queue, sys, threading, time
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+
+FITUR_LGBM = ["Jam_Belajar","Hari_Belajar","Latihan_Soal","Frekuensi_Tryout","Review_Soal",
+              "Fokus","Percaya_Diri","Kecemasan_Rev","Distraksi_Rev"]
+MODEL_FILES = ["lgbm_model_2_.pkl","lgbm_model.pkl","model_skor_utbk_asli.pkl"]
+
+# Micro-batching lintas sesi (BrokerInferensi); bisa diatur lewat environment.
+# Jendela 0 = batch berisi semua yang sudah mengantri selama batch sebelumnya berjalan
+# (tanpa menunda request tunggal); 2–5 ms menukar latensi dengan batch lebih besar.
+BATCH_JENDELA_MS = float(os.environ.get("STRATEGI_BATCH_WINDOW_MS", 0))
+BATCH_MAKS       = int(os.environ.get("STRATEGI_BATCH_MAX", 64))
+# Batas konkurensi inferensi: jumlah batch yang boleh berjalan bersamaan (pool thread
+# broker) dan thread OpenMP LightGBM per panggilan. Total ≈ pekerja × num_threads ≤ core.
+INFER_PEKERJA    = int(os.environ.get("STRATEGI_INFER_WORKERS", max(1, min(4, os.cpu_count() or 1))))
+INFER_THREADS    = int(os.environ.get("STRATEGI_INFER_THREADS", 1))
+# Registri model: interval polling file model untuk hot reload (0 = tanpa thread pengawas)
+RELOAD_INTERVAL_S = float(os.environ.get("STRATEGI_RELOAD_INTERVAL", 5))
+
+SKALA     = 5
+UKURAN    = SKALA ** len(FITUR_LGBM)
+_PANGKAT  = SKALA ** np.arange(len(FITUR_LGBM) - 1, -1, -1, dtype=np.int64)
+
+def fitur_lgbm(inp):
+    """9 fitur dasar model (urutan FITUR_LGBM) dari isian survei; bisa dict atau DataFrame roster."""
+    return [inp["jam"], inp["hari"], inp["latihan"], inp["tryout"], inp["review"],
+            inp["fokus"], inp["pede"], 6-inp["cemas"], 6-inp["distrak"]]
+
+class StrategyPredictor:
+    """Lapisan inferensi di atas model strategi.
+
+    Urutan kolom model dihitung sekali saat dimuat; input berupa matriks NumPy (N×9,
+    urutan FITUR_LGBM) yang disusun langsung ke layout kolom model (kolom lain diisi 0,
+    sama seperti `reindex(fill_value=0)`). Booster dipanggil sekali per batch: untuk
+    classifier keluarannya sudah probabilitas, jadi kelas & kepercayaan diambil dari
+    satu pass yang sama. `num_threads` (bila diisi) dipatok di setiap panggilan booster
+    supaya banyak sesi tidak masing-masing memutar OpenMP di semua core.
+    """
+    def __init__(self, model, num_threads=None):
+        self.model   = model
+        self.opsi    = {"num_threads": num_threads} if num_threads else {}
+        kolom = getattr(model, "feature_name_", None)
+        if kolom is None: kolom = getattr(model, "feature_names_in_", None)
+        self.kolom   = list(kolom) if kolom is not None else list(FITUR_LGBM)
+        self.posisi  = [(self.kolom.index(f), j) for j, f in enumerate(FITUR_LGBM) if f in self.kolom]
+        self.booster = getattr(model, "booster_", None)
+        self.classes = getattr(model, "classes_", None) if hasattr(model, "predict_proba") else None
+
+    def matriks(self, X9):
+        X9 = np.asarray(X9, dtype=float).reshape(-1, len(FITUR_LGBM))
+        X  = np.zeros((len(X9), len(self.kolom)))
+        for dst, src in self.posisi:
+            X[:, dst] = X9[:, src]
+        return X
+
+    def predict(self, X9):
+        """Kembalikan (kode kelas int, kpct dalam persen; NaN jika model tanpa probabilitas)."""
+        X = self.matriks(X9)
+        n = len(X)
+        if self.booster is not None:
+            out = np.asarray(self.booster.predict(X, **self.opsi))
+        else:
+            import pandas as pd
+            df  = pd.DataFrame(X, columns=self.kolom)
+            out = np.asarray(self.model.predict_proba(df) if self.classes is not None else self.model.predict(df))
+        kpct = np.full(n, np.nan)
+        if self.classes is None:
+            return out.reshape(n).astype(int), kpct
+        proba = out.reshape(n, -1)
+        if proba.shape[1] == 1:
+            proba = np.hstack([1 - proba, proba])
+        kode = np.asarray(self.classes)[proba.argmax(axis=1)].astype(int)
+        ok = (kode >= 0) & (kode < proba.shape[1])
+        kpct[ok] = proba[np.nonzero(ok)[0], kode[ok]] * 100
+        return kode, kpct
+
+    def kontribusi(self, X9):
+        """Kontribusi SHAP dari jalur native booster (`pred_contrib`): N × (kolom+1)·kelas,
+        kolom terakhir tiap blok kelas = nilai harapan (bias)."""
+        return np.asarray(self.booster.predict(self.matriks(X9), pred_contrib=True, **self.opsi))
+
+# ══════════════════════════════════════════════════════════
+# TABEL LOOKUP 5^9
+# ══════════════════════════════════════════════════════════
+def indeks_grid(X9):
+    """Posisi tiap baris di grid 5^9 (fitur pertama paling signifikan, sama dengan
+    itertools.product). Kembalikan (indeks int64, mask baris yang memang ada di grid)."""
+    X  = np.asarray(X9, dtype=float).reshape(-1, len(FITUR_LGBM))
+    ok = ((X >= 1) & (X <= SKALA) & (X == np.floor(X))).all(axis=1)
+    idx = np.where(ok[:, None], X - 1, 0).astype(np.int64) @ _PANGKAT
+    return idx, ok
+
+def baris_indeks(idx):
+    """Matriks fitur len(idx)×9 untuk indeks-indeks grid (kebalikan indeks_grid)."""
+    return (np.asarray(idx, dtype=np.int64)[:, None] // _PANGKAT % SKALA + 1).astype(float)
+
+def baris_grid(a, b):
+    """Matriks fitur (b−a)×9 untuk indeks grid a..b−1."""
+    return baris_indeks(np.arange(a, b, dtype=np.int64))
+
+def sidik_file(path):
+    with open(path, "rb") as fp:
+        return hashlib.sha1(fp.read()).hexdigest()
+
+def path_lut(model_path):
+    base = os.path.splitext(model_path)[0]
+    return base + ".lut.npy", base + ".lut_kpct.npy", base + ".lut.json"
+
+class StrategyLUT:
+    """Prediktor O(1): kode/kpct diambil dari tabel memory-mapped. Baris di luar grid
+    (mis. roster dengan nilai di luar 1–5) diteruskan ke `fallback()` (prediktor live,
+    dimuat hanya kalau benar-benar dibutuhkan)."""
+    def __init__(self, kode, kpct=None, fallback=None):
+        self.kode, self.kpct, self.fallback = kode, kpct, fallback
+
+    def predict(self, X9):
+        if len(X9) == 1:  # satu request: hitung indeks di Python, tanpa overhead array kecil
+            i = 0
+            for v in X9[0]:
+                if not (1 <= v <= SKALA and v == int(v)): break
+                i = i * SKALA + int(v) - 1
+            else:
+                p = np.nan if self.kpct is None else float(self.kpct[i])
+                return np.array([int(self.kode[i])]), np.array([p])
+        X9 = np.asarray(X9, dtype=float).reshape(-1, len(FITUR_LGBM))
+        idx, ok = indeks_grid(X9)
+        kode = np.zeros(len(X9), dtype=int)
+        kpct = np.full(len(X9), np.nan)
+        kode[ok] = self.kode[idx[ok]]
+        if self.kpct is not None:
+            kpct[ok] = self.kpct[idx[ok]]
+        if not ok.all():
+            live = self.fallback() if self.fallback else None
+            if live is None:
+                raise ValueError("input di luar grid 1–5 dan model live tidak tersedia")
+            kode[~ok], kpct[~ok] = live.predict(X9[~ok])
+        return kode, kpct
+
+def build_lut(pred, model_path, batch=SKALA ** 8):
+    """Evaluasi `pred` di seluruh grid per batch besar lalu tulis file LUT (atomik)."""
+    kode = np.empty(UKURAN, dtype=np.uint8)
+    kpct = np.empty(UKURAN, dtype=np.float16)
+    for a in range(0, UKURAN, batch):
+        b = min(a + batch, UKURAN)
+        k, p = pred.predict(baris_grid(a, b))
+        if k.min() < 0 or k.max() > 255:
+            raise ValueError(f"kode model di luar rentang uint8: {k.min()}..{k.max()}")
+        kode[a:b] = k; kpct[a:b] = p
+    f_kode, f_kpct, f_meta = path_lut(model_path)
+    simpan = [(f_kode, kode)] + ([(f_kpct, kpct)] if not np.isnan(kpct).all() else [])
+    for f, arr in simpan:
+        np.save(f + ".tmp.npy", arr)
+        os.replace(f + ".tmp.npy", f)
+    if len(simpan) == 1 and os.path.exists(f_kpct):
+        os.remove(f_kpct)
+    meta = {"model": os.path.basename(model_path), "sha1": sidik_file(model_path),
+            "fitur": FITUR_LGBM, "ukuran": UKURAN, "kpct": len(simpan) == 2}
+    with open(f_meta + ".tmp", "w") as fp: json.dump(meta, fp, indent=1)
+    os.replace(f_meta + ".tmp", f_meta)
+    return meta
+
+def muat_lut(model_path, fallback=None, sha1=None):
+    """StrategyLUT memory-mapped untuk model_path, atau None kalau LUT tidak ada / basi.
+    `sha1` = sidik file model yang sudah dihitung pemanggil (dihitung ulang jika None)."""
+    f_kode, f_kpct, f_meta = path_lut(model_path)
+    try:
+        with open(f_meta) as fp: meta = json.load(fp)
+        if meta["sha1"] != (sha1 or sidik_file(model_path)) or meta["fitur"] != FITUR_LGBM:
+            return None
+        kode = np.load(f_kode, mmap_mode="r")
+        kpct = np.load(f_kpct, mmap_mode="r") if meta["kpct"] else None
+    except (OSError, ValueError, KeyError):
+        return None
+    if kode.shape != (UKURAN,):
+        return None
+    return StrategyLUT(kode, kpct, fallback)
+
+def verify_lut(lut, pred, sampel=None, batch=SKALA ** 8, seed=0):
+    """Bandingkan LUT dengan model live (seluruh grid, atau `sampel` indeks acak).
+    Kembalikan (jumlah dicek, kode berbeda, selisih kpct maksimum dalam poin %)."""
+    if sampel:
+        idx  = np.sort(np.random.default_rng(seed).choice(UKURAN, size=sampel, replace=False))
+        blok = (baris_indeks(idx[i:i + batch]) for i in range(0, sampel, batch))
+    else:
+        blok = (baris_grid(a, min(a + batch, UKURAN)) for a in range(0, UKURAN, batch))
+    n = beda = 0; dk = 0.0
+    for X in blok:
+        k1, p1 = pred.predict(X); k2, p2 = lut.predict(X)
+        n += len(X); beda += int((k1 != k2).sum())
+        beda += int((np.isnan(p1) != np.isnan(p2)).sum())
+        m = ~np.isnan(p1) & ~np.isnan(p2)
+        if m.any(): dk = max(dk, float(np.abs(p1[m] - p2[m]).max()))
+    return n, beda, dk
+
+# ══════════════════════════════════════════════════════════
+# EVALUATOR POHON NUMPY (tanpa lightgbm)
+# ══════════════════════════════════════════════════════════
+_MISSING = {"None": 0, "Zero": 1, "NaN": 2}
+_NOL     = 1e-35   # kZeroThreshold LightGBM
+
+def path_pohon(model_path):
+    return os.path.splitext(model_path)[0] + ".trees.npz"
+
+def ekspor_pohon(model, model_path):
+    """Ratakan pohon booster (hasil `dump_model`) ke array dan simpan ke <model>.trees.npz.
+
+    Semua node (internal & daun) berada di satu tabel; `akar` = node pertama tiap pohon.
+    Daun menunjuk ke dirinya sendiri (ambang +inf, selalu ke kiri), jadi evaluasi cukup
+    `kedalaman` langkah seragam tanpa masking. `cover` (jumlah data latih per node)
+    dipakai TreeSHAP."""
+    dump = model.booster_.dump_model()
+    fitur, ambang, kiri, kanan, dflt, miss, nilai, cover = [], [], [], [], [], [], [], []
+    def ratakan(n, d):
+        i = len(fitur)
+        fitur.append(0); ambang.append(np.inf); kiri.append(i); kanan.append(i)
+        dflt.append(True); miss.append(0); nilai.append(n.get("leaf_value", 0.0))
+        cover.append(n.get("internal_count", n.get("leaf_count", 0)))
+        if "split_index" not in n:
+            return i, d
+        if n["decision_type"] != "<=":
+            raise ValueError(f"split {n['decision_type']!r} (kategorikal) belum didukung")
+        fitur[i], ambang[i] = n["split_feature"], n["threshold"]
+        dflt[i], miss[i]    = n["default_left"], _MISSING[n["missing_type"]]
+        kiri[i], dk = ratakan(n["left_child"], d + 1)
+        kanan[i], dn = ratakan(n["right_child"], d + 1)
+        return i, max(dk, dn)
+    hasil = [ratakan(t["tree_structure"], 0) for t in dump["tree_info"]]
+    k     = dump["num_tree_per_iteration"]
+    kelas = getattr(model, "classes_", None) if hasattr(model, "predict_proba") else None
+    meta  = {"model": os.path.basename(model_path), "sha1": sidik_file(model_path),
+             "kolom": dump["feature_names"], "objective": dump["objective"],
+             "num_class": dump["num_class"], "average_output": dump["average_output"],
+             "kedalaman": max(d for _, d in hasil),
+             "classes": None if kelas is None else np.asarray(kelas).tolist()}
+    f = path_pohon(model_path)
+    with open(f + ".tmp", "wb") as fp:
+        np.savez(fp, fitur=np.array(fitur, dtype=np.int32), ambang=np.array(ambang, dtype=np.float64),
+                 kiri=np.array(kiri, dtype=np.int32), kanan=np.array(kanan, dtype=np.int32),
+                 default_kiri=np.array(dflt, dtype=bool), missing=np.array(miss, dtype=np.uint8),
+                 nilai=np.array(nilai, dtype=np.float64), cover=np.array(cover, dtype=np.float64),
+                 akar=np.array([i for i, _ in hasil], dtype=np.int32),
+                 kelas_pohon=np.arange(len(hasil), dtype=np.int32) % k, meta=np.array(json.dumps(meta)))
+    os.replace(f + ".tmp", f)
+    return meta
+
+class ModelPohon:
+    """Pengganti LGBMRegressor/LGBMClassifier hasil unpickle, tanpa lightgbm.
+
+    Antarmukanya cukup untuk StrategyPredictor: `feature_name_`, `booster_.predict(X)`
+    (keluaran sama dengan Booster.predict: nilai regresi, probabilitas kelas 1 untuk
+    binary, atau matriks probabilitas untuk multiclass) dan — khusus classifier —
+    `classes_` & `predict_proba`. `predict(X, pred_contrib=True)` memberi kontribusi
+    SHAP per kolom + bias, dengan layout yang sama seperti LightGBM."""
+    def __init__(self, arr, meta):
+        self.__dict__.update({k: arr[k] for k in ("fitur","ambang","kiri","kanan","default_kiri",
+                                                  "missing","nilai","akar","kelas_pohon")})
+        self.cover         = arr.get("cover")
+        self._shap         = None
+        self.meta          = meta
+        self.feature_name_ = list(meta["kolom"])
+        self.booster_      = self
+        self.n_class       = max(1, meta["num_class"])
+        self.ada_missing   = bool(self.missing.any())
+        if meta["classes"] is not None:
+            self.classes_      = np.asarray(meta["classes"])
+            self.predict_proba = self._proba
+
+    def _siapkan(self, X):
+        # missing_type None di semua node: NaN diperlakukan sebagai 0 sekali di depan
+        return X if self.ada_missing else np.where(np.isnan(X), 0.0, X)
+
+    def _ke_kiri(self, fv, node):
+        """Keputusan split (True = anak kiri) untuk nilai fitur fv di node, aturan LightGBM."""
+        if not self.ada_missing:
+            return fv <= self.ambang.take(node)
+        miss, nan = self.missing[node], np.isnan(fv)
+        fv = np.where(nan & (miss != 2), 0.0, fv)
+        ke_default = ((miss == 1) & (np.abs(fv) <= _NOL)) | ((miss == 2) & nan)
+        return np.where(ke_default, self.default_kiri[node], fv <= self.ambang[node])
+
+    def raw(self, X, blok=1 << 21):
+        """Skor mentah (N×kelas): semua pohon ditelusuri bersamaan, satu langkah kedalaman
+        per iterasi; baris diproses per potongan agar matriks node (N×pohon) tetap kecil."""
+        X    = np.ascontiguousarray(X, dtype=np.float64)
+        n, t = len(X), len(self.akar)
+        step = max(1, blok // t)
+        if n > step:
+            return np.concatenate([self.raw(X[a:a + step], blok) for a in range(0, n, step)])
+        Xf   = self._siapkan(X).ravel()
+        awal = np.arange(n, dtype=np.int64)[:, None] * X.shape[1]
+        node = np.broadcast_to(self.akar, (n, t))
+        for _ in range(self.meta["kedalaman"]):
+            kiri = self._ke_kiri(Xf.take(awal + self.fitur.take(node)), node)
+            node = np.where(kiri, self.kiri.take(node), self.kanan.take(node))
+        nilai = self.nilai.take(node)
+        # jumlahkan berurutan per pohon (cumsum), sama dengan urutan akumulasi LightGBM
+        out = np.stack([np.cumsum(nilai[:, self.kelas_pohon == k], axis=1)[:, -1]
+                        for k in range(self.n_class)], axis=1)
+        if self.meta["average_output"]:
+            out /= t // self.n_class
+        return out
+
+    def predict(self, X, pred_contrib=False, **_):
+        """Sama dengan Booster.predict; opsi LightGBM (mis. num_threads) diabaikan."""
+        if pred_contrib:
+            return self.kontribusi(X)
+        raw = self.raw(X)
+        obj = self.meta["objective"].split()
+        if obj[0] in ("binary", "cross_entropy"):
+            sig = next((float(o.split(":")[1]) for o in obj[1:] if o.startswith("sigmoid:")), 1.0)
+            return 1.0 / (1.0 + np.exp(-sig * raw[:, 0]))
+        if obj[0] in ("multiclass", "softmax"):
+            e = np.exp(raw - raw.max(axis=1, keepdims=True))
+            return e / e.sum(axis=1, keepdims=True)
+        if obj[0] in ("poisson", "gamma", "tweedie"):
+            return np.exp(raw[:, 0])
+        if obj[0] in ("regression", "regression_l1", "huber", "fair", "quantile", "mape"):
+            return raw[:, 0]
+        raise ValueError(f"objective {obj[0]!r} belum didukung evaluator NumPy")
+
+    def _proba(self, X):
+        p = self.predict(X)
+        return np.column_stack([1 - p, p]) if p.ndim == 1 else p
+
+    # ── TreeSHAP ───────────────────────────────────────────
+    # TreeSHAP path-dependent (algoritma yang sama dengan Tree::TreeSHAP LightGBM), dalam
+    # bentuk tabel: kontribusi satu daun hanya bergantung pada fitur unik di jalurnya
+    # (≤ kedalaman) dan bit "input mengikuti semua split fitur itu menuju daun ini". Untuk
+    # setiap daun × setiap kombinasi bit, hasilnya dihitung sekali; prediksi tinggal
+    # menghitung bit dari keputusan split lalu mengambil baris tabel.
+    def _siapkan_shap(self):
+        if self.cover is None:
+            raise ValueError("trees.npz tanpa cover — jalankan ulang `python model_strategi.py build`")
+        n_node = len(self.fitur)
+        node   = np.arange(n_node)
+        dalam  = np.nonzero(self.kiri != node)[0]
+        induk  = np.full(n_node, -1); arah = np.zeros(n_node, dtype=bool)
+        induk[self.kiri[dalam]] = dalam;  arah[self.kiri[dalam]] = True
+        induk[self.kanan[dalam]] = dalam
+        pohon_akar = {int(a): t for t, a in enumerate(self.akar)}
+        D = max(1, self.meta["kedalaman"])
+        daun = np.nonzero(self.kiri == node)[0]
+        L    = len(daun)
+        p_node = np.zeros((L, D), dtype=np.int64); p_arah = np.zeros((L, D), dtype=bool)
+        p_slot = np.full((L, D), D, dtype=np.int64)      # slot D = langkah kosong (padding)
+        p_fitur = np.zeros((L, D), dtype=np.int64)
+        zf = np.ones((L, D)); U = np.zeros(L, dtype=np.int64); pohon = np.zeros(L, dtype=np.int64)
+        bias = np.zeros(len(self.akar))
+        for li, d in enumerate(daun):
+            langkah, n = [], int(d)
+            while induk[n] >= 0:
+                langkah.append((int(induk[n]), bool(arah[n]), n)); n = int(induk[n])
+            pohon[li] = t = pohon_akar[n]
+            total = self.cover[n]
+            bias[t] += self.nilai[d] * (self.cover[d] / total if langkah else 1.0)
+            urutan = []                                   # fitur unik, urutan kemunculan terakhir
+            for j, (nd, ke_kiri, anak) in enumerate(reversed(langkah)):
+                f = int(self.fitur[nd]); z = self.cover[anak] / self.cover[nd]
+                lama = next((u for u in urutan if u[0] == f), None)
+                if lama is not None:
+                    urutan.remove(lama); z *= lama[1]
+                urutan.append((f, z))
+                p_node[li, j], p_arah[li, j] = nd, ke_kiri
+            slot = {f: k for k, (f, _) in enumerate(urutan)}
+            for j, (nd, _, _) in enumerate(reversed(langkah)):
+                p_slot[li, j] = slot[int(self.fitur[nd])]
+            U[li] = len(urutan)
+            for k, (f, z) in enumerate(urutan):
+                p_fitur[li, k], zf[li, k] = f, z
+        tabel = np.zeros((L, 1 << D, D))
+        for u in range(1, D + 1):
+            pilih = np.nonzero(U == u)[0]
+            if len(pilih):
+                tabel[pilih, :1 << u, :u] = _tabel_shap(zf[pilih, :u], self.nilai[daun[pilih]], u)
+        self._shap = dict(node=p_node, arah=p_arah, bit=np.where(p_slot < D, 1 << np.minimum(p_slot, D - 1), 0),
+                          fitur=p_fitur, kelas=self.kelas_pohon[pohon], U=U, tabel=tabel, bias=bias)
+
+    def kontribusi(self, X):
+        """Kontribusi SHAP (N × (kolom+1)·kelas): kolom terakhir tiap kelas = nilai harapan."""
+        if self._shap is None: self._siapkan_shap()
+        sh = self._shap
+        X  = self._siapkan(np.ascontiguousarray(X, dtype=np.float64))
+        n, F, K = len(X), len(self.feature_name_), self.n_class
+        kiri  = self._ke_kiri(X[:, self.fitur[sh["node"]]], sh["node"])          # n×L×D
+        langgar = np.where(kiri != sh["arah"], sh["bit"], 0)
+        bit   = ((1 << sh["U"]) - 1) & ~np.bitwise_or.reduce(langgar, axis=2)     # n×L
+        nilai = sh["tabel"][np.arange(len(sh["U"])), bit]                       # n×L×D
+        kol   = sh["kelas"][:, None] * (F + 1) + sh["fitur"]                    # L×D
+        idx   = (np.arange(n)[:, None, None] * (K * (F + 1)) + kol).ravel()
+        out   = np.bincount(idx, weights=nilai.ravel(), minlength=n * K * (F + 1)).reshape(n, K * (F + 1))
+        for k in range(K):
+            out[:, k * (F + 1) + F] += sh["bias"][self.kelas_pohon == k].sum()
+        if self.meta["average_output"]:
+            out /= len(self.akar) // K
+        return out
+
+def _tabel_shap(z, v, u):
+    """Kontribusi TreeSHAP satu daun untuk semua 2^u kombinasi bit `o` (fitur unik ke-j
+    diikuti input atau tidak). z: P×u fraksi cover per fitur unik, v: nilai daun (P).
+    ExtendPath lalu UnwoundPathSum seperti di LightGBM, divektorkan atas daun × kombinasi."""
+    P, M = len(v), 1 << u
+    o  = ((np.arange(M)[:, None] >> np.arange(u)) & 1).astype(float)       # M×u
+    z  = np.broadcast_to(z[:, None, :], (P, M, u))
+    o  = np.broadcast_to(o[None], (P, M, u))
+    pw = np.zeros((P, M, u + 1)); pw[..., 0] = 1.0                          # elemen 0: fitur semu (z=o=1)
+    for d in range(1, u + 1):                                               # ExtendPath
+        zd, od = z[..., d - 1], o[..., d - 1]
+        for i in range(d - 1, -1, -1):
+            pw[..., i + 1] += od * pw[..., i] * (i + 1) / (d + 1)
+            pw[..., i]      = zd * pw[..., i] * (d - i) / (d + 1)
+    out = np.zeros((P, M, u))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for j in range(u):                                                  # UnwoundPathSum
+            zj, oj = z[..., j], o[..., j]
+            sisa, total = pw[..., u].copy(), np.zeros((P, M))
+            for i in range(u - 1, -1, -1):
+                tmp   = sisa / ((i + 1) * oj)
+                total += np.where(oj != 0, tmp, pw[..., i] / (zj * (u - i)))
+                sisa  = pw[..., i] - tmp * zj * (u - i)
+            out[..., j] = total * (u + 1) * (oj - zj) * v[:, None]
+    return out
+
+def muat_pohon(model_path, sha1=None):
+    """ModelPohon untuk model_path dari <model>.trees.npz, atau None kalau tidak ada / basi."""
+    try:
+        with np.load(path_pohon(model_path)) as z:
+            arr  = {k: z[k] for k in z.files}
+        meta = json.loads(str(arr.pop("meta")))
+        if meta["sha1"] != (sha1 or sidik_file(model_path)):
+            return None
+        return ModelPohon(arr, meta)
+    except (OSError, ValueError, KeyError):
+        return None
+
+def verify_pohon(pohon, model, n=200_000, seed=0):
+    """Selisih maksimum ModelPohon vs Booster.predict: seluruh grid 5^9 (layout app, kolom
+    lain 0) + `n` baris acak kontinu di semua kolom model, sebagian NaN/0."""
+    pred_lgb = StrategyPredictor(model)
+    dk = 0.0
+    for a in range(0, UKURAN, SKALA ** 8):
+        X = pred_lgb.matriks(baris_grid(a, min(a + SKALA ** 8, UKURAN)))
+        dk = max(dk, float(np.abs(model.booster_.predict(X) - pohon.booster_.predict(X)).max()))
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(-1, 6, size=(n, len(pred_lgb.kolom)))
+    X[rng.random(X.shape) < 0.05] = np.nan
+    X[rng.random(X.shape) < 0.05] = 0.0
+    dk = max(dk, float(np.nanmax(np.abs(model.booster_.predict(X) - pohon.booster_.predict(X)))))
+    return UKURAN + n, dk
+
+# ══════════════════════════════════════════════════════════
+# BROKER MICRO-BATCHING
+# ══════════════════════════════════════════════════════════
+class BrokerInferensi:
+    """Kumpulkan permintaan prediksi dari banyak sesi lalu jalankan sebagai satu batch.
+
+    Thread pengumpul menunggu ada slot pekerja kosong, mengambil permintaan pertama dari
+    antrian, menunggu paling lama `jendela_ms` (atau sampai `maks_batch` baris terkumpul),
+    lalu menjalankan `pred.predict` sekali untuk semua baris di pool berukuran `pekerja`;
+    hasilnya dibagikan lewat Future per pemanggil. Selama semua pekerja sibuk, permintaan
+    baru menumpuk di antrian dan ikut batch berikutnya — jumlah inferensi paralel tidak
+    pernah melebihi `pekerja`, berapa pun sesi yang aktif. `predict(X9)` punya antarmuka
+    yang sama dengan prediktor lain, jadi broker bisa dipakai di mana pun StrategyPredictor
+    dipakai."""
+    def __init__(self, pred, jendela_ms=BATCH_JENDELA_MS, maks_batch=BATCH_MAKS, pekerja=INFER_PEKERJA):
+        self.pred, self.jendela, self.maks_batch = pred, jendela_ms / 1e3, maks_batch
+        self.pekerja = pekerja
+        self._q     = queue.Queue()
+        self._lock  = threading.Lock()
+        self._slot  = threading.BoundedSemaphore(pekerja)
+        self._pool  = ThreadPoolExecutor(pekerja, thread_name_prefix="inferensi")
+        self._thread = None
+        self._tutup  = False
+        self.n_batch = self.n_baris = self.n_req = self.batch_maks = self.antrian_maks = self.sibuk = 0
+        self.t_tunggu = 0.0
+
+    def submit(self, X9):
+        """Masukkan N×9 baris ke antrian; Future berisi (kode, kpct) untuk baris-baris itu."""
+        X9  = np.asarray(X9, dtype=float).reshape(-1, len(FITUR_LGBM))
+        fut = Future()
+        with self._lock:
+            if self._tutup:            # versi model sudah diganti: layani langsung tanpa batching
+                fut.set_result(self.pred.predict(X9)); return fut
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._jalan, name="broker-inferensi", daemon=True)
+                self._thread.start()
+            self._q.put((X9, fut, time.perf_counter()))
+            self.antrian_maks = max(self.antrian_maks, self._q.qsize())
+        return fut
+
+    def predict(self, X9):
+        return self.submit(X9).result()
+
+    def tutup(self):
+        """Hentikan thread pengumpul & pool setelah semua permintaan yang sudah mengantri
+        selesai. Pemanggil yang datang sesudahnya dilayani langsung (tanpa batching)."""
+        with self._lock:
+            self._tutup = True
+            if self._thread is not None: self._q.put(None)
+
+    def _jalan(self):
+        selesai = False
+        while not selesai:
+            self._slot.acquire()
+            item = self._q.get()
+            if item is None: break
+            batch, n = [item], len(item[0])
+            batas = time.perf_counter() + self.jendela
+            while n < self.maks_batch:
+                sisa = batas - time.perf_counter()
+                try:
+                    item = self._q.get(timeout=sisa) if sisa > 0 else self._q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    selesai = True; break
+                batch.append(item); n += len(item[0])
+            with self._lock: self.sibuk += 1
+            self._pool.submit(self._proses, batch, n)
+        self._pool.shutdown(wait=False)
+
+    def _proses(self, batch, n):
+        try:
+            kode, kpct = self.pred.predict(np.concatenate([X for X, _, _ in batch]))
+        except Exception as e:
+            for _, fut, _ in batch: fut.set_exception(e)
+            return
+        finally:
+            with self._lock: self.sibuk -= 1
+            self._slot.release()
+        selesai, a = time.perf_counter(), 0
+        with self._lock:
+            self.n_batch += 1; self.n_baris += n; self.n_req += len(batch)
+            self.batch_maks = max(self.batch_maks, n)
+            self.t_tunggu  += sum(selesai - t for _, _, t in batch)
+        for X, fut, _ in batch:
+            fut.set_result((kode[a:a + len(X)], kpct[a:a + len(X)])); a += len(X)
+
+    def stats(self):
+        with self._lock:
+            return {"antrian": self._q.qsize(), "antrian_maks": self.antrian_maks,
+                    "pekerja_sibuk": self.sibuk,
+                    "request": self.n_req, "batch": self.n_batch,
+                    "baris_per_batch": self.n_baris / self.n_batch if self.n_batch else 0.0,
+                    "batch_maks": self.batch_maks,
+                    "latensi_ms": self.t_tunggu / self.n_req * 1e3 if self.n_req else 0.0}
+
+# ══════════════════════════════════════════════════════════
+# REGISTRI MODEL (hot reload)
+# ══════════════════════════════════════════════════════════
+class VersiModel:
+    """Satu versi model yang dimuat lengkap (model + semua prediktornya). Dibangun utuh
+    sebelum dipasang dan tidak diubah sesudahnya, jadi pemanggil yang memegang referensi
+    versi lama tetap menyelesaikan prediksinya di model lama."""
+    __slots__ = ("path","sha1","mtime","dimuat_pada","durasi_muat","sumber","model","live","lut","penjelas")
+
+    def __init__(self, **kw):
+        for k, v in kw.items(): setattr(self, k, v)
+
+    @property
+    def id(self):   return self.sha1[:12]
+
+    @property
+    def pred(self): return self.lut or self.live
+
+    def info(self):
+        return {"file": os.path.basename(self.path), "versi": self.id, "sumber": self.sumber,
+                "lut": self.lut is not None, "mtime": self.mtime, "dimuat_pada": self.dimuat_pada,
+                "durasi_muat_ms": self.durasi_muat * 1e3}
+
+def muat_versi(path):
+    """Muat satu VersiModel dari file `path`.
+
+    Isi file dibaca sekali: sha1 dihitung dari byte yang sama dengan yang di-unpickle, jadi
+    file yang diganti di tengah pemuatan tidak menghasilkan versi campuran. Jika ada
+    `<model>.sha1` (format sha1sum), hash wajib cocok. trees.npz/LUT hanya dipakai bila
+    sha1-nya sama; prediktor diuji pada sampel grid sebelum versi dianggap siap."""
+    t0 = time.perf_counter()
+    with open(path, "rb") as fp: data = fp.read()
+    sha1 = hashlib.sha1(data).hexdigest()
+    if os.path.exists(path + ".sha1"):
+        with open(path + ".sha1") as fp: harap = (fp.read().split() or [""])[0].lower()
+        if harap != sha1:
+            raise ValueError(f"sha1 {sha1[:12]} tidak cocok dengan {os.path.basename(path)}.sha1 ({harap[:12]})")
+    model, sumber = muat_pohon(path, sha1), "pohon NumPy"
+    if model is None:
+        model, sumber = pickle.loads(data), "pickle"
+    pred = StrategyPredictor(model, num_threads=INFER_THREADS)
+    uji  = baris_indeks(np.linspace(0, UKURAN - 1, 257).astype(np.int64))
+    kode, _ = pred.predict(uji)
+    lut  = muat_lut(path, sha1=sha1)
+    if lut is not None and not np.array_equal(lut.predict(uji)[0], kode):
+        lut = None                                  # LUT tidak konsisten dengan model: abaikan
+    live = BrokerInferensi(pred)
+    if lut is not None: lut.fallback = lambda: live
+    return VersiModel(path=path, sha1=sha1, mtime=os.path.getmtime(path), dimuat_pada=time.time(),
+                      durasi_muat=time.perf_counter() - t0, sumber=sumber, model=model,
+                      live=live, lut=lut, penjelas=StrategyPredictor(model))
+
+class RegistriModel:
+    """Model aktif + hot reload tanpa restart proses.
+
+    Thread pengawas memeriksa file model (MODEL_FILES pertama yang ada) tiap `interval`
+    detik. Perubahan (mtime/ukuran) baru dimuat setelah stabil dua pemeriksaan berturut-
+    turut (penyalinan sudah selesai); pemuatan & verifikasi berjalan di thread pengawas,
+    di luar jalur request. Versi baru dibangun penuh di "buffer belakang" lalu dipasang
+    dengan satu penggantian referensi `aktif`; versi sebelumnya disimpan di `sebelumnya`
+    dan broker-nya ditutup setelah antriannya habis. Gagal muat tidak mengganti versi
+    aktif — pesannya tersimpan di `error`."""
+    def __init__(self, files=MODEL_FILES, interval=RELOAD_INTERVAL_S):
+        self.files, self.interval = list(files), interval
+        self.aktif = self.sebelumnya = None
+        self.n_reload, self.error = 0, None
+        self._lock = threading.Lock()
+        self._stat = self._calon = None
+        self.periksa()
+        if interval > 0:
+            threading.Thread(target=self._awasi, name="registri-model", daemon=True).start()
+
+    def _cari(self):
+        for f in self.files:
+            try:
+                st = os.stat(f)
+            except OSError:
+                continue
+            return f, st.st_mtime_ns, st.st_size
+        return None
+
+    def _awasi(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.periksa()
+            except Exception as e:        # thread pengawas tidak boleh mati
+                self.error = f"pengawas: {e}"
+
+    def periksa(self, paksa=False):
+        """Muat & pasang versi baru bila file model berubah. Kembalikan True jika versi berganti."""
+        with self._lock:
+            stat = self._cari()
+            if stat is None or stat == self._stat:
+                return False
+            if self.aktif is not None and not paksa and stat != self._calon:
+                self._calon = stat            # tunggu satu pemeriksaan lagi: file harus stabil
+                return False
+            self._stat = self._calon = stat
+            try:
+                baru = muat_versi(stat[0])
+            except Exception as e:
+                self.error = f"{stat[0]}: {type(e).__name__}: {e}"
+                return False
+            self.error = None
+            if self.aktif is not None and baru.sha1 == self.aktif.sha1:
+                baru.live.tutup()             # hanya mtime yang berubah, isi sama
+                return False
+            lama, self.aktif = self.aktif, baru
+            if lama is not None:
+                self.n_reload += 1
+                self.sebelumnya = lama
+        if lama is not None:
+            lama.live.tutup()
+        return True
+
+    def info(self):
+        d = self.aktif.info() if self.aktif else {"file": None, "versi": None}
+        return {**d, "reload": self.n_reload, "error": self.error,
+                "versi_sebelumnya": self.sebelumnya.id if self.sebelumnya else None}
+
+def _muat_model(path):
+    with open(path, "rb") as fp:
+        return pickle.load(fp)
+
+def main(argv):
+    if not argv or argv[0] not in ("build", "verify"):
+        print(__doc__); return 2
+    ap = argparse.ArgumentParser(prog="model_strategi.py")
+    ap.add_argument("cmd", choices=("build", "verify"))
+    ap.add_argument("model", nargs="?")
+    ap.add_argument("--sampel", type=int)
+    args = ap.parse_args(argv)
+    path = args.model or next((f for f in MODEL_FILES if os.path.exists(f)), None)
+    if path is None:
+        print("file model tidak ditemukan"); return 1
+    model = _muat_model(path)
+    pred  = StrategyPredictor(model)
+    if args.cmd == "build":
+        meta = build_lut(pred, path)
+        print(f"LUT {meta['ukuran']} entri untuk {meta['model']} (sha1 {meta['sha1'][:12]}) → {path_lut(path)[0]}")
+        ekspor_pohon(model, path)
+        print(f"pohon {len(model.booster_.dump_model()['tree_info'])} → {path_pohon(path)}")
+        if args.sampel is None: args.sampel = 200000
+    pohon = muat_pohon(path)
+    if pohon is None:
+        print("trees.npz tidak ada atau tidak cocok dengan file model — jalankan `build`"); return 1
+    n, dk_pohon = verify_pohon(pohon, model)
+    print(f"pohon NumPy: {n} input dicek, selisih maks vs Booster.predict {dk_pohon:.3g}")
+    lut = muat_lut(path)
+    if lut is None:
+        print("LUT tidak ada atau tidak cocok dengan file model — jalankan `build`"); return 1
+    n, beda, dk = verify_lut(lut, pred, args.sampel)
+    print(f"verify: {n} input dicek, {beda} kode berbeda, selisih kpct maks {dk:.3f} poin")
+    return 0 if beda == 0 and dk_pohon <= 1e-9 else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
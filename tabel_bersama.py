@@ -0,0 +1,123 @@
+"""
+Tabel kolom read-only yang dipakai bersama beberapa proses server Streamlit.
+
+Di deployment multi-proses (beberapa `streamlit run server.py` di balik load balancer)
+tiap proses biasanya memegang salinan sendiri katalog prodi, bobot, dan tabel xlsx.
+Dengan env DATA_BERSAMA=<direktori> (disarankan di /dev/shm — tmpfs, jadi file di sana
+= shared memory) tabel kolom NumPy ditulis sekali ke satu file per versi data, lalu
+setiap proses me-mmap file itu read-only dan membungkusnya dengan np.frombuffer:
+tanpa salinan, halaman fisiknya dipakai bersama semua proses.
+
+Format file (.tbl):
+
+    b"SKTB" | uint32 panjang header | header JSON | data kolom
+
+header = {"meta": {...}, "kolom": {nama: [dtype, shape, offset]}}; offset tiap kolom
+kelipatan 64 byte. Hanya dtype numerik & string NumPy (tanpa object).
+
+File ditulis ke .tmp lalu os.replace, jadi pembaca tidak pernah melihat file setengah
+jadi, dan file lama yang masih di-mmap proses lain tetap valid sampai dilepas.
+Versi yang sedang aktif bisa ditunjuk lewat file penunjuk kecil (`tulis_penunjuk`).
+Satu proses dipilih sebagai loader lewat flock (`Loader`): hanya dia yang membangun /
+mengunduh data; bila prosesnya mati, lock lepas dan proses lain mengambil alih.
+"""
+import json, mmap, os, struct
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:          # Windows: tanpa pemilihan loader, tiap proses memuat sendiri (RefresherData)
+    fcntl = None
+
+DIR_BERSAMA = os.environ.get("DATA_BERSAMA") or None
+MAGIC       = b"SKTB"
+_RATA       = 64
+
+def tulis(path, kolom, meta=None):
+    """Tulis dict {nama: array} (+ meta JSON) ke `path` secara atomik."""
+    kolom = {k: np.ascontiguousarray(v) for k, v in kolom.items()}
+    for k, v in kolom.items():
+        if v.dtype.hasobject:
+            raise TypeError(f"kolom {k!r}: dtype object tidak bisa dibagi")
+    # Offset dihitung relatif terhadap awal data; header dipad ke kelipatan _RATA
+    tata, pos = {}, 0
+    for k, v in kolom.items():
+        tata[k] = [v.dtype.str, list(v.shape), pos]
+        pos += -(-v.nbytes // _RATA) * _RATA
+    header = json.dumps({"meta": meta or {}, "kolom": tata}).encode()
+    awal = -(-(len(MAGIC) + 4 + len(header)) // _RATA) * _RATA
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fp:
+        fp.write(MAGIC + struct.pack("<I", len(header)) + header)
+        for k, v in kolom.items():
+            fp.seek(awal + tata[k][2]); fp.write(v.tobytes())
+        fp.truncate(awal + pos)
+    os.replace(tmp, path)
+
+def buka(path):
+    """(dict kolom, meta) dari file .tbl; array = view read-only langsung di atas mmap."""
+    with open(path, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            raise ValueError(f"{path}: file kosong")
+        mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path}: bukan file tabel bersama")
+    n = struct.unpack_from("<I", mm, len(MAGIC))[0]
+    header = json.loads(mm[len(MAGIC) + 4:len(MAGIC) + 4 + n])
+    awal = -(-(len(MAGIC) + 4 + n) // _RATA) * _RATA
+    kolom = {}
+    for k, (dtype, shape, off) in header["kolom"].items():
+        dt, count = np.dtype(dtype), int(np.prod(shape))
+        if count == 0:
+            kolom[k] = np.empty(shape, dtype=dt); continue
+        kolom[k] = np.frombuffer(mm, dtype=dt, count=count, offset=awal + off).reshape(shape)
+    return kolom, header["meta"]
+
+def tulis_penunjuk(direktori, nama, target):
+    """File penunjuk `<nama>.aktif` berisi nama file versi aktif (diganti atomik)."""
+    path = os.path.join(direktori, nama + ".aktif")
+    with open(path + ".tmp", "w") as fp: fp.write(os.path.basename(target))
+    os.replace(path + ".tmp", path)
+
+def baca_penunjuk(direktori, nama):
+    """Path file versi aktif menurut penunjuk `<nama>.aktif`, atau None."""
+    try:
+        with open(os.path.join(direktori, nama + ".aktif")) as fp:
+            return os.path.join(direktori, fp.read().strip())
+    except OSError:
+        return None
+
+def bersihkan(direktori, awalan, kecuali):
+    """Hapus versi lama `<awalan>*.tbl`; mmap yang masih terbuka di proses lain tetap valid."""
+    for f in os.listdir(direktori):
+        p = os.path.join(direktori, f)
+        if f.startswith(awalan) and f.endswith(".tbl") and p != kecuali:
+            try: os.remove(p)
+            except OSError: pass
+
+class Loader:
+    """Pemilihan satu proses loader per direktori lewat flock non-blocking pada
+    `loader.lock`. `coba()` mengambil lock bila kosong; lock dipegang selama proses
+    hidup dan dilepas kernel saat proses mati."""
+    def __init__(self, direktori):
+        self.direktori, self._fd = direktori, None
+
+    def coba(self):
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            return False
+        os.makedirs(self.direktori, exist_ok=True)
+        fd = os.open(os.path.join(self.direktori, "loader.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0); os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    @property
+    def aktif(self):
+        return self._fd is not None